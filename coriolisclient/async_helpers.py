@@ -0,0 +1,116 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for using the Coriolis client from asyncio code.
+
+`wrap_client` exposes the managers of a `coriolisclient.client.Client` with
+every public manager method turned into a coroutine, so that they can be
+awaited without blocking the event loop.
+
+NOTE: this is not an asynchronous HTTP transport. The managers are built on
+the blocking keystoneauth `Adapter`, so every call still runs in a thread of
+the given executor (the event loop's default one if None) for as long as
+its request takes, and the number of in-flight calls is bounded by the size
+of that executor. Its requests share the keystone session of the client,
+which keeps up to 10 connections per host by default.
+
+NOTE: resources returned by the wrapped managers are the regular ones, so
+accessing attributes which are not loaded yet will trigger a blocking
+lazy-load; request the detailed variants of listings where needed.
+"""
+
+import asyncio
+import functools
+import logging
+import types
+
+from coriolisclient import base
+
+
+LOG = logging.getLogger(__name__)
+
+
+class _AsyncIterator(object):
+    """Iterates over a blocking iterator without blocking the event loop."""
+
+    def __init__(self, iterator, executor):
+        self._iterator = iterator
+        self._executor = executor
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        sentinel = object()
+        item = await loop.run_in_executor(
+            self._executor, next, self._iterator, sentinel)
+        if item is sentinel:
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        close = getattr(self._iterator, 'close', None)
+        if close is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, close)
+
+
+class _AsyncManager(object):
+    """Exposes the public methods of a manager as coroutines.
+
+    Methods returning generators (e.g. `iter_all()`) return asynchronous
+    iterators instead.
+    """
+
+    def __init__(self, manager, executor):
+        self._manager = manager
+        self._executor = executor
+
+    def __getattr__(self, name):
+        attr = getattr(self._manager, name)
+        method = getattr(type(self._manager), name, None)
+        if (name.startswith('_') or not callable(method) or
+                isinstance(method, type)):
+            return attr
+
+        @functools.wraps(attr)
+        async def _method(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(attr, *args, **kwargs))
+            if isinstance(result, types.GeneratorType):
+                return _AsyncIterator(result, self._executor)
+            return result
+
+        return _method
+
+
+def wrap_client(client, executor=None):
+    """Returns a namespace holding the managers of the given client, with
+    their public methods turned into coroutines.
+
+    Methods returning generators (e.g. `iter_all()`) return asynchronous
+    iterators instead.
+
+    :param client: `coriolisclient.client.Client` whose managers to wrap
+    :param executor: `concurrent.futures.Executor` to run the blocking
+        calls in, or None for the default executor of the running loop
+    """
+    managers = {
+        name: _AsyncManager(manager, executor)
+        for (name, manager) in vars(client).items()
+        if isinstance(manager, base.BaseManager)}
+    return types.SimpleNamespace(**managers)
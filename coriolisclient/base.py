@@ -17,8 +17,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import codecs
+import collections
+from concurrent import futures
 import copy
+import json as jsonutils
 import logging
+import os
 import traceback
 
 import six
@@ -26,12 +31,32 @@ from six.moves.urllib import parse as urlparse
 
 from keystoneauth1 import exceptions as keystoneauth_exceptions
 from oslo_utils import strutils
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
+from coriolisclient import cache
 from coriolisclient import exceptions
 
 
 LOG = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 100
+# NOTE: matches the default connection pool size of the requests session
+# underlying keystoneauth sessions:
+DEFAULT_MAX_WORKERS = 10
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# NOTE: policies for implicitly loading the details of resources when
+# accessing attributes missing from them, see `Resource._lazy_load`:
+LAZY_LOAD_ALLOW = "allow"
+LAZY_LOAD_WARN = "warn"
+LAZY_LOAD_FORBID = "forbid"
+LAZY_LOAD_BATCH = "batch"
+LAZY_LOAD_POLICIES = (
+    LAZY_LOAD_ALLOW, LAZY_LOAD_WARN, LAZY_LOAD_FORBID, LAZY_LOAD_BATCH)
+
 
 def getid(obj, possible_fields=["uuid", "id"]):
     """Return id if argument is a Resource.
@@ -47,6 +72,10 @@ def getid(obj, possible_fields=["uuid", "id"]):
     return obj
 
 
+GetManyResult = collections.namedtuple(
+    "GetManyResult", ["id", "result", "error"])
+
+
 def wrap_unauthorized_exception(func):
     def wrapper(*args, **kwargs):
         try:
@@ -61,30 +90,266 @@ def wrap_unauthorized_exception(func):
     return wrapper
 
 
+class _JSONItemStream(object):
+    """Incrementally parses the items of a JSON list from a chunked body.
+
+    Only the list found under `response_key` is parsed item by item, so that
+    at most one item (plus the current read chunk) is held in memory at any
+    given time. Any other top-level keys are decoded and discarded.
+    """
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, chunks, response_key=None, values_key='values'):
+        self._chunks = iter(chunks)
+        self._decoder = jsonutils.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._response_key = response_key
+        self._values_key = values_key
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size=0):
+        """Reads at least one more chunk, and more until at least `min_size`
+        characters are buffered, returning False if there were none left.
+        """
+        parts = [self._buf[self._pos:]]
+        size = len(parts[0])
+        filled = False
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            if isinstance(chunk, bytes):
+                chunk = self._utf8.decode(chunk)
+            parts.append(chunk)
+            size += len(chunk)
+            filled = True
+            if size >= min_size:
+                break
+        else:
+            self._eof = True
+
+        if filled:
+            self._buf = "".join(parts)
+            self._pos = 0
+        return filled
+
+    def _peek(self):
+        while True:
+            while (self._pos < len(self._buf) and
+                    self._buf[self._pos] in self._WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char):
+        found = self._peek()
+        if found != char:
+            raise ValueError(
+                "Malformed JSON body: expected '%s' at offset %d, found %r" % (
+                    char, self._pos, found))
+        self._pos += 1
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # NOTE: only retry once the buffered data has doubled, so
+                # that decoding an item spanning many chunks stays linear:
+                if self._eof or not self._fill(
+                        2 * (len(self._buf) - self._pos)):
+                    raise
+                continue
+            # NOTE: a number ending exactly at the end of the buffer may
+            # continue in the next chunk:
+            if (end == len(self._buf) and not self._eof and
+                    isinstance(value, (int, float)) and
+                    not isinstance(value, bool)):
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _seek_response_key(self):
+        self._expect("{")
+        while self._peek() != "}":
+            key = self._decode_value()
+            self._expect(":")
+            if key == self._response_key:
+                return
+            self._decode_value()
+            if self._peek() == ",":
+                self._pos += 1
+        raise KeyError(self._response_key)
+
+    def __iter__(self):
+        if self._response_key is not None:
+            self._seek_response_key()
+
+        if self._peek() != "[":
+            data = self._decode_value()
+            # NOTE(ja): keystone returns values as list as {'values': [ ... ]}
+            #           unlike other services which just return the list...
+            try:
+                data = data[self._values_key]
+            except (KeyError, TypeError):
+                pass
+            for item in data:
+                yield item
+            return
+
+        self._expect("[")
+        if self._peek() == "]":
+            return
+        while True:
+            yield self._decode_value()
+            if self._peek() != ",":
+                break
+            self._pos += 1
+        self._expect("]")
+
+
+class _CopyOnWriteDict(dict):
+    """Shallow copy of a resource's info which copies nested values lazily.
+
+    Mutable nested values are shared with the source until first accessed
+    through this dict, at which point they are deep-copied, so that changes
+    to the returned dict never propagate back into the resource.
+    """
+
+    def __init__(self, source):
+        super(_CopyOnWriteDict, self).__init__(source)
+        self._shared = set(
+            k for (k, v) in six.iteritems(source)
+            if isinstance(v, (dict, list, set)))
+
+    def _own(self, key):
+        if key in self._shared:
+            self._shared.discard(key)
+            dict.__setitem__(
+                self, key, copy.deepcopy(dict.__getitem__(self, key)))
+
+    def _own_all(self):
+        for key in list(self._shared):
+            self._own(key)
+
+    def __iter__(self):
+        # NOTE: overriding this makes C-level merges (e.g. `dict(d)`,
+        # `{**d}` and `dict.update(d)`) go through `keys()` and
+        # `__getitem__` instead of reading the underlying dict directly:
+        return super(_CopyOnWriteDict, self).__iter__()
+
+    def __getitem__(self, key):
+        self._own(key)
+        return super(_CopyOnWriteDict, self).__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._shared.discard(key)
+        super(_CopyOnWriteDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._shared.discard(key)
+        super(_CopyOnWriteDict, self).__delitem__(key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        self._own(key)
+        return super(_CopyOnWriteDict, self).pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        self._own(key)
+        return super(_CopyOnWriteDict, self).setdefault(key, default)
+
+    def popitem(self):
+        self._own_all()
+        return super(_CopyOnWriteDict, self).popitem()
+
+    def values(self):
+        self._own_all()
+        return super(_CopyOnWriteDict, self).values()
+
+    def items(self):
+        self._own_all()
+        return super(_CopyOnWriteDict, self).items()
+
+    def copy(self):
+        self._own_all()
+        return dict(self)
+
+    def __reduce__(self):
+        # NOTE: pickled as a plain dict, as unpickling would otherwise set
+        # the items before the instance state they rely on:
+        return (dict, (self.copy(),))
+
+
+def _represent_copy_on_write_dict(dumper, data):
+    return dumper.represent_dict(data.copy())
+
+
+if yaml is not None:
+    # NOTE: YAML dumpers only represent the exact types they know of, but
+    # `to_dict()` results are expected to dump like plain dicts:
+    yaml.SafeDumper.add_representer(
+        _CopyOnWriteDict, _represent_copy_on_write_dict)
+    yaml.Dumper.add_representer(
+        _CopyOnWriteDict, _represent_copy_on_write_dict)
+
+
 class Resource(object):
     """Base class for OpenStack resources (tenant, user, etc.).
 
     This is pretty much just a bag for attributes.
+
+    Compact resources do not copy their info onto the instance and instead
+    resolve attributes from it on demand, which saves both construction time
+    and memory when dealing with large listings.
     """
 
+    # NOTE: '__dict__' is kept for non-compact resources, but is only
+    # allocated on the first attribute assignment outside these slots:
+    __slots__ = ('manager', '_info', '_loaded', '_compact',
+                 '_lazy_load_batch', '__dict__', '__weakref__')
+
     HUMAN_ID = False
     NAME_ATTR = 'name'
+    # NOTE: whether the resource can be loaded with its manager's
+    # `get_many`, which passes it nothing but the resource's ID:
+    BATCH_LOADABLE = True
 
-    def __init__(self, manager, info, loaded=False):
+    def __init__(self, manager, info, loaded=False, compact=False):
         """Populate and bind to a manager.
 
         :param manager: BaseManager object
         :param info: dictionary representing resource attributes
         :param loaded: prevent lazy-loading if set to True
+        :param compact: resolve attributes from `info` on demand instead of
+            setting them on the instance
         """
         self.manager = manager
         self._info = info
-        self._add_details(info)
+        self._compact = compact
+        if not compact:
+            self._add_details(info)
         self._loaded = loaded
 
     def __repr__(self):
+        # NOTE: reading `self.__dict__` would allocate it for compact
+        # resources, which keep all of their attributes in the info:
+        if self._compact:
+            keys = set(self._info.keys())
+        else:
+            keys = set(self.__dict__.keys())
         reprkeys = sorted(k
-                          for k in self.__dict__.keys()
+                          for k in keys
                           if k[0] != '_' and k != 'manager')
         info = ", ".join("%s=%s" % (k, getattr(self, k)) for k in reprkeys)
         return "<%s %s>" % (self.__class__.__name__, info)
@@ -99,25 +364,79 @@ class Resource(object):
         return None
 
     def _add_details(self, info):
+        if self._compact:
+            self._info.update(info)
+            return
+
         for (k, v) in six.iteritems(info):
             try:
                 setattr(self, k, v)
                 self._info[k] = v
             except AttributeError:
                 # In this case we already defined the attribute on the class
-                pass
+                if not hasattr(Resource, k):
+                    # NOTE: read-only properties of subclasses (e.g.
+                    # `Transfer.executions`) are backed by the info:
+                    self._info[k] = v
 
     def __getattr__(self, k):
-        if k not in self.__dict__:
-            # NOTE(bcwaldon): disallow lazy-loading if already loaded once
-            if not self.is_loaded():
-                self.get()
-                return self.__getattr__(k)
-
+        if k in Resource.__slots__:
+            # NOTE: unset slot, avoid recursing on it below:
             raise AttributeError(k)
-        else:
+
+        prop = getattr(type(self), k, None)
+        if isinstance(prop, property):
+            # NOTE: the property itself raised an `AttributeError` (e.g.
+            # `exceptions.LazyLoadForbidden`), which would otherwise be
+            # masked by the lookup below, so let it propagate:
+            return prop.fget(self)
+
+        if self._compact:
+            # NOTE: not checking `self.__dict__`, as reading it would
+            # allocate it:
+            if k in self._info:
+                return self._info[k]
+        elif k in self.__dict__:
             return self.__dict__[k]
 
+        # NOTE(bcwaldon): disallow lazy-loading if already loaded once
+        if not self.is_loaded():
+            self._lazy_load(k)
+            return self.__getattr__(k)
+
+        raise AttributeError(k)
+
+    def _lazy_load(self, attr):
+        """Implicitly loads the details of the resource on the access of
+        the missing `attr`, as allowed by the manager's lazy-load policy.
+
+        Every implicit load is counted per resource type in the manager's
+        `lazy_loads`. With the batch policy, all the resources of the
+        listing this one came from are loaded along with it.
+        """
+        if not isinstance(self.manager, BaseManager):
+            self.get()
+            return
+
+        policy = self.manager.lazy_load_policy
+        resource_type = self.__class__.__name__
+        if policy == LAZY_LOAD_FORBID:
+            raise exceptions.LazyLoadForbidden(
+                resource_type, self._info.get('id'), attr)
+        if policy == LAZY_LOAD_WARN:
+            LOG.warning(
+                "Implicitly loading %s '%s' on the access of '%s'",
+                resource_type, self._info.get('id'), attr)
+
+        batch = getattr(self, '_lazy_load_batch', None)
+        if batch is not None and policy == LAZY_LOAD_BATCH:
+            loaded = batch.load(self)
+        else:
+            self.get()
+            loaded = 1
+
+        self.manager.lazy_loads[resource_type] += loaded
+
     def get(self):
         """Support for lazy loading details.
 
@@ -148,15 +467,60 @@ class Resource(object):
         self._loaded = val
 
     def to_dict(self):
+        if self._compact:
+            return _CopyOnWriteDict(self._info)
         return copy.deepcopy(self._info)
 
 
+class _LazyLoadBatch(object):
+    """Resources of a single listing which are implicitly loaded together,
+    see `LAZY_LOAD_BATCH`.
+    """
+
+    def __init__(self, manager, resources):
+        self.manager = manager
+        self.resources = [
+            res for res in resources if res.BATCH_LOADABLE]
+        for res in self.resources:
+            res._lazy_load_batch = self
+
+    def load(self, resource):
+        """Concurrently loads the given resource along with all the ones of
+        the batch which were not loaded yet, returning the number of loaded
+        resources.
+        """
+        resources = [resource] + [
+            res for res in self.resources if res is not resource]
+        self.resources = []
+        for res in resources:
+            res._lazy_load_batch = None
+        resource.set_loaded(True)
+
+        results = self.manager.get_many([getid(res) for res in resources])
+        for (res, result) in zip(resources, results):
+            # NOTE: the others failing to load will be loaded on their own
+            # on their next implicit load:
+            if result.error is None:
+                res.set_loaded(True)
+                res._add_details(result.result._info)
+        if results[0].error is not None:
+            raise results[0].error
+        return len(resources)
+
+
 class BaseManager(object):
     """Basic manager type providing common operations.
     Managers interact with a particular type of API (servers, flavors, images,
     etc.) and provide CRUD operations for them.
     """
     resource_class = None
+    # NOTE: whether to build compact resources, see `Resource`:
+    compact_resources = False
+    # NOTE: directory in which managers may persist cached API data between
+    # client instances, see `coriolisclient.cache.FileCache`:
+    cache_dir = None
+    # NOTE: one of `LAZY_LOAD_POLICIES`, see `Resource._lazy_load`:
+    lazy_load_policy = LAZY_LOAD_ALLOW
 
     def __init__(self, client):
         """Initializes BaseManager with `client`.
@@ -164,10 +528,48 @@ class BaseManager(object):
         """
         super(BaseManager, self).__init__()
         self.client = client
+        # NOTE: number of implicit loads of resources, per resource type:
+        self.lazy_loads = collections.Counter()
+
+    def _get_cache_scope(self):
+        """Returns a key identifying the API endpoint and project which
+        cached data belongs to, or None if they cannot be determined.
+        """
+        try:
+            return cache.make_key(
+                self.client.get_endpoint(), self.client.get_project_id())
+        except Exception as ex:
+            LOG.debug("Unable to determine the cache scope: %s", ex)
+            return None
+
+    def _get_file_cache(self, name, ttl=cache.DEFAULT_CACHE_TTL):
+        """Returns the on-disk cache with the given name, if enabled."""
+        if not self.cache_dir:
+            return None
+        return cache.FileCache(
+            os.path.join(self.cache_dir, "%s.json" % name), ttl=ttl)
+
+    def _make_resource(self, obj_class, info, loaded=False):
+        if self.compact_resources:
+            return obj_class(self, info, loaded=loaded, compact=True)
+        return obj_class(self, info, loaded=loaded)
+
+    @staticmethod
+    def _get_fields_query(fields):
+        """Returns the query parameters requesting only the given fields of
+        the returned objects, always including their ID.
+        """
+        if not fields:
+            return []
+        fields = list(fields)
+        if "id" not in fields:
+            fields.insert(0, "id")
+        return [("fields", field) for field in fields]
 
     @wrap_unauthorized_exception
     def _list(self, url, response_key=None, obj_class=None, json=None,
-              values_key='values', query: dict | list | None = None):
+              values_key='values', query: dict | list | None = None,
+              stream=False, fields=None):
         """List the collection.
         :param url: a partial URL, e.g., '/servers'
         :param response_key: the key to be looked up in response dictionary,
@@ -179,11 +581,31 @@ class BaseManager(object):
             request (GET will be sent by default)
         :param query: an optional dict or list of (key, value) tuples
             containing query filters
+        :param stream: if True, parse the response body incrementally and
+            return a generator yielding objects as they are parsed, instead
+            of a list
+        :param fields: optional list of the fields to request for each
+            object, leaving the others out of the response. Objects listed
+            this way are not lazy-loaded, so the fields left out are
+            simply missing from them.
         """
 
+        if fields:
+            if isinstance(query, dict):
+                query = list(query.items())
+            query = list(query or []) + self._get_fields_query(fields)
         if query:
             url += "?" + urlparse.urlencode(query)
 
+        if stream:
+            if json:
+                resp = self.client.post(url, json=json, stream=True)
+            else:
+                resp = self.client.get(url, stream=True)
+            return self._iter_streamed_list(
+                resp, response_key, obj_class or self.resource_class,
+                values_key)
+
         if json:
             body = self.client.post(url, json=json).json()
         else:
@@ -200,19 +622,101 @@ class BaseManager(object):
         except (KeyError, TypeError):
             pass
 
-        return [obj_class(self, res, loaded=True) for res in data if res]
+        resources = [self._make_resource(obj_class, res, loaded=True)
+                     for res in data if res]
+        if self.lazy_load_policy == LAZY_LOAD_BATCH:
+            _LazyLoadBatch(self, resources)
+        return resources
+
+    def _iter_streamed_list(self, resp, response_key, obj_class, values_key):
+        try:
+            items = _JSONItemStream(
+                resp.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                response_key=response_key, values_key=values_key)
+            for res in items:
+                if res:
+                    yield self._make_resource(obj_class, res, loaded=True)
+        finally:
+            resp.close()
+
+    def _paginate(self, list_method, page_size=DEFAULT_PAGE_SIZE, **kwargs):
+        """Lazily iterate over all the pages of a marker-paginated listing.
+        :param list_method: the manager's listing method, which must accept
+            the 'marker' and 'limit' keyword arguments
+        :param page_size: the number of items requested for each page
+        :param kwargs: any other arguments to pass to 'list_method'
+
+        The next page is fetched on a background thread while the current
+        one is being consumed. Closing the generator (e.g. breaking out of
+        the loop) stops any further page requests.
+        """
+        if page_size < 1:
+            raise ValueError(
+                "Page size must be a positive integer, got: %s" % page_size)
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        next_page = executor.submit(
+            list_method, marker=None, limit=page_size, **kwargs)
+        try:
+            while next_page is not None:
+                page = next_page.result()
+                next_page = None
+                # NOTE: a short page means there is nothing left to fetch:
+                if page and len(page) >= page_size:
+                    next_page = executor.submit(
+                        list_method, marker=getid(page[-1], ["id"]),
+                        limit=page_size, **kwargs)
+                for obj in page:
+                    yield obj
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
+
+    def get_many(self, ids, max_workers=DEFAULT_MAX_WORKERS):
+        """Concurrently gets the objects with the given IDs.
+        :param ids: list of IDs (or objects) to pass to the manager's 'get'
+        :param max_workers: maximum number of concurrent requests
+        :returns: list of GetManyResult tuples in the same order as `ids`,
+            each holding either the fetched object or the error raised
+            while fetching it
+        """
+        get = getattr(self, 'get', None)
+        if get is None:
+            raise NotImplementedError(
+                "%s does not support getting objects" % (
+                    self.__class__.__name__))
+
+        ids = list(ids)
+        if not ids:
+            return []
+
+        def _get_one(obj_id):
+            try:
+                return GetManyResult(obj_id, get(obj_id), None)
+            except Exception as ex:
+                LOG.debug("Failed to get '%s': %s", obj_id, ex)
+                return GetManyResult(obj_id, None, ex)
+
+        with futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(ids))) as executor:
+            return list(executor.map(_get_one, ids))
 
     @wrap_unauthorized_exception
-    def _get(self, url, response_key=None):
+    def _get(self, url, response_key=None, fields=None):
         """Get an object from collection.
         :param url: a partial URL, e.g., '/servers'
         :param response_key: the key to be looked up in response dictionary,
             e.g., 'server'. If response_key is None - all response body
             will be used.
+        :param fields: optional list of the fields to request, see `_list`
         """
+        if fields:
+            url += "&" if "?" in url else "?"
+            url += urlparse.urlencode(self._get_fields_query(fields))
         body = self.client.get(url).json()
         data = body[response_key] if response_key is not None else body
-        return self.resource_class(self, data, loaded=True)
+        return self._make_resource(self.resource_class, data, loaded=True)
 
     @wrap_unauthorized_exception
     def _post(self, url, json, response_key=None, return_raw=False):
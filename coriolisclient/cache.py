@@ -0,0 +1,163 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side caches for rarely changing API data."""
+
+import collections
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = 300
+
+
+def make_key(*parts):
+    """Builds a cache key out of the given parts."""
+    return ":".join(str(part) for part in parts)
+
+
+class TTLCache(object):
+    """Thread-safe in-memory cache.
+
+    Entries expire `ttl` seconds after being set (never if `ttl` is None)
+    and, if `maxsize` is given, the least recently used entries are evicted
+    to stay within it.
+    """
+
+    def __init__(self, ttl=DEFAULT_CACHE_TTL, maxsize=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            (expires_at, value) = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """Removes the given entry, or all of them if no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        """Removes all entries whose key matches the given predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileCache(object):
+    """Cache persisted as a JSON file, shared by separate processes.
+
+    Values must be JSON-serializable. The file is replaced atomically on
+    every write, and read or write failures are only logged, so that a
+    broken cache never prevents requests from being made.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as fd:
+                entries = json.load(fd)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as ex:
+            LOG.debug("Ignoring unreadable cache file '%s': %s",
+                      self.path, ex)
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+
+        now = time.time()
+        return {
+            key: entry for (key, entry) in entries.items()
+            if isinstance(entry, dict) and (
+                entry.get("expires_at") is None or
+                entry["expires_at"] > now)}
+
+    def _save(self, entries):
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            (fd, tmp_path) = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Failed to write cache file '%s': %s", self.path, ex)
+
+    def get(self, key, default=None):
+        entry = self._load().get(key)
+        if entry is None:
+            return default
+        return entry.get("value", default)
+
+    def set(self, key, value):
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        entries = self._load()
+        entries[key] = {"expires_at": expires_at, "value": value}
+        self._save(entries)
+
+    def invalidate(self, key=None):
+        """Removes the given entry, or all of them if no key is given."""
+        if key is None:
+            if not os.path.exists(self.path):
+                return
+            entries = {}
+        else:
+            entries = self._load()
+            if entries.pop(key, None) is None:
+                return
+        self._save(entries)
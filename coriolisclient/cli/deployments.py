@@ -36,6 +36,8 @@ class DeploymentFormatter(formatter.EntityFormatter):
                "Notes",
                "Created",
                )
+    fields = ("id", "transfer_id", "last_execution_status", "instances",
+              "notes", "created_at")
 
     def _get_sorted_list(self, obj_list):
         return sorted(obj_list, key=lambda o: o.created_at)
@@ -53,7 +55,16 @@ class DeploymentFormatter(formatter.EntityFormatter):
 
 class DeploymentDetailFormatter(formatter.EntityFormatter):
 
-    def __init__(self, show_instances_data=False):
+    def __init__(self, show_instances_data=False, since=None, marks=None):
+        """
+        :param since: only render the progress updates after this index or
+            timestamp
+        :param marks: dict in which to keep the newest progress update
+            rendered for each task, so that only newer or updated ones are
+            rendered when formatting the deployment again
+        """
+        self.progress_updates_since = since
+        self.progress_updates_marks = marks
         self.columns = [
             "id",
             "status",
@@ -90,8 +101,7 @@ class DeploymentDetailFormatter(formatter.EntityFormatter):
     def _format_progress_updates(self, task_dict):
         return ("%(ls)s" % {"ls": os.linesep}).join(
             [self._format_progress_update(p) for p in
-             sorted(task_dict.get("progress_updates", []),
-                    key=lambda p: (p.get('index', 0), p["created_at"]))])
+             self._get_progress_updates(task_dict)])
 
     def _format_task(self, task):
         d = task.to_dict()
@@ -251,12 +261,15 @@ class ShowDeployment(show.ShowOne):
                             help='Includes the instances data used for tasks '
                             'execution, this is useful for troubleshooting',
                             default=False)
+        cli_utils.add_progress_updates_since_arg_to_parser(parser)
         return parser
 
     def take_action(self, args):
         deployment = self.app.client_manager.coriolis.deployments.get(args.id)
         return DeploymentDetailFormatter(
-            args.show_instances_data).get_formatted_entity(deployment)
+            args.show_instances_data,
+            since=formatter.parse_progress_updates_since(args.since)
+        ).get_formatted_entity(deployment)
 
 
 class CancelDeployment(command.Command):
@@ -320,5 +333,6 @@ class ListDeployment(lister.Lister):
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
             filters=filters,
+            fields=DeploymentFormatter.fields,
         )
         return DeploymentFormatter().list_objects(obj_list)
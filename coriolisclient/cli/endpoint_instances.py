@@ -22,6 +22,7 @@ import json
 from cliff import lister
 from cliff import show
 
+from coriolisclient import base
 from coriolisclient.cli import formatter
 from coriolisclient.cli import utils as cli_utils
 
@@ -89,6 +90,28 @@ class InstancesDetailFormatter(formatter.EntityFormatter):
         return data
 
 
+class InventoryDiffFormatter(formatter.EntityFormatter):
+
+    columns = ("Change",
+               "ID",
+               "Name",
+               )
+
+    def _get_formatted_data(self, obj):
+        (change, info) = obj
+        return (change,
+                info.get("id"),
+                info.get("instance_name", info.get("name")),
+                )
+
+
+def _add_snapshot_file_arg_to_parser(parser):
+    parser.add_argument(
+        '--snapshot-file',
+        help='SQLite file holding the local inventory snapshots. Defaults '
+             'to one in the cache directory.')
+
+
 class ListEndpointInstance(lister.Lister):
     """List endpoint instances"""
 
@@ -108,6 +131,14 @@ class ListEndpointInstance(lister.Lister):
             action='store_true',
             default=False,
             help='Force refresh of cached instance data')
+        parser.add_argument(
+            '--from-snapshot',
+            action='store_true',
+            default=False,
+            help='List the instances from the local inventory snapshot '
+                 'saved by "endpoint instance sync" instead of querying the '
+                 'endpoint. Only exact matches of --name are returned.')
+        _add_snapshot_file_arg_to_parser(parser)
 
         cli_utils.add_args_for_json_option_to_parser(parser, 'environment')
 
@@ -120,12 +151,55 @@ class ListEndpointInstance(lister.Lister):
         env = cli_utils.get_option_value_from_args(
             args, 'environment', error_on_no_value=False)
 
+        if args.from_snapshot:
+            obj_list = ei.list_inventory(
+                endpoint_id, env, path=args.snapshot_file, name=args.name)
+            return EndpointInstanceFormatter().list_objects(obj_list)
+
         obj_list = ei.list(
             endpoint_id, env, args.marker, args.limit, args.name,
             refresh=args.refresh)
         return EndpointInstanceFormatter().list_objects(obj_list)
 
 
+class SyncEndpointInstances(lister.Lister):
+    """Update the local inventory snapshot of an endpoint's instances and
+    list the instances added, removed or changed since the previous one"""
+
+    def get_parser(self, prog_name):
+        parser = super(SyncEndpointInstances, self).get_parser(prog_name)
+        parser.add_argument('endpoint', help='The endpoint\'s id or name')
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            default=False,
+            help='Force refresh of cached instance data')
+        parser.add_argument(
+            '--page-size', type=int, default=base.DEFAULT_PAGE_SIZE,
+            help='Number of instances requested per page')
+        _add_snapshot_file_arg_to_parser(parser)
+
+        cli_utils.add_args_for_json_option_to_parser(parser, 'environment')
+
+        return parser
+
+    def take_action(self, args):
+        endpoints = self.app.client_manager.coriolis.endpoints
+        endpoint_id = endpoints.get_endpoint_id_for_name(args.endpoint)
+        ei = self.app.client_manager.coriolis.endpoint_instances
+        env = cli_utils.get_option_value_from_args(
+            args, 'environment', error_on_no_value=False)
+
+        diff = ei.sync_inventory(
+            endpoint_id, env, path=args.snapshot_file,
+            refresh=args.refresh, page_size=args.page_size)
+        changes = (
+            [("added", info) for info in diff.added] +
+            [("removed", info) for info in diff.removed] +
+            [("changed", info) for info in diff.changed])
+        return InventoryDiffFormatter().list_objects(changes)
+
+
 class ShowEndpointInstance(show.ShowOne):
 
     def get_parser(self, prog_name):
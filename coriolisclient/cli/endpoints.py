@@ -138,8 +138,9 @@ class CreateEndpoint(show.ShowOne):
                             'when creating the endpoint.')
         parser.add_argument('--coriolis-region', action='append',
                             dest='regions', default=[],
-                            help="ID of a region the endpoint should be  "
-                            "associated with. Can be supplied multiple times.")
+                            help="ID or name of a region the endpoint should "
+                            "be associated with. Can be supplied multiple "
+                            "times.")
         add_connection_info_args_to_parser(parser)
 
         return parser
@@ -151,12 +152,14 @@ class CreateEndpoint(show.ShowOne):
                 "--connection-secret, but not both")
 
         conn_info = get_connection_info_from_args(args)
+        regions = cli_utils.get_region_ids_from_args(
+            self.app.client_manager.coriolis, args.regions)
         endpoint = self.app.client_manager.coriolis.endpoints.create(
             args.name,
             args.provider,
             conn_info,
             args.description,
-            regions=args.regions)
+            regions=regions)
 
         if not args.skip_validation:
             valid, message = (
@@ -179,11 +182,12 @@ class UpdateEndpoint(show.ShowOne):
                             help='A description for this endpoint')
         parser.add_argument('--coriolis-region', action='append',
                             dest='regions', default=[],
-                            help="ID of a region the endpoint should be  "
-                                 "associated with. Can be supplied multiple "
-                                 "times. Update will override all existing "
-                                 "region associations with the one(s) provided"
-                                 " if at least one region is given.")
+                            help="ID or name of a region the endpoint should "
+                                 "be associated with. Can be supplied "
+                                 "multiple times. Update will override all "
+                                 "existing region associations with the "
+                                 "one(s) provided if at least one region is "
+                                 "given.")
         add_connection_info_args_to_parser(parser)
         return parser
 
@@ -202,7 +206,9 @@ class UpdateEndpoint(show.ShowOne):
         if conn_info:
             updated_values["connection_info"] = conn_info
         if args.regions:
-            updated_values["mapped_regions"] = args.regions
+            updated_values["mapped_regions"] = (
+                cli_utils.get_region_ids_from_args(
+                    self.app.client_manager.coriolis, args.regions))
 
         endpoint = self.app.client_manager.coriolis.endpoints.update(
             args.id, updated_values)
@@ -261,24 +267,50 @@ class ExportEndpointInventory(command.Command):
         parser.add_argument(
             '--output-file',
             help='Path to write the CSV to. Defaults to stdout.')
+        parser.add_argument(
+            '--gzip', action='store_true', default=False,
+            help='Write the CSV gzip-compressed.')
+        parser.add_argument(
+            '--progress', action='store_true', default=False,
+            help='Report the number of bytes received on stderr.')
         return parser
 
+    def _report_progress(self, received, total):
+        if total:
+            progress = "%d/%d bytes (%d%%)" % (
+                received, total, received * 100 // total)
+        else:
+            progress = "%d bytes" % received
+        self.app.stderr.write("\rReceived %s" % progress)
+        self.app.stderr.flush()
+
     def take_action(self, args):
         endpoints = self.app.client_manager.coriolis.endpoints
         endpoint_id = endpoints.get_endpoint_id_for_name(args.id)
         source_environment = cli_utils.get_option_value_from_args(
             args, 'environment', error_on_no_value=False)
 
-        csv_content = endpoints.get_inventory_csv(
-            endpoint_id, source_environment=source_environment)
+        progress_callback = None
+        if args.progress:
+            progress_callback = self._report_progress
+
+        def _export(out):
+            endpoints.export_inventory_csv(
+                endpoint_id, out, source_environment=source_environment,
+                compress=args.gzip, progress_callback=progress_callback)
 
         if args.output_file:
-            with open(args.output_file, 'w') as fout:
-                fout.write(csv_content)
+            with open(args.output_file, 'wb') as fout:
+                _export(fout)
+        else:
+            _export(sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+
+        if args.progress:
+            self.app.stderr.write("\n")
+        if args.output_file:
             self.app.stdout.write(
                 'Inventory written to %s\n' % args.output_file)
-        else:
-            sys.stdout.write(csv_content)
 
 
 class EndpointValidateConnection(command.Command):
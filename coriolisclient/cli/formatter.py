@@ -12,6 +12,33 @@
 # limitations under the License.
 
 
+def _normalize_timestamp(timestamp):
+    return str(timestamp or "").replace(" ", "T")
+
+
+def _get_progress_update_key(progress_update):
+    return (progress_update.get("index") or 0,
+            _normalize_timestamp(progress_update.get("created_at")))
+
+
+def _get_progress_update_content(progress_update):
+    return (progress_update.get("current_step"),
+            progress_update.get("total_steps"),
+            progress_update.get("message"))
+
+
+def parse_progress_updates_since(value):
+    """Parses the value of a '--since' argument, which is either a progress
+    update index or a timestamp.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    return _normalize_timestamp(value)
+
+
 class EntityFormatter(object):
     """Base Mixin class providing functions that format entities for display.
 
@@ -19,6 +46,17 @@ class EntityFormatter(object):
     the function _get_formatted_data().
     """
 
+    # NOTE: index or timestamp after which progress updates are rendered,
+    # see `parse_progress_updates_since`:
+    progress_updates_since = None
+    # NOTE: dict mapping task IDs to the key of the newest progress update
+    # rendered for them along with the content of all those rendered, so
+    # that only newer or since changed ones are rendered next time:
+    progress_updates_marks = None
+    # NOTE: fields of the entities which are rendered, to be requested
+    # from the API instead of the full entities, if set:
+    fields = None
+
     def _get_sorted_list(self, obj_list):
         return obj_list
 
@@ -47,6 +85,56 @@ class EntityFormatter(object):
 
         return percent_format.format((current_value * 100) / max_value)
 
+    def _is_new_progress_update(self, progress_update, mark):
+        key = _get_progress_update_key(progress_update)
+        if mark is not None:
+            (mark_key, rendered) = mark
+            if key in rendered:
+                # NOTE: progress updates are updated in place as the
+                # task progresses, keeping their index:
+                return rendered[key] != _get_progress_update_content(
+                    progress_update)
+            if key <= mark_key:
+                return False
+        since = self.progress_updates_since
+        if isinstance(since, int):
+            return key[0] > since
+        if since:
+            return key[1] > since
+        return True
+
+    def _get_progress_updates(self, task_dict):
+        """Returns the sorted progress updates of the task to render.
+
+        Updates older than `progress_updates_since` or than the last one
+        rendered for the task are filtered out before sorting, unless they
+        changed since they were rendered, so that rendering only the latest
+        updates of long-running tasks is cheap.
+        """
+        progress_updates = task_dict.get("progress_updates") or []
+        marks = self.progress_updates_marks
+        mark = None
+        if marks is not None:
+            mark = marks.get(task_dict.get("id"))
+        if mark is not None or self.progress_updates_since is not None:
+            progress_updates = [
+                p for p in progress_updates
+                if self._is_new_progress_update(p, mark)]
+
+        progress_updates = sorted(
+            progress_updates, key=_get_progress_update_key)
+        if marks is not None and progress_updates:
+            (mark_key, rendered) = mark or (None, {})
+            rendered = dict(rendered)
+            for progress_update in progress_updates:
+                rendered[_get_progress_update_key(progress_update)] = (
+                    _get_progress_update_content(progress_update))
+            last_key = _get_progress_update_key(progress_updates[-1])
+            if mark_key is None or last_key > mark_key:
+                mark_key = last_key
+            marks[task_dict.get("id")] = (mark_key, rendered)
+        return progress_updates
+
     def _format_progress_update(self, progress_update):
         event_format = "%(created_at)s %(message)s"
         percent_string = self._get_percent_string(
@@ -19,6 +19,8 @@ from cliff import command
 from cliff import lister
 
 from coriolisclient.cli import formatter
+from coriolisclient import exceptions
+from coriolisclient.v1 import logging as coriolis_logging
 
 
 _READIBLE_LOG_LEVELS = [
@@ -77,7 +79,14 @@ class DownloadCoriolisLog(command.Command):
         parser = super(DownloadCoriolisLog, self).get_parser(prog_name)
         parser.add_argument(
             'log_name',
+            nargs='?',
             help='The name of the log to fetch')
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            default=False,
+            help='Fetch the logs of all apps into the directory given by '
+                 '--out-dir')
         parser.add_argument(
             '--start-time',
             help="The start date of the log. This can be a unix timestamp"
@@ -92,14 +101,57 @@ class DownloadCoriolisLog(command.Command):
             default=None)
         parser.add_argument(
             '--out-file',
-            help="The destination file name where the log will be written",
-            required=True)
+            help="The destination file name where the log will be written")
+        parser.add_argument(
+            '--out-dir',
+            help="The destination directory where the logs will be written "
+                 "when using --all")
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=coriolis_logging.DEFAULT_DOWNLOAD_CONCURRENCY,
+            help="The number of logs to fetch in parallel when using --all")
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=coriolis_logging.DEFAULT_CHUNK_SIZE,
+            help="The size in bytes of the chunks in which logs are fetched")
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            default=False,
+            help="Resume previous, partial downloads of the same logs. "
+                 "Requires absolute --start-time and --end-time values.")
+        parser.add_argument(
+            '--compression',
+            choices=coriolis_logging.COMPRESSION_FORMATS,
+            default=None,
+            help="Compress the logs while writing them. 'zstd' requires the "
+                 "'zstandard' package to be installed.")
         return parser
 
     def take_action(self, args):
-        self.app.client_manager.coriolis.logging.get(
+        logging_client = self.app.client_manager.coriolis.logging
+        if args.all:
+            if args.log_name or not args.out_dir:
+                raise exceptions.CoriolisException(
+                    "Please specify --out-dir and no log name when "
+                    "using --all")
+            logging_client.download_all(
+                args.out_dir,
+                start_time=args.start_time, end_time=args.end_time,
+                concurrency=args.concurrency, chunk_size=args.chunk_size,
+                resume=args.resume, compression=args.compression)
+            return
+
+        if not args.log_name or not args.out_file:
+            raise exceptions.CoriolisException(
+                "Please specify a log name and --out-file, or --all")
+        logging_client.get(
             args.log_name, args.out_file,
-            start_time=args.start_time, end_time=args.end_time)
+            start_time=args.start_time, end_time=args.end_time,
+            chunk_size=args.chunk_size, resume=args.resume,
+            compression=args.compression)
 
 
 class StreamCoriolisLog(command.Command):
@@ -116,9 +168,31 @@ class StreamCoriolisLog(command.Command):
             required=False,
             default=_DEFAULT_LOG_LEVEL,
             choices=_READIBLE_LOG_LEVELS)
+        parser.add_argument(
+            '--queue-size',
+            type=int,
+            default=coriolis_logging.DEFAULT_STREAM_QUEUE_SIZE,
+            help="The maximum number of log records buffered while waiting "
+                 "to be output")
+        parser.add_argument(
+            '--drop-policy',
+            choices=coriolis_logging.DROP_POLICIES,
+            default=coriolis_logging.DROP_OLDEST,
+            help="Which log records to discard when the buffer is full. "
+                 "'coalesce' also merges repeated consecutive records.")
+        parser.add_argument(
+            '--max-reconnects',
+            type=int,
+            default=None,
+            help="The number of consecutive failed reconnection attempts "
+                 "after which to stop streaming. Retries indefinitely by "
+                 "default.")
         return parser
 
     def take_action(self, args):
         self.app.client_manager.coriolis.logging.stream(
             app_name=args.log_name,
-            severity=_MAPPED_LOG_LEVELS[args.severity])
+            severity=_MAPPED_LOG_LEVELS[args.severity],
+            queue_size=args.queue_size,
+            drop_policy=args.drop_policy,
+            max_reconnects=args.max_reconnects)
@@ -158,6 +158,13 @@ class CreateMinionPool(show.ShowOne):
                                  "allocation will need to be manually "
                                  "triggered before the pool can be used.")
 
+        parser.add_argument('--validate', action='store_true',
+                            default=False,
+                            help='Validate the environment options against '
+                                 'the schema of the endpoint\'s provider '
+                                 'before creating the pool. Requires the '
+                                 '"jsonschema" package.')
+
         cli_utils.add_args_for_json_option_to_parser(
             parser, "environment-options")
         return parser
@@ -173,7 +180,8 @@ class CreateMinionPool(show.ShowOne):
             maximum_minions=args.maximum_minions,
             minion_max_idle_time=args.minion_max_idle_time,
             minion_retention_strategy=args.minion_retention_strategy,
-            notes=args.notes, skip_allocation=args.skip_allocation)
+            notes=args.notes, skip_allocation=args.skip_allocation,
+            validate=args.validate)
 
         return MinionPoolDetailFormatter().get_formatted_entity(minion_pool)
 
@@ -21,6 +21,7 @@ from cliff import lister
 from cliff import show
 
 from coriolisclient.cli import formatter
+from coriolisclient.cli import utils as cli_utils
 
 
 class ServiceFormatter(formatter.EntityFormatter):
@@ -73,16 +74,19 @@ class CreateService(show.ShowOne):
                             help='The messaging topic for the new service.')
         parser.add_argument('--coriolis-region', action='append',
                             dest='regions', default=[],
-                            help="ID of a region the service should be "
-                            "associated with. Can be supplied multiple times.")
+                            help="ID or name of a region the service should "
+                            "be associated with. Can be supplied multiple "
+                            "times.")
         _add_service_enablement_args_to_parser(parser)
 
         return parser
 
     def take_action(self, args):
+        regions = cli_utils.get_region_ids_from_args(
+            self.app.client_manager.coriolis, args.regions)
         service = self.app.client_manager.coriolis.services.create(
             args.host, args.binary, topic=args.topic, enabled=args.enabled,
-            regions=args.regions)
+            regions=regions)
 
         return ServiceFormatter().get_formatted_entity(service)
 
@@ -95,11 +99,12 @@ class UpdateService(show.ShowOne):
         parser.add_argument('id', help='The service\'s ID.')
         parser.add_argument('--coriolis-region', action='append',
                             dest='regions', default=[],
-                            help="ID of a region the service should be "
-                                 "associated with. Can be supplied multiple "
-                                 "times. Update will override all existing "
-                                 "region associations with the one(s) provided"
-                                 " if at least one region is given.")
+                            help="ID or name of a region the service should "
+                                 "be associated with. Can be supplied "
+                                 "multiple times. Update will override all "
+                                 "existing region associations with the "
+                                 "one(s) provided if at least one region is "
+                                 "given.")
         _add_service_enablement_args_to_parser(parser)
 
         return parser
@@ -109,7 +114,9 @@ class UpdateService(show.ShowOne):
         if args.enabled is not None:
             updated_values['enabled'] = args.enabled
         if args.regions is not None:
-            updated_values["mapped_regions"] = args.regions
+            updated_values["mapped_regions"] = (
+                cli_utils.get_region_ids_from_args(
+                    self.app.client_manager.coriolis, args.regions))
         service = self.app.client_manager.coriolis.services.update(
             args.id, updated_values)
 
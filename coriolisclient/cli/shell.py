@@ -34,6 +34,7 @@ from keystoneauth1 import session
 
 import six
 
+from coriolisclient import base
 from coriolisclient import client
 from coriolisclient import exceptions
 from coriolisclient import version
@@ -154,6 +155,11 @@ class Coriolis(app.App):
     def create_client(self, args):
         created_client = None
         endpoint_filter_kwargs = self._get_endpoint_filter_kwargs(args)
+        if getattr(args, 'cache_dir', None):
+            endpoint_filter_kwargs['cache_dir'] = args.cache_dir
+        if getattr(args, 'lazy_load_policy', None):
+            endpoint_filter_kwargs['lazy_load_policy'] = (
+                args.lazy_load_policy)
 
         api_version = args.os_identity_api_version
         verify = args.os_cacert or not args.insecure
@@ -322,6 +328,22 @@ class Coriolis(app.App):
                             metavar='<coriolis-api-version>',
                             default=self._env('CORIOLIS_API_VERSION'),
                             help='Defaults to env[CORIOLIS_API_VERSION].')
+        parser.add_argument('--cache-dir',
+                            metavar='<cache-dir>',
+                            default=self._env('CORIOLIS_CACHE_DIR'),
+                            help='Directory in which to cache rarely '
+                                 'changing API data, such as endpoint name '
+                                 'lookups, between invocations. '
+                                 'Defaults to env[CORIOLIS_CACHE_DIR].')
+        parser.add_argument('--lazy-load-policy',
+                            metavar='<lazy-load-policy>',
+                            choices=base.LAZY_LOAD_POLICIES,
+                            default=self._env('CORIOLIS_LAZY_LOAD_POLICY'),
+                            help='Whether resources may be implicitly '
+                                 'reloaded when accessing details missing '
+                                 'from them, one of: %s. Defaults to '
+                                 'env[CORIOLIS_LAZY_LOAD_POLICY].' % (
+                                     ", ".join(base.LAZY_LOAD_POLICIES)))
         parser.epilog = ('See "coriolis help COMMAND" for help '
                          'on a specific command.')
         loading.register_session_argparse_arguments(parser)
@@ -15,6 +15,7 @@
 """
 Command-line interface sub-commands related to transfers.
 """
+import asyncio
 import os
 
 from cliff import command
@@ -23,6 +24,7 @@ from cliff import show
 
 from coriolisclient.cli import formatter
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient.v1 import execution_watcher
 
 
 class TransferExecutionFormatter(formatter.EntityFormatter):
@@ -32,6 +34,7 @@ class TransferExecutionFormatter(formatter.EntityFormatter):
                "Status",
                "Created",
                )
+    fields = ("action_id", "id", "status", "created_at")
 
     def _get_sorted_list(self, obj_list):
         return sorted(obj_list, key=lambda o: o.created_at)
@@ -56,14 +59,24 @@ class TransferExecutionDetailFormatter(formatter.EntityFormatter):
                "tasks",
                )
 
+    def __init__(self, since=None, marks=None):
+        """
+        :param since: only render the progress updates after this index or
+            timestamp
+        :param marks: dict in which to keep the newest progress update
+            rendered for each task, so that only newer or updated ones are
+            rendered when formatting the execution again
+        """
+        self.progress_updates_since = since
+        self.progress_updates_marks = marks
+
     def _format_instances(self, obj):
         return os.linesep.join(sorted(set([t.instance for t in obj.tasks])))
 
     def _format_progress_updates(self, task_dict):
         return ("%(ls)s" % {"ls": os.linesep}).join(
             [self._format_progress_update(p) for p in
-             sorted(task_dict.get("progress_updates", []),
-                    key=lambda p: (p.get("index", 0), p["created_at"]))])
+             self._get_progress_updates(task_dict)])
 
     def _format_task(self, task):
         d = task.to_dict()
@@ -134,13 +147,74 @@ class ShowTransferExecution(show.ShowOne):
         parser = super(ShowTransferExecution, self).get_parser(prog_name)
         parser.add_argument('transfer', help='The transfer\'s id')
         parser.add_argument('id', help='The transfer execution\'s id')
+        cli_utils.add_progress_updates_since_arg_to_parser(parser)
         return parser
 
     def take_action(self, args):
         execution = self.app.client_manager.coriolis.transfer_executions.get(
             args.transfer, args.id)
-        return TransferExecutionDetailFormatter().get_formatted_entity(
-            execution)
+        return TransferExecutionDetailFormatter(
+            since=formatter.parse_progress_updates_since(args.since)
+        ).get_formatted_entity(execution)
+
+
+class WatchTransferExecution(command.Command):
+    """Follow the progress of a transfer execution until it finishes"""
+
+    def get_parser(self, prog_name):
+        parser = super(WatchTransferExecution, self).get_parser(prog_name)
+        parser.add_argument('transfer', help='The transfer\'s id')
+        parser.add_argument('id', help='The transfer execution\'s id')
+        parser.add_argument(
+            '--no-logs', dest='logs', action='store_false', default=True,
+            help='Do not follow the execution\'s log records, only poll '
+                 'its state.')
+        parser.add_argument(
+            '--reconcile-interval', type=int,
+            default=execution_watcher.DEFAULT_RECONCILE_INTERVAL,
+            help='Seconds between the checks of the execution\'s status.')
+        parser.add_argument(
+            '--full-reconcile-interval', type=int,
+            default=execution_watcher.DEFAULT_FULL_RECONCILE_INTERVAL,
+            help='Maximum number of seconds between fetches of the '
+                 'execution\'s tasks.')
+        return parser
+
+    def _format_event(self, event):
+        task = event.task or {}
+        task_name = task.get("id")
+        if task.get("task_type"):
+            task_name = "%s (%s)" % (task["task_type"], task.get("instance"))
+        if event.type == execution_watcher.EVENT_EXECUTION_STATUS:
+            return "Execution status: %s" % event.data
+        if event.type == execution_watcher.EVENT_TASK_STATUS:
+            return "Task %s: %s" % (task_name, event.data)
+        if event.type == execution_watcher.EVENT_PROGRESS_UPDATE:
+            return "Task %s: %s" % (
+                task_name,
+                TransferExecutionDetailFormatter()._format_progress_update(
+                    event.data))
+        return "Log: %s" % event.data.get("message")
+
+    def take_action(self, args):
+        events = self.app.client_manager.coriolis.transfer_executions.watch(
+            args.transfer, args.id, logs=args.logs,
+            reconcile_interval=args.reconcile_interval,
+            full_reconcile_interval=args.full_reconcile_interval)
+
+        async def _watch():
+            try:
+                async for event in events:
+                    self.app.stdout.write(
+                        "%s%s" % (self._format_event(event), os.linesep))
+                    self.app.stdout.flush()
+            finally:
+                await events.aclose()
+
+        try:
+            asyncio.run(_watch())
+        except KeyboardInterrupt:
+            pass
 
 
 class CancelTransferExecution(command.Command):
@@ -209,5 +283,6 @@ class ListTransferExecution(lister.Lister):
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
             filters=filters,
+            fields=TransferExecutionFormatter.fields,
         )
         return TransferExecutionFormatter().list_objects(obj_list)
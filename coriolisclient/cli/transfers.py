@@ -26,6 +26,7 @@ from cliff import show
 from coriolisclient.cli import formatter
 from coriolisclient.cli import transfer_executions
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient.v1 import common
 
 TRANSFER_SCENARIO_REPLICA = "replica"
 TRANSFER_SCENARIO_LIVE_MIGRATION = "live_migration"
@@ -68,6 +69,8 @@ class TransferFormatter(formatter.EntityFormatter):
                "Last Execution Status",
                "Created",
                )
+    fields = ("id", "scenario", "instances", "notes",
+              "last_execution_status", "created_at")
 
     def _get_sorted_list(self, obj_list):
         return sorted(obj_list, key=lambda o: o.created_at)
@@ -130,9 +133,13 @@ class TransferDetailFormatter(formatter.EntityFormatter):
         storage_mappings = obj.to_dict().get("storage_mappings", {})
         default_storage, backend_mappings, disk_mappings = (
             cli_utils.parse_storage_mappings(storage_mappings))
-        executions = (
-            self._executions if self._executions is not None
-            else obj.executions)
+        # NOTE: only render the executions already fetched along with the
+        # transfer, as `Transfer.executions` would reload it if missing:
+        executions = self._executions
+        if executions is None:
+            executions = [
+                common.TasksExecution(None, e, loaded=True)
+                for e in obj.to_dict().get("executions") or []]
         data = [obj.id,
                 obj.created_at,
                 obj.updated_at,
@@ -249,6 +256,13 @@ class CreateTransfer(show.ShowOne):
 
         cli_utils.add_storage_mappings_arguments_to_parser(parser)
         _add_default_deployment_args_to_parser(parser)
+        parser.add_argument(
+            '--validate',
+            action='store_true',
+            default=False,
+            help='Validate the source and destination environments against '
+                 'the schemas of their providers before creating the '
+                 'transfer. Requires the "jsonschema" package.')
 
         return parser
 
@@ -289,7 +303,8 @@ class CreateTransfer(show.ShowOne):
                 instance_osmorphing_minion_pool_mappings),
             user_scripts=user_scripts,
             clone_disks=args.clone_disks,
-            skip_os_morphing=args.skip_os_morphing)
+            skip_os_morphing=args.skip_os_morphing,
+            validate=args.validate)
 
         return TransferDetailFormatter().get_formatted_entity(transfer)
 
@@ -307,16 +322,12 @@ class ShowTransfer(show.ShowOne):
         return parser
 
     def take_action(self, args):
-        coriolis = self.app.client_manager.coriolis
-        transfer = coriolis.transfers.get(
-            args.id, include_task_info=args.show_instances_data)
-        executions = coriolis.transfer_executions.list(
-            args.id,
-            limit=TRANSFER_SHOW_EXECUTIONS_LIMIT,
-            sort_keys=["number"], sort_dirs=["desc"])
+        transfer = self.app.client_manager.coriolis.transfers.\
+            get_with_executions(
+                args.id, include_task_info=args.show_instances_data,
+                executions_limit=TRANSFER_SHOW_EXECUTIONS_LIMIT)
         return TransferDetailFormatter(
-            args.show_instances_data,
-            executions=executions).get_formatted_entity(transfer)
+            args.show_instances_data).get_formatted_entity(transfer)
 
 
 class DeleteTransfer(command.Command):
@@ -378,6 +389,7 @@ class ListTransfer(lister.Lister):
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
             filters=filters,
+            fields=TransferFormatter.fields,
         )
         return TransferFormatter().list_objects(obj_list)
 
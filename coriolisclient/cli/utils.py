@@ -82,6 +82,17 @@ def get_storage_mappings_dict_from_args(args):
     return storage_mappings
 
 
+def get_region_ids_from_args(coriolis, regions):
+    """ Resolves the given region names or IDs to region IDs, listing the
+    regions at most once regardless of how many are given.
+    """
+    if not regions:
+        return regions
+    return [
+        region.id for region in
+        coriolis.regions.get_regions_by_name_or_id(regions)]
+
+
 def format_mapping(mapping):
     """ Given a str-str mapping, formats it as a string. """
     return ", ".join(
@@ -156,6 +167,18 @@ def add_args_for_json_option_to_parser(parser, option_name):
     return parser
 
 
+def add_progress_updates_since_arg_to_parser(parser):
+    """ Given an `argparse.ArgumentParser` instance, add the argument for only
+    showing the progress updates of tasks after a given index or timestamp.
+    """
+    parser.add_argument(
+        '--since',
+        help='Only show the progress updates of tasks after this progress '
+             'update index (e.g. 120) or timestamp '
+             '(e.g. 2026-01-01T10:00:00)')
+    return parser
+
+
 def get_option_value_from_args(args, option_name, error_on_no_value=True):
     """ Returns a dict with the value from of the option from the given
     arguments as set up by calling `add_args_for_json_option_to_parser`
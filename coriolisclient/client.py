@@ -13,10 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import logging
 
 from keystoneauth1 import adapter
 
+from coriolisclient import base
+from coriolisclient.v1 import common
 from coriolisclient.v1 import deployments
 from coriolisclient.v1 import diagnostics
 from coriolisclient.v1 import endpoint_destination_minion_pool_options
@@ -39,6 +42,7 @@ from coriolisclient.v1 import services
 from coriolisclient.v1 import transfer_executions
 from coriolisclient.v1 import transfer_schedules
 from coriolisclient.v1 import transfers
+from coriolisclient.v1 import validation
 
 
 LOG = logging.getLogger(__name__)
@@ -64,6 +68,18 @@ class _HTTPClient(adapter.Adapter):
 
 class Client(object):
     def __init__(self, session=None, *args, **kwargs):
+        compact_resources = kwargs.pop('compact_resources', False)
+        cache_dir = kwargs.pop('cache_dir', None)
+        options_cache_ttl = kwargs.pop(
+            'options_cache_ttl', common.DEFAULT_OPTIONS_CACHE_TTL)
+        licensing_pool_size = kwargs.pop(
+            'licensing_pool_size', licensing.DEFAULT_POOL_SIZE)
+        lazy_load_policy = kwargs.pop(
+            'lazy_load_policy', base.LAZY_LOAD_ALLOW)
+        if lazy_load_policy not in base.LAZY_LOAD_POLICIES:
+            raise ValueError(
+                "Invalid lazy-load policy '%s', must be one of: %s" % (
+                    lazy_load_policy, ", ".join(base.LAZY_LOAD_POLICIES)))
         httpclient = _HTTPClient(session=session, *args, **kwargs)
 
         self.endpoints = endpoints.EndpointManager(httpclient)
@@ -96,10 +112,38 @@ class Client(object):
         self.services = services.ServiceManager(httpclient)
         self.logging = coriolis_logging.CoriolisLogDownloadManager(httpclient)
         self.diagnostics = diagnostics.DiagnosticsManager(httpclient)
-        self.licensing = licensing.LicensingManager(httpclient)
+        # NOTE: shared by all licensing managers, so that they use the same
+        # connection pool and endpoint lookup:
+        self.licensing_client = licensing.LicensingClient(
+            httpclient, pool_size=licensing_pool_size)
+        self.licensing = licensing.LicensingManager(
+            httpclient, licensing_client=self.licensing_client)
         self.licensing_appliances = (
-            licensing_appliances.LicensingAppliancesManager(httpclient))
+            licensing_appliances.LicensingAppliancesManager(
+                httpclient, licensing_client=self.licensing_client))
         self.licensing_reservations = (
-            licensing_reservations.LicensingReservationsManager(httpclient))
+            licensing_reservations.LicensingReservationsManager(
+                httpclient, licensing_client=self.licensing_client))
         self.licensing_server = (
-            licensing_server.LicensingServerManager(httpclient))
+            licensing_server.LicensingServerManager(
+                httpclient, licensing_client=self.licensing_client))
+
+        self.schema_validator = validation.SchemaValidator(
+            self.providers, self.endpoints)
+        self.transfers.schema_validator = self.schema_validator
+        self.minion_pools.schema_validator = self.schema_validator
+        self.transfers.executions_manager = self.transfer_executions
+
+        # NOTE: number of implicit loads of resources by all managers, per
+        # resource type, see `base.Resource._lazy_load`:
+        self.lazy_loads = collections.Counter()
+        for manager in vars(self).values():
+            if isinstance(manager, base.BaseManager):
+                manager.lazy_load_policy = lazy_load_policy
+                manager.lazy_loads = self.lazy_loads
+                if compact_resources:
+                    manager.compact_resources = True
+                if cache_dir:
+                    manager.cache_dir = cache_dir
+            if isinstance(manager, common.EndpointOptionsManager):
+                manager.options_cache.ttl = options_cache_ttl
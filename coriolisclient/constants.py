@@ -17,6 +17,25 @@ MIGRATION_STATUS_RUNNING = "RUNNING"
 MIGRATION_STATUS_COMPLETED = "COMPLETED"
 MIGRATION_STATUS_ERROR = "ERROR"
 
+EXECUTION_STATUS_UNEXECUTED = "UNEXECUTED"
+EXECUTION_STATUS_RUNNING = "RUNNING"
+EXECUTION_STATUS_COMPLETED = "COMPLETED"
+EXECUTION_STATUS_ERROR = "ERROR"
+EXECUTION_STATUS_DEADLOCKED = "DEADLOCKED"
+EXECUTION_STATUS_CANCELLING = "CANCELLING"
+EXECUTION_STATUS_CANCELED = "CANCELED"
+EXECUTION_STATUS_CANCELED_FOR_DEBUGGING = "CANCELED_FOR_DEBUGGING"
+EXECUTION_STATUS_ERROR_ALLOCATING_MINIONS = "ERROR_ALLOCATING_MINIONS"
+
+FINALIZED_EXECUTION_STATUSES = [
+    EXECUTION_STATUS_COMPLETED,
+    EXECUTION_STATUS_ERROR,
+    EXECUTION_STATUS_DEADLOCKED,
+    EXECUTION_STATUS_CANCELED,
+    EXECUTION_STATUS_CANCELED_FOR_DEBUGGING,
+    EXECUTION_STATUS_ERROR_ALLOCATING_MINIONS,
+]
+
 TASK_STATUS_PENDING = "PENDING"
 TASK_STATUS_RUNNING = "RUNNING"
 TASK_STATUS_COMPLETED = "COMPLETED"
@@ -85,3 +85,41 @@ class LicensingEndpointNotFound(CoriolisException):
         super(LicensingEndpointNotFound, self).__init__(
             "Provided licensing endpoint: '%s' not found in the service "
             "catalogue" % endpoint_id)
+
+
+class SchemaValidationFailed(CoriolisException):
+    """Raised when a payload does not match its provider schema"""
+
+    def __init__(self, schema_type, errors):
+        self.errors = errors
+        super(SchemaValidationFailed, self).__init__(
+            "Invalid %s: %s" % (schema_type, "; ".join(errors)))
+
+
+class WaitTimeout(CoriolisException):
+    """Raised when resources do not reach a terminal state in time"""
+
+    def __init__(self, pending):
+        self.pending = pending
+        super(WaitTimeout, self).__init__(
+            "Timed out waiting for: %s" % ", ".join(
+                "%s (%s)" % (resource_id, status)
+                for (resource_id, status) in pending))
+
+
+class LazyLoadForbidden(CoriolisException, AttributeError):
+    """Raised when a resource would be implicitly loaded while the lazy-load
+    policy forbids it
+
+    Also an `AttributeError`, so that `hasattr()` and `getattr()` with a
+    default treat the forbidden attributes as missing.
+    """
+
+    def __init__(self, resource_type, resource_id, attr):
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.attr = attr
+        super(LazyLoadForbidden, self).__init__(
+            "Accessing '%s' of %s '%s' requires implicitly loading it, "
+            "which is forbidden by the lazy-load policy" % (
+                attr, resource_type, resource_id))
@@ -0,0 +1,175 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local SQLite snapshots of endpoint instance inventories."""
+
+import collections
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_INVENTORY_FILE_NAME = "inventory.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    scope TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS instances (
+    scope TEXT NOT NULL,
+    instance_id TEXT NOT NULL,
+    name TEXT,
+    checksum TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, instance_id)
+);
+CREATE INDEX IF NOT EXISTS instances_name ON instances (scope, name);
+"""
+
+InventoryDiff = collections.namedtuple(
+    "InventoryDiff", ["added", "removed", "changed", "unchanged"])
+InventoryDiff.__doc__ = """Changes between two snapshots of an inventory.
+
+`added` and `changed` hold the new info dicts of the instances, `removed`
+the last known ones and `unchanged` the number of instances left as-is.
+"""
+
+
+def _checksum(info):
+    return hashlib.sha256(
+        json.dumps(info, sort_keys=True).encode()).hexdigest()
+
+
+class InventorySnapshot(object):
+    """Stores the instance inventories of any number of scopes (e.g. an
+    endpoint and source environment) in a single SQLite database.
+
+    Every `sync()` replaces the snapshot of its scope within a single
+    transaction, so that a failed sync leaves the previous one intact.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @contextlib.contextmanager
+    def _connect(self):
+        db_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(db_dir, mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def sync(self, scope, instances):
+        """Replaces the snapshot of the given scope with the instances.
+
+        :param instances: iterable of instance info dicts, which is consumed
+            lazily so that it may be a paginated listing
+        :returns: `InventoryDiff` against the previous snapshot
+        """
+        with self._connect() as conn:
+            previous = dict(conn.execute(
+                "SELECT instance_id, checksum FROM instances "
+                "WHERE scope = ?", (scope,)))
+            seen = set()
+            added = []
+            changed = []
+            unchanged = 0
+            for info in instances:
+                instance_id = str(info["id"])
+                checksum = _checksum(info)
+                seen.add(instance_id)
+                old_checksum = previous.get(instance_id)
+                if old_checksum == checksum:
+                    unchanged += 1
+                    continue
+                if old_checksum is None:
+                    added.append(info)
+                else:
+                    changed.append(info)
+                conn.execute(
+                    "INSERT OR REPLACE INTO instances "
+                    "(scope, instance_id, name, checksum, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (scope, instance_id, info.get("name"), checksum,
+                     json.dumps(info)))
+
+            removed = []
+            removed_ids = [i for i in previous if i not in seen]
+            for instance_id in removed_ids:
+                (data,) = conn.execute(
+                    "SELECT data FROM instances "
+                    "WHERE scope = ? AND instance_id = ?",
+                    (scope, instance_id)).fetchone()
+                removed.append(json.loads(data))
+            conn.executemany(
+                "DELETE FROM instances WHERE scope = ? AND instance_id = ?",
+                [(scope, instance_id) for instance_id in removed_ids])
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (scope, synced_at) "
+                "VALUES (?, ?)", (scope, time.time()))
+
+        LOG.debug(
+            "Synced inventory '%s': %d added, %d removed, %d changed, "
+            "%d unchanged", scope, len(added), len(removed), len(changed),
+            unchanged)
+        return InventoryDiff(added, removed, changed, unchanged)
+
+    def get_synced_at(self, scope):
+        """Returns the timestamp of the last sync of the scope, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_at FROM snapshots WHERE scope = ?",
+                (scope,)).fetchone()
+        return row[0] if row else None
+
+    def list(self, scope, name=None):
+        """Returns the info dicts of the instances in the scope's snapshot,
+        optionally only those with the given name.
+        """
+        query = "SELECT data FROM instances WHERE scope = ?"
+        params = [scope]
+        if name is not None:
+            query += " AND name = ?"
+            params.append(name)
+        query += " ORDER BY name, instance_id"
+        with self._connect() as conn:
+            return [json.loads(data)
+                    for (data,) in conn.execute(query, params)]
+
+    def get(self, scope, instance_id):
+        """Returns the info dict of the given instance, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM instances "
+                "WHERE scope = ? AND instance_id = ?",
+                (scope, str(instance_id))).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, scope):
+        """Drops the snapshot of the given scope."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM instances WHERE scope = ?", (scope,))
+            conn.execute("DELETE FROM snapshots WHERE scope = ?", (scope,))
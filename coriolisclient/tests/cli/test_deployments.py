@@ -264,7 +264,8 @@ class ShowDeploymentTestCase(test_base.CoriolisBaseTestCase):
     def test_take_action(self):
         show_instances_data = False
         args = mock.Mock(
-            id=DEPLOYMENT_ID, show_instances_data=show_instances_data)
+            id=DEPLOYMENT_ID, show_instances_data=show_instances_data,
+            since=None)
         mock_fun = self.mock_app.client_manager.coriolis.deployments.get
         mock_fun.return_value = v1_deployments.Deployment(
             mock.MagicMock(), DEPLOYMENT_DATA)
@@ -352,4 +353,5 @@ class ListDeploymentTestCase(test_base.CoriolisBaseTestCase):
             sort_keys=mock.sentinel.sort_keys,
             sort_dirs=mock.sentinel.sort_dirs,
             filters={'status': mock_args.status},
+            fields=deployments.DeploymentFormatter.fields,
         )
@@ -135,6 +135,7 @@ class ListEndpointInstanceTestCase(
         args.limit = mock.sentinel.limit
         args.name = mock.sentinel.name
         args.refresh = mock.sentinel.refresh
+        args.from_snapshot = False
         mock_endpoints = mock.Mock()
         mock_ei = mock.Mock()
         self.mock_app.client_manager.coriolis.endpoints = mock_endpoints
@@ -158,6 +159,97 @@ class ListEndpointInstanceTestCase(
         )
         mock_list_objects.assert_called_once_with(mock_ei.list.return_value)
 
+    @mock.patch.object(endpoint_instances.EndpointInstanceFormatter,
+                       'list_objects')
+    @mock.patch.object(cli_utils, 'get_option_value_from_args')
+    def test_take_action_from_snapshot(
+        self,
+        mock_get_option_value_from_args,
+        mock_list_objects
+    ):
+        args = mock.Mock()
+        args.name = mock.sentinel.name
+        args.snapshot_file = mock.sentinel.snapshot_file
+        args.from_snapshot = True
+        mock_endpoints = self.mock_app.client_manager.coriolis.endpoints
+        mock_ei = self.mock_app.client_manager.coriolis.endpoint_instances
+
+        result = self.endpoint.take_action(args)
+
+        self.assertEqual(
+            mock_list_objects.return_value,
+            result
+        )
+        mock_ei.list_inventory.assert_called_once_with(
+            mock_endpoints.get_endpoint_id_for_name.return_value,
+            mock_get_option_value_from_args.return_value,
+            path=mock.sentinel.snapshot_file,
+            name=mock.sentinel.name,
+        )
+        mock_ei.list.assert_not_called()
+        mock_list_objects.assert_called_once_with(
+            mock_ei.list_inventory.return_value)
+
+
+class InventoryDiffFormatterTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client Inventory Diff Formatter."""
+
+    def setUp(self):
+        super(InventoryDiffFormatterTestCase, self).setUp()
+        self.formatter = endpoint_instances.InventoryDiffFormatter()
+
+    def test_get_formatted_data(self):
+        result = self.formatter._get_formatted_data(
+            ("added", {"id": "id1", "name": "name1"}))
+
+        self.assertEqual(("added", "id1", "name1"), result)
+
+
+class SyncEndpointInstancesTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client Sync Endpoint Instances."""
+
+    def setUp(self):
+        self.mock_app = mock.Mock()
+        super(SyncEndpointInstancesTestCase, self).setUp()
+        self.endpoint = endpoint_instances.SyncEndpointInstances(
+            self.mock_app, mock.sentinel.app_args)
+
+    @mock.patch.object(endpoint_instances.InventoryDiffFormatter,
+                       'list_objects')
+    @mock.patch.object(cli_utils, 'get_option_value_from_args')
+    def test_take_action(
+        self,
+        mock_get_option_value_from_args,
+        mock_list_objects
+    ):
+        args = mock.Mock()
+        args.refresh = mock.sentinel.refresh
+        args.page_size = mock.sentinel.page_size
+        args.snapshot_file = mock.sentinel.snapshot_file
+        mock_endpoints = self.mock_app.client_manager.coriolis.endpoints
+        mock_ei = self.mock_app.client_manager.coriolis.endpoint_instances
+        mock_ei.sync_inventory.return_value = mock.Mock(
+            added=[mock.sentinel.added], removed=[mock.sentinel.removed],
+            changed=[mock.sentinel.changed])
+
+        result = self.endpoint.take_action(args)
+
+        self.assertEqual(
+            mock_list_objects.return_value,
+            result
+        )
+        mock_ei.sync_inventory.assert_called_once_with(
+            mock_endpoints.get_endpoint_id_for_name.return_value,
+            mock_get_option_value_from_args.return_value,
+            path=mock.sentinel.snapshot_file,
+            refresh=mock.sentinel.refresh,
+            page_size=mock.sentinel.page_size,
+        )
+        mock_list_objects.assert_called_once_with([
+            ("added", mock.sentinel.added),
+            ("removed", mock.sentinel.removed),
+            ("changed", mock.sentinel.changed)])
+
 
 class ShowEndpointInstanceTestCase(
         test_base.CoriolisBaseTestCase):
@@ -5,6 +5,8 @@ from cliff import command
 from cliff import lister
 from cliff import show
 import ddt
+import os
+import tempfile
 from unittest import mock
 
 from coriolisclient.cli import endpoints
@@ -198,6 +200,9 @@ class CreateEndpointTestCase(test_base.CoriolisBaseTestCase):
         args.provider = mock.sentinel.provider
         args.description = mock.sentinel.description
         args.regions = mock.sentinel.regions
+        (self.mock_app.client_manager.coriolis.regions.
+         get_regions_by_name_or_id.return_value) = [
+            mock.Mock(id=mock.sentinel.region_id)]
         args.skip_validation = False
         mock_create = mock.Mock()
         mock_validate_connection = mock.Mock()
@@ -218,7 +223,7 @@ class CreateEndpointTestCase(test_base.CoriolisBaseTestCase):
             mock.sentinel.provider,
             mock_get_connection_info_from_args.return_value,
             mock.sentinel.description,
-            regions=mock.sentinel.regions,
+            regions=[mock.sentinel.region_id],
         )
         mock_validate_connection.assert_called_once_with(
             mock_create.return_value.id)
@@ -251,6 +256,9 @@ class CreateEndpointTestCase(test_base.CoriolisBaseTestCase):
         args.provider = mock.sentinel.provider
         args.description = mock.sentinel.description
         args.regions = mock.sentinel.regions
+        (self.mock_app.client_manager.coriolis.regions.
+         get_regions_by_name_or_id.return_value) = [
+            mock.Mock(id=mock.sentinel.region_id)]
         args.skip_validation = False
         mock_create = mock.Mock()
         mock_validate_connection = mock.Mock()
@@ -271,7 +279,7 @@ class CreateEndpointTestCase(test_base.CoriolisBaseTestCase):
             mock.sentinel.provider,
             mock_get_connection_info_from_args.return_value,
             mock.sentinel.description,
-            regions=mock.sentinel.regions,
+            regions=[mock.sentinel.region_id],
         )
         mock_validate_connection.assert_called_once_with(
             mock_create.return_value.id)
@@ -319,6 +327,9 @@ class UpdateEndpointTestCase(test_base.CoriolisBaseTestCase):
         args.name = mock.sentinel.name
         args.description = mock.sentinel.description
         args.regions = mock.sentinel.regions
+        (self.mock_app.client_manager.coriolis.regions.
+         get_regions_by_name_or_id.return_value) = [
+            mock.Mock(id=mock.sentinel.region_id)]
         args.skip_validation = False
         mock_update = mock.Mock()
         self.mock_app.client_manager.coriolis.endpoints.update = mock_update
@@ -327,7 +338,7 @@ class UpdateEndpointTestCase(test_base.CoriolisBaseTestCase):
             "description": mock.sentinel.description,
             "connection_info": (mock_get_connection_info_from_args.
                                 return_value),
-            "mapped_regions": mock.sentinel.regions,
+            "mapped_regions": [mock.sentinel.region_id],
         }
 
         result = self.endpoint.take_action(args)
@@ -474,6 +485,71 @@ class ListEndpointTestCase(test_base.CoriolisBaseTestCase):
             mock_client.list.return_value)
 
 
+class ExportEndpointInventoryTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client Export Endpoint Inventory."""
+
+    def setUp(self):
+        self.mock_app = mock.Mock()
+        super(ExportEndpointInventoryTestCase, self).setUp()
+        self.endpoint = endpoints.ExportEndpointInventory(
+            self.mock_app, mock.sentinel.app_args)
+        self.mock_endpoints = self.mock_app.client_manager.coriolis.endpoints
+
+    def test_take_action_output_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        args = mock.Mock()
+        args.id = mock.sentinel.id
+        args.environment = None
+        args.environment_file = None
+        args.output_file = os.path.join(tmpdir.name, "inventory.csv")
+        args.gzip = mock.sentinel.gzip
+        args.progress = True
+
+        def _export(endpoint_id, out, source_environment=None,
+                    compress=False, progress_callback=None):
+            out.write(b"a,b\n")
+            progress_callback(4, None)
+
+        self.mock_endpoints.export_inventory_csv.side_effect = _export
+
+        self.endpoint.take_action(args)
+
+        with open(args.output_file, 'rb') as fin:
+            self.assertEqual(b"a,b\n", fin.read())
+        self.mock_endpoints.export_inventory_csv.assert_called_once_with(
+            self.mock_endpoints.get_endpoint_id_for_name.return_value,
+            mock.ANY, source_environment=None, compress=mock.sentinel.gzip,
+            progress_callback=self.endpoint._report_progress)
+        self.mock_app.stderr.write.assert_has_calls(
+            [mock.call("\rReceived 4 bytes"), mock.call("\n")])
+        self.mock_app.stdout.write.assert_called_once_with(
+            'Inventory written to %s\n' % args.output_file)
+
+    @mock.patch.object(endpoints, 'sys')
+    def test_take_action_stdout(self, mock_sys):
+        args = mock.Mock()
+        args.environment = None
+        args.environment_file = None
+        args.output_file = None
+        args.progress = False
+
+        self.endpoint.take_action(args)
+
+        self.mock_endpoints.export_inventory_csv.assert_called_once_with(
+            self.mock_endpoints.get_endpoint_id_for_name.return_value,
+            mock_sys.stdout.buffer, source_environment=None,
+            compress=args.gzip, progress_callback=None)
+        mock_sys.stdout.buffer.flush.assert_called_once_with()
+        self.mock_app.stderr.write.assert_not_called()
+
+    def test_report_progress(self):
+        self.endpoint._report_progress(50, 200)
+
+        self.mock_app.stderr.write.assert_called_once_with(
+            "\rReceived 50/200 bytes (25%)")
+
+
 class EndpointValidateConnectionTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client List Endpoint."""
 
@@ -156,3 +156,64 @@ class TestEntityFormattterTestCase(test_base.CoriolisBaseTestCase):
             "mock_created_at mock_message",
             result
         )
+
+    def test_get_progress_updates(self):
+        update1 = {"index": 1, "created_at": "2026-01-01T10:00:00"}
+        update2 = {"index": 2, "created_at": "2026-01-01T11:00:00"}
+        update3 = {"index": 3, "created_at": "2026-01-01T12:00:00"}
+        task_dict = {"id": "task1",
+                     "progress_updates": [update3, update1, update2]}
+
+        self.assertEqual(
+            [update1, update2, update3],
+            self.format._get_progress_updates(task_dict))
+        self.format.progress_updates_since = 1
+        self.assertEqual(
+            [update2, update3],
+            self.format._get_progress_updates(task_dict))
+        self.format.progress_updates_since = (
+            formatter.parse_progress_updates_since("2026-01-01 11:30"))
+        self.assertEqual(
+            [update3], self.format._get_progress_updates(task_dict))
+
+    def test_get_progress_updates_marks(self):
+        update1 = {"index": 1, "created_at": "date1"}
+        update2 = {"index": 2, "created_at": "date2"}
+        task_dict = {"id": "task1", "progress_updates": [update1]}
+        self.format.progress_updates_marks = {}
+
+        self.assertEqual(
+            [update1], self.format._get_progress_updates(task_dict))
+        task_dict["progress_updates"].append(update2)
+        self.assertEqual(
+            [update2], self.format._get_progress_updates(task_dict))
+        self.assertEqual(
+            [], self.format._get_progress_updates(task_dict))
+        self.assertEqual(
+            {"task1": ((2, "date2"), {(1, "date1"): (None, None, None),
+                                      (2, "date2"): (None, None, None)})},
+            self.format.progress_updates_marks)
+
+    def test_get_progress_updates_marks_updated_in_place(self):
+        update1 = {"index": 1, "created_at": "date1", "message": "msg1"}
+        update2 = {"index": 2, "created_at": "date2", "message": "msg2",
+                   "current_step": 1, "total_steps": 10}
+        task_dict = {"id": "task1", "progress_updates": [update1, update2]}
+        self.format.progress_updates_marks = {}
+
+        self.assertEqual(
+            [update1, update2],
+            self.format._get_progress_updates(task_dict))
+        update2 = dict(update2, current_step=5, message="msg2 updated")
+        task_dict["progress_updates"] = [update1, update2]
+        self.assertEqual(
+            [update2], self.format._get_progress_updates(task_dict))
+        self.assertEqual(
+            [], self.format._get_progress_updates(task_dict))
+
+    def test_parse_progress_updates_since(self):
+        self.assertEqual(
+            (None, 12, "2026-01-01T10:00"),
+            (formatter.parse_progress_updates_since(None),
+             formatter.parse_progress_updates_since(" 12"),
+             formatter.parse_progress_updates_since("2026-01-01 10:00")))
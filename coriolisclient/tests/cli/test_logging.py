@@ -7,6 +7,7 @@ from cliff import command
 from cliff import lister
 
 from coriolisclient.cli import logging
+from coriolisclient import exceptions
 from coriolisclient.tests import test_base
 
 
@@ -109,10 +110,14 @@ class DownloadCoriolisLogTestCase(test_base.CoriolisBaseTestCase):
 
     def test_take_action(self):
         args = mock.Mock()
+        args.all = False
         args.log_name = mock.sentinel.log_name
         args.out_file = mock.sentinel.out_file
         args.start_time = mock.sentinel.start_time
         args.end_time = mock.sentinel.end_time
+        args.chunk_size = mock.sentinel.chunk_size
+        args.resume = False
+        args.compression = mock.sentinel.compression
         mock_logging = mock.Mock()
         self.mock_app.client_manager.coriolis.logging.get = mock_logging
 
@@ -122,7 +127,59 @@ class DownloadCoriolisLogTestCase(test_base.CoriolisBaseTestCase):
             mock.sentinel.log_name,
             mock.sentinel.out_file,
             start_time=mock.sentinel.start_time,
-            end_time=mock.sentinel.end_time
+            end_time=mock.sentinel.end_time,
+            chunk_size=mock.sentinel.chunk_size,
+            resume=False,
+            compression=mock.sentinel.compression
+        )
+
+    def test_take_action_missing_out_file(self):
+        args = mock.Mock()
+        args.all = False
+        args.log_name = mock.sentinel.log_name
+        args.out_file = None
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.logger.take_action,
+            args
+        )
+
+    def test_take_action_all(self):
+        args = mock.Mock()
+        args.all = True
+        args.log_name = None
+        args.out_dir = mock.sentinel.out_dir
+        args.start_time = mock.sentinel.start_time
+        args.end_time = mock.sentinel.end_time
+        args.concurrency = mock.sentinel.concurrency
+        args.chunk_size = mock.sentinel.chunk_size
+        args.resume = True
+        args.compression = mock.sentinel.compression
+        mock_logging = self.mock_app.client_manager.coriolis.logging
+
+        self.logger.take_action(args)
+
+        mock_logging.download_all.assert_called_once_with(
+            mock.sentinel.out_dir,
+            start_time=mock.sentinel.start_time,
+            end_time=mock.sentinel.end_time,
+            concurrency=mock.sentinel.concurrency,
+            chunk_size=mock.sentinel.chunk_size,
+            resume=True,
+            compression=mock.sentinel.compression
+        )
+        mock_logging.get.assert_not_called()
+
+    def test_take_action_all_with_log_name(self):
+        args = mock.Mock()
+        args.all = True
+        args.log_name = mock.sentinel.log_name
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.logger.take_action,
+            args
         )
 
 
@@ -152,6 +209,9 @@ class StreamCoriolisLogTestCase(test_base.CoriolisBaseTestCase):
         args = mock.Mock()
         args.log_name = mock.sentinel.log_name
         args.severity = "INFO"
+        args.queue_size = mock.sentinel.queue_size
+        args.drop_policy = mock.sentinel.drop_policy
+        args.max_reconnects = mock.sentinel.max_reconnects
         mock_logging = mock.Mock()
         self.mock_app.client_manager.coriolis.logging.stream = mock_logging
 
@@ -159,5 +219,8 @@ class StreamCoriolisLogTestCase(test_base.CoriolisBaseTestCase):
 
         mock_logging.assert_called_once_with(
             app_name=mock.sentinel.log_name,
-            severity=6
+            severity=6,
+            queue_size=mock.sentinel.queue_size,
+            drop_policy=mock.sentinel.drop_policy,
+            max_reconnects=mock.sentinel.max_reconnects
         )
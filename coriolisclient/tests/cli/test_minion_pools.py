@@ -278,6 +278,7 @@ class CreateMinionPoolTestCase(test_base.CoriolisBaseTestCase):
             mock.sentinel.minion_retention_strategy
         args.notes = mock.sentinel.notes
         args.skip_allocation = mock.sentinel.skip_allocation
+        args.validate = mock.sentinel.validate
         args.endpoint_id = mock.sentinel.endpoint_id
         mock_endpoints = mock.Mock()
         mock_endpoints.get_endpoint_id_for_name.return_value = \
@@ -308,7 +309,8 @@ class CreateMinionPoolTestCase(test_base.CoriolisBaseTestCase):
             minion_max_idle_time=mock.sentinel.minion_max_idle_time,
             minion_retention_strategy=mock.sentinel.minion_retention_strategy,
             notes=mock.sentinel.notes,
-            skip_allocation=mock.sentinel.skip_allocation
+            skip_allocation=mock.sentinel.skip_allocation,
+            validate=mock.sentinel.validate
         )
         mock_get_formatted_entity.assert_called_once_with(
             mock_minion_pool.create.return_value)
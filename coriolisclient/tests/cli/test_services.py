@@ -112,6 +112,9 @@ class CreateServiceTestCase(test_base.CoriolisBaseTestCase):
         args.topic = mock.sentinel.topic
         args.enabled = True
         args.regions = mock.sentinel.regions
+        (self.mock_app.client_manager.coriolis.regions.
+         get_regions_by_name_or_id.return_value) = [
+            mock.Mock(id=mock.sentinel.region_id)]
         mock_services = mock.Mock()
         self.mock_app.client_manager.coriolis.services = mock_services
 
@@ -126,7 +129,7 @@ class CreateServiceTestCase(test_base.CoriolisBaseTestCase):
             mock.sentinel.binary,
             topic=mock.sentinel.topic,
             enabled=True,
-            regions=mock.sentinel.regions
+            regions=[mock.sentinel.region_id]
         )
         mock_get_formatted_entity.assert_called_once_with(
             mock_services.create.return_value)
@@ -167,11 +170,14 @@ class UpdateServiceTestCase(test_base.CoriolisBaseTestCase):
         args.id = mock.sentinel.id
         args.enabled = True
         args.regions = mock.sentinel.regions
+        (self.mock_app.client_manager.coriolis.regions.
+         get_regions_by_name_or_id.return_value) = [
+            mock.Mock(id=mock.sentinel.region_id)]
         mock_services = mock.Mock()
         self.mock_app.client_manager.coriolis.services = mock_services
         expected_updated_values = {
             "enabled": True,
-            "mapped_regions": mock.sentinel.regions,
+            "mapped_regions": [mock.sentinel.region_id],
         }
 
         result = self.service.take_action(args)
@@ -259,6 +259,34 @@ class CoriolisTestCase(test_base.CoriolisBaseTestCase):
                 args
             )
 
+    @mock.patch.object(client, 'Client')
+    def test_create_client_cache_dir(self, mock_Client):
+        args = CustomMock()
+        args.no_auth = True
+        args.endpoint = "mock_endpoint"
+        args.os_project_id = "mock_project_id"
+        args.cache_dir = "mock_cache_dir"
+
+        self.coriolis.create_client(args)
+
+        mock_Client.assert_called_once_with(
+            endpoint="mock_endpoint", project_id="mock_project_id",
+            verify=True, cache_dir="mock_cache_dir")
+
+    @mock.patch.object(client, 'Client')
+    def test_create_client_lazy_load_policy(self, mock_Client):
+        args = CustomMock()
+        args.no_auth = True
+        args.endpoint = "mock_endpoint"
+        args.os_project_id = "mock_project_id"
+        args.lazy_load_policy = "forbid"
+
+        self.coriolis.create_client(args)
+
+        mock_Client.assert_called_once_with(
+            endpoint="mock_endpoint", project_id="mock_project_id",
+            verify=True, lazy_load_policy="forbid")
+
     @ddt.data(
         {
             "args": {
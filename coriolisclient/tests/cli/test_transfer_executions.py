@@ -11,6 +11,7 @@ from cliff import show
 from coriolisclient.cli import formatter
 from coriolisclient.cli import transfer_executions
 from coriolisclient.tests import test_base
+from coriolisclient.v1 import execution_watcher
 
 
 class TransferExecutionFormatterTestCase(test_base.CoriolisBaseTestCase):
@@ -300,13 +301,17 @@ class ShowTransferExecutionTestCase(test_base.CoriolisBaseTestCase):
 
     @mock.patch.object(transfer_executions.TransferExecutionDetailFormatter,
                        'get_formatted_entity')
+    @mock.patch.object(transfer_executions.TransferExecutionDetailFormatter,
+                       '__init__', return_value=None)
     def test_take_action(
         self,
+        mock_init,
         mock_get_formatted_entity
     ):
         args = mock.Mock()
         args.transfer = mock.sentinel.transfer
         args.id = mock.sentinel.id
+        args.since = "10"
         execution = mock.Mock()
         self.mock_app.client_manager.coriolis.transfer_executions.get = \
             execution
@@ -318,10 +323,66 @@ class ShowTransferExecutionTestCase(test_base.CoriolisBaseTestCase):
             result
         )
         execution.assert_called_once_with(args.transfer, args.id)
+        mock_init.assert_called_once_with(since=10)
         mock_get_formatted_entity.assert_called_once_with(
             execution.return_value)
 
 
+class WatchTransferExecutionTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Watch Transfer Execution."""
+
+    def setUp(self):
+        self.mock_app = mock.Mock()
+        super(WatchTransferExecutionTestCase, self).setUp()
+        self.transfer = transfer_executions.WatchTransferExecution(
+            self.mock_app, mock.sentinel.app_args)
+
+    def test_format_event(self):
+        task = {"id": "task1", "task_type": "DEPLOY", "instance": "vm1"}
+        events = [
+            execution_watcher.WatchEvent(
+                execution_watcher.EVENT_EXECUTION_STATUS, None, "RUNNING"),
+            execution_watcher.WatchEvent(
+                execution_watcher.EVENT_TASK_STATUS, task, "COMPLETED"),
+            execution_watcher.WatchEvent(
+                execution_watcher.EVENT_PROGRESS_UPDATE, task,
+                {"created_at": "t0", "message": "mock message"}),
+            execution_watcher.WatchEvent(
+                execution_watcher.EVENT_LOG, {"id": "task1"},
+                {"message": "mock log"}),
+        ]
+
+        result = [self.transfer._format_event(event) for event in events]
+
+        self.assertEqual(
+            ["Execution status: RUNNING",
+             "Task DEPLOY (vm1): COMPLETED",
+             "Task DEPLOY (vm1): t0 mock message",
+             "Log: mock log"],
+            result)
+
+    def test_take_action(self):
+        args = mock.Mock()
+        mock_watch = (
+            self.mock_app.client_manager.coriolis.transfer_executions.watch)
+        event = execution_watcher.WatchEvent(
+            execution_watcher.EVENT_EXECUTION_STATUS, None, "COMPLETED")
+
+        async def _events():
+            yield event
+
+        mock_watch.return_value = _events()
+
+        self.transfer.take_action(args)
+
+        mock_watch.assert_called_once_with(
+            args.transfer, args.id, logs=args.logs,
+            reconcile_interval=args.reconcile_interval,
+            full_reconcile_interval=args.full_reconcile_interval)
+        self.mock_app.stdout.write.assert_called_once_with(
+            "Execution status: COMPLETED%s" % os.linesep)
+
+
 class CancelTransferExecutionTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Cancel Transfer Execution."""
 
@@ -447,6 +508,7 @@ class ListTransferExecutionTestCase(test_base.CoriolisBaseTestCase):
             sort_keys=mock.sentinel.sort_keys,
             sort_dirs=mock.sentinel.sort_dirs,
             filters={'status': args.status},
+            fields=transfer_executions.TransferExecutionFormatter.fields,
         )
         mock_list_objects.assert_called_once_with(
             mock_transfer_list.return_value)
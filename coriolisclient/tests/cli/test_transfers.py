@@ -11,6 +11,7 @@ from coriolisclient.cli import transfer_executions
 from coriolisclient.cli import transfers
 from coriolisclient.cli import utils as cli_utils
 from coriolisclient.tests import test_base
+from coriolisclient.v1 import transfers as v1_transfers
 
 
 class TransferFormatterTestCase(test_base.CoriolisBaseTestCase):
@@ -211,6 +212,28 @@ class TransferDetailFormatterTestCase(test_base.CoriolisBaseTestCase):
             result
         )
 
+    def test_get_formatted_data_embedded_executions(self):
+        mock_manager = mock.Mock()
+        info = dict.fromkeys([
+            "id", "created_at", "updated_at", "reservation_id", "notes",
+            "origin_endpoint_id", "origin_minion_pool_id",
+            "destination_endpoint_id", "destination_minion_pool_id",
+            "clone_disks", "skip_os_morphing", "info"])
+        info["instances"] = []
+        info["executions"] = [
+            {"id": "id2", "status": "RUNNING", "created_at": "date2"},
+            {"id": "id1", "status": "COMPLETED", "created_at": "date1"}]
+        obj = v1_transfers.Transfer(mock_manager, info, loaded=True)
+
+        result = self.transfer._get_formatted_data(obj)
+        del info["executions"]
+        result_no_executions = self.transfer._get_formatted_data(obj)
+
+        self.assertEqual(
+            ("id1 COMPLETED\nid2 RUNNING", ""),
+            (result[-2], result_no_executions[-2]))
+        mock_manager.get.assert_not_called()
+
 
 class CreateTransferTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Create Transfer."""
@@ -261,6 +284,7 @@ class CreateTransferTestCase(test_base.CoriolisBaseTestCase):
         ]
         args.clone_disks = True
         args.skip_os_morphing = False
+        args.validate = True
         mock_endpoints = mock.Mock()
         mock_transfers = mock.Mock()
         self.mock_app.client_manager.coriolis.endpoints = mock_endpoints
@@ -299,7 +323,7 @@ class CreateTransferTestCase(test_base.CoriolisBaseTestCase):
             instance_osmorphing_minion_pool_mappings={
                 'instance_id1': 'pool_id1', 'instance_id2': 'pool_id2'},
             user_scripts=mock_compose_user_scripts.return_value,
-            clone_disks=True, skip_os_morphing=False,
+            clone_disks=True, skip_os_morphing=False, validate=True,
         )
         mock_get_formatted_entity.assert_called_once_with(
             mock_transfers.return_value)
@@ -330,8 +354,7 @@ class ShowTransferTestCase(test_base.CoriolisBaseTestCase):
         args.id = mock.sentinel.id
         args.show_instances_data = mock.sentinel.show_instances_data
         coriolis = self.mock_app.client_manager.coriolis
-        mock_get = coriolis.transfers.get
-        mock_list = coriolis.transfer_executions.list
+        mock_get = coriolis.transfers.get_with_executions
         mock_formatter = mock_formatter_class.return_value
 
         result = self.transfer.take_action(args)
@@ -342,14 +365,11 @@ class ShowTransferTestCase(test_base.CoriolisBaseTestCase):
         )
         mock_get.assert_called_once_with(
             mock.sentinel.id,
-            include_task_info=mock.sentinel.show_instances_data)
-        mock_list.assert_called_once_with(
-            mock.sentinel.id,
-            limit=transfers.TRANSFER_SHOW_EXECUTIONS_LIMIT,
-            sort_keys=["number"], sort_dirs=["desc"])
+            include_task_info=mock.sentinel.show_instances_data,
+            executions_limit=transfers.TRANSFER_SHOW_EXECUTIONS_LIMIT)
+        coriolis.transfer_executions.list.assert_not_called()
         mock_formatter_class.assert_called_once_with(
-            mock.sentinel.show_instances_data,
-            executions=mock_list.return_value)
+            mock.sentinel.show_instances_data)
         mock_formatter.get_formatted_entity.assert_called_once_with(
             mock_get.return_value)
 
@@ -468,6 +488,7 @@ class ListTransferTestCase(test_base.CoriolisBaseTestCase):
             sort_keys=mock.sentinel.sort_keys,
             sort_dirs=mock.sentinel.sort_dirs,
             filters={'status': args.status},
+            fields=transfers.TransferFormatter.fields,
         )
 
 
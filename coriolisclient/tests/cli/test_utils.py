@@ -57,6 +57,27 @@ class UtilsTestCase(test_base.CoriolisBaseTestCase):
             result
         )
 
+    def test_get_region_ids_from_args(self):
+        mock_coriolis = mock.Mock()
+        mock_coriolis.regions.get_regions_by_name_or_id.return_value = [
+            mock.Mock(id=mock.sentinel.id1), mock.Mock(id=mock.sentinel.id2)]
+
+        result = utils.get_region_ids_from_args(
+            mock_coriolis, [mock.sentinel.region1, mock.sentinel.region2])
+
+        self.assertEqual([mock.sentinel.id1, mock.sentinel.id2], result)
+        (mock_coriolis.regions.get_regions_by_name_or_id.
+         assert_called_once_with(
+             [mock.sentinel.region1, mock.sentinel.region2]))
+
+    def test_get_region_ids_from_args_none(self):
+        mock_coriolis = mock.Mock()
+
+        result = utils.get_region_ids_from_args(mock_coriolis, [])
+
+        self.assertEqual([], result)
+        mock_coriolis.regions.get_regions_by_name_or_id.assert_not_called()
+
     def test_format_mapping(self):
         mapping = {
             "mapping1": "mock_mapping1",
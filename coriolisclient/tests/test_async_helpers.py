@@ -0,0 +1,91 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import asyncio
+from concurrent import futures
+from unittest import mock
+
+from coriolisclient import async_helpers
+from coriolisclient import client
+from coriolisclient.tests import test_base
+
+
+class AsyncHelpersTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis asyncio helpers."""
+
+    @mock.patch.object(client, "_HTTPClient")
+    def setUp(self, mock_HTTPClient):
+        super(AsyncHelpersTestCase, self).setUp()
+        self.session = mock.Mock()
+        self.executor = futures.ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+        self.client = async_helpers.wrap_client(
+            client.Client(session=self.session), executor=self.executor)
+
+    def test_wrap_client(self):
+        self.assertIsInstance(
+            self.client.transfers, async_helpers._AsyncManager)
+        self.assertIsInstance(
+            self.client.transfer_executions, async_helpers._AsyncManager)
+        self.assertIs(self.executor, self.client.transfers._executor)
+        self.session.session.mount.assert_not_called()
+
+    @mock.patch.object(client, "_HTTPClient")
+    def test_wrap_client_default_executor(self, mock_HTTPClient):
+        wrapped = async_helpers.wrap_client(
+            client.Client(session=self.session))
+        manager = wrapped.transfers._manager
+
+        with mock.patch.object(manager, "get") as mock_get:
+            result = asyncio.run(wrapped.transfers.get(mock.sentinel.transfer))
+
+        self.assertIsNone(wrapped.transfers._executor)
+        self.assertEqual(mock_get.return_value, result)
+
+    def test_manager_method(self):
+        manager = self.client.transfers._manager
+        with mock.patch.object(manager, "get") as mock_get:
+            result = asyncio.run(
+                self.client.transfers.get(mock.sentinel.transfer))
+
+        self.assertEqual(mock_get.return_value, result)
+        mock_get.assert_called_once_with(mock.sentinel.transfer)
+
+    def test_manager_method_error(self):
+        manager = self.client.transfers._manager
+        with mock.patch.object(manager, "get") as mock_get:
+            mock_get.side_effect = ValueError("mock error")
+            self.assertRaises(
+                ValueError,
+                asyncio.run,
+                self.client.transfers.get(mock.sentinel.transfer))
+
+    def test_manager_attributes(self):
+        manager = self.client.transfers._manager
+        self.assertEqual(
+            (manager.client, manager.resource_class, manager._paginate),
+            (self.client.transfers.client,
+             self.client.transfers.resource_class,
+             self.client.transfers._paginate)
+        )
+
+    def test_manager_generator_method(self):
+        manager = self.client.deployments._manager
+
+        async def _collect():
+            items = await self.client.deployments.iter_all()
+            return [item async for item in items]
+
+        with mock.patch.object(manager, "iter_all") as mock_iter_all:
+            mock_iter_all.return_value = (i for i in range(3))
+            result = asyncio.run(_collect())
+
+        self.assertEqual([0, 1, 2], result)
+
+    def test_async_iterator_aclose(self):
+        iterator = mock.Mock()
+        async_iter = async_helpers._AsyncIterator(iterator, self.executor)
+
+        asyncio.run(async_iter.aclose())
+
+        iterator.close.assert_called_once_with()
@@ -3,10 +3,15 @@
 
 """Defines base class for all tests."""
 
+import gc
+import json
+import pickle
+
 from keystoneauth1 import exceptions as keystoneauth_exceptions
 from oslotest import base as test_base
 from oslotest import mock_fixture
 from unittest import mock
+import yaml
 
 from coriolisclient import base
 from coriolisclient import exceptions
@@ -99,6 +104,83 @@ class BaseTestCase(CoriolisBaseTestCase):
             )
 
 
+class JSONItemStreamTestCase(CoriolisBaseTestCase):
+    """Test suite for the incremental JSON list parser."""
+
+    def _chunk(self, body, size):
+        raw = json.dumps(body).encode()
+        return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+    def test_iter_response_key(self):
+        body = {
+            "other": {"nested": [1, 2, {"key": "value"}]},
+            "items": [{"id": i, "num": 1234.5, "name": "\u00e9" * i}
+                      for i in range(10)],
+            "trailing": 12345,
+        }
+        for size in (1, 3, 16, 4096):
+            result = list(base._JSONItemStream(
+                self._chunk(body, size), response_key="items"))
+            self.assertEqual(body["items"], result)
+
+    def test_iter_no_response_key(self):
+        body = [1, 22, 333, {"id": "id1"}]
+        for size in (1, 2, 4096):
+            result = list(base._JSONItemStream(self._chunk(body, size)))
+            self.assertEqual(body, result)
+
+    def test_iter_large_item(self):
+        body = {"items": [{"data": ["x" * 10] * 1000}]}
+        stream = base._JSONItemStream(
+            self._chunk(body, 16), response_key="items")
+
+        with mock.patch.object(
+                stream._decoder, "raw_decode",
+                wraps=stream._decoder.raw_decode) as mock_raw_decode:
+            result = list(stream)
+
+        self.assertEqual(body["items"], result)
+        # NOTE: the item spans ~900 chunks, but is only re-parsed as the
+        # buffered data doubles:
+        self.assertLess(mock_raw_decode.call_count, 20)
+
+    def test_iter_values_key(self):
+        body = {"storage": {"storage_backends": [{"name": "lvm"}]}}
+
+        result = list(base._JSONItemStream(
+            self._chunk(body, 4), response_key="storage",
+            values_key="storage_backends"))
+
+        self.assertEqual([{"name": "lvm"}], result)
+
+    def test_iter_empty_list(self):
+        result = list(base._JSONItemStream(
+            [b'{"items": [ ]}'], response_key="items"))
+
+        self.assertEqual([], result)
+
+    def test_iter_missing_response_key(self):
+        self.assertRaises(
+            KeyError,
+            list,
+            base._JSONItemStream([b'{"items": []}'], response_key="missing")
+        )
+
+    def test_iter_truncated_body(self):
+        self.assertRaises(
+            ValueError,
+            list,
+            base._JSONItemStream([b'{"items": [1, '], response_key="items")
+        )
+
+    def test_iter_malformed_body(self):
+        self.assertRaises(
+            ValueError,
+            list,
+            base._JSONItemStream([b'["items"]'], response_key="items")
+        )
+
+
 class ResourceTestCase(CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Resource."""
 
@@ -270,6 +352,239 @@ class ResourceTestCase(CoriolisBaseTestCase):
         )
 
 
+class CompactResourceTestCase(CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client compact Resource."""
+
+    def setUp(self):
+        super(CompactResourceTestCase, self).setUp()
+        self.info = {"id": "mock_id", "nested": {"list": [1, 2]}}
+        self.resource = base.Resource(
+            mock.Mock(), self.info, loaded=True, compact=True)
+
+    def _get_instance_dicts(self):
+        # NOTE: reading `__dict__` would allocate it, so look for it among
+        # the objects referenced by the resource instead:
+        return [obj for obj in gc.get_referents(self.resource)
+                if isinstance(obj, dict) and obj is not self.resource._info]
+
+    def test__init__(self):
+        self.assertEqual(
+            ("mock_id", self.info),
+            (self.resource.id, self.resource._info)
+        )
+        self.assertEqual([], self._get_instance_dicts())
+
+    def test__repr__(self):
+        self.assertEqual(
+            "<Resource id=mock_id, nested={'list': [1, 2]}>",
+            repr(self.resource)
+        )
+        self.assertEqual([], self._get_instance_dicts())
+
+    def test__getattr__missing(self):
+        self.assertRaises(
+            AttributeError,
+            getattr,
+            self.resource,
+            "missing"
+        )
+
+    @mock.patch.object(base.Resource, "get")
+    def test__getattr__lazy_load(self, mock_get):
+        self.resource._loaded = False
+        mock_get.side_effect = lambda: self.resource._add_details(
+            {"attr": "value"})
+
+        self.assertEqual("value", self.resource.attr)
+        mock_get.assert_called_once_with()
+
+    def test_add_details(self):
+        self.resource._add_details({"id": "new_id", "attr": "value"})
+
+        self.assertEqual(
+            ("new_id", "value"),
+            (self.resource.id, self.resource.attr)
+        )
+        self.assertEqual([], self._get_instance_dicts())
+
+    def test_to_dict(self):
+        result = self.resource.to_dict()
+
+        self.assertEqual(self.info, result)
+        result["nested"]["list"].append(3)
+        result["id"] = "other_id"
+        self.assertEqual(
+            {"id": "mock_id", "nested": {"list": [1, 2]}},
+            self.info
+        )
+
+    def test_to_dict_pickle(self):
+        result = pickle.loads(pickle.dumps(self.resource.to_dict()))
+
+        self.assertEqual(dict, type(result))
+        self.assertEqual(self.info, result)
+
+    def test_to_dict_yaml(self):
+        result = self.resource.to_dict()
+
+        self.assertEqual(
+            "id: mock_id\nnested:\n  list:\n  - 1\n  - 2\n",
+            yaml.safe_dump(result))
+        self.assertEqual(self.info, yaml.safe_load(yaml.dump(result)))
+
+    def test_to_dict_no_copy_on_read(self):
+        result = self.resource.to_dict()
+
+        self.assertIs(self.info["nested"], dict.get(result, "nested"))
+        self.assertEqual(
+            '{"id": "mock_id", "nested": {"list": [1, 2]}}',
+            json.dumps(result)
+        )
+
+    def test_to_dict_copies_on_iteration(self):
+        result = self.resource.to_dict()
+
+        for value in result.values():
+            if isinstance(value, dict):
+                value["list"] = []
+
+        self.assertEqual({"list": []}, result["nested"])
+        self.assertEqual({"list": [1, 2]}, self.info["nested"])
+
+    def test_to_dict_copies_on_pop(self):
+        result = self.resource.to_dict()
+
+        result.pop("nested")["list"].append(3)
+
+        self.assertEqual({"list": [1, 2]}, self.info["nested"])
+
+    def test_to_dict_copies_on_merge(self):
+        dict(self.resource.to_dict())["nested"]["list"].append(3)
+        {**self.resource.to_dict()}["nested"]["list"].append(4)
+        updated = {}
+        updated.update(self.resource.to_dict())
+        updated["nested"]["list"].append(5)
+
+        self.assertEqual({"list": [1, 2]}, self.info["nested"])
+
+
+class _PropertyResource(base.Resource):
+
+    @property
+    def details(self):
+        if self._info.get("details") is None:
+            self._lazy_load("details")
+        return self._info.get("details")
+
+
+class LazyLoadTestCase(CoriolisBaseTestCase):
+    """Test suite for the implicit loading of Coriolis resources."""
+
+    def setUp(self):
+        super(LazyLoadTestCase, self).setUp()
+        self.manager = base.BaseManager(mock.Mock())
+        self.manager.resource_class = _PropertyResource
+        self.manager.get = mock.Mock(side_effect=lambda resource_id: (
+            _PropertyResource(
+                self.manager,
+                {"id": resource_id, "details": "details-%s" % resource_id},
+                loaded=True)))
+        self.manager.client.get.return_value.json.return_value = {
+            "items": [{"id": "id1"}, {"id": "id2"}, {"id": "id3"}]}
+
+    def _list(self):
+        return testutils.get_wrapped_function(self.manager._list)(
+            self.manager, "url", "items")
+
+    def test_lazy_load_allow(self):
+        resources = self._list()
+
+        self.assertEqual(
+            ["details-id1", "details-id2"],
+            [res.details for res in resources[:2]])
+        self.assertEqual({"_PropertyResource": 2}, self.manager.lazy_loads)
+
+    @mock.patch.object(base.LOG, "warning")
+    def test_lazy_load_warn(self, mock_warning):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_WARN
+        resource = _PropertyResource(self.manager, {"id": "id1"})
+
+        self.assertEqual("details-id1", resource.details)
+        mock_warning.assert_called_once_with(
+            mock.ANY, "_PropertyResource", "id1", "details")
+
+    def test_lazy_load_forbid(self):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_FORBID
+        resource = _PropertyResource(self.manager, {"id": "id1"})
+
+        ex = self.assertRaises(
+            exceptions.LazyLoadForbidden, getattr, resource, "missing")
+        self.assertEqual(
+            ("_PropertyResource", "id1", "missing"),
+            (ex.resource_type, ex.resource_id, ex.attr))
+        self.manager.get.assert_not_called()
+        self.assertEqual({}, self.manager.lazy_loads)
+
+    def test_lazy_load_forbid_property(self):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_FORBID
+        resource = _PropertyResource(
+            self.manager, {"id": "id1"}, loaded=True)
+
+        ex = self.assertRaises(
+            exceptions.LazyLoadForbidden, getattr, resource, "details")
+        self.assertEqual(
+            ("_PropertyResource", "id1", "details"),
+            (ex.resource_type, ex.resource_id, ex.attr))
+        self.assertFalse(hasattr(resource, "details"))
+        self.manager.get.assert_not_called()
+
+    def test_lazy_load_forbid_attribute_probing(self):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_FORBID
+        resource = _PropertyResource(self.manager, {"id": "id1"})
+
+        self.assertEqual(
+            ("id1", mock.sentinel.default, False),
+            (base.getid(resource),
+             getattr(resource, "missing", mock.sentinel.default),
+             hasattr(resource, "missing")))
+        self.manager.get.assert_not_called()
+
+    def test_lazy_load_batch(self):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_BATCH
+        resources = self._list()
+
+        self.assertEqual("details-id2", resources[1].details)
+        self.assertEqual(
+            ["details-id1", "details-id2", "details-id3"],
+            [res.to_dict()["details"] for res in resources])
+        self.assertEqual(3, self.manager.get.call_count)
+        self.assertEqual({"_PropertyResource": 3}, self.manager.lazy_loads)
+
+    def test_lazy_load_batch_error(self):
+        self.manager.lazy_load_policy = base.LAZY_LOAD_BATCH
+        resources = self._list()
+        get = self.manager.get.side_effect
+
+        def _get(resource_id):
+            if resource_id != "id2":
+                raise exceptions.CoriolisException("mock error")
+            return get(resource_id)
+        self.manager.get.side_effect = _get
+
+        self.assertRaises(
+            exceptions.CoriolisException, getattr, resources[0], "details")
+        self.assertEqual(
+            [None, "details-id2", None],
+            [res.to_dict().get("details") for res in resources])
+        self.assertIsNone(resources[2]._lazy_load_batch)
+
+    def test_lazy_load_no_manager(self):
+        resource = _PropertyResource(None, {"id": "id1"})
+
+        self.assertIsNone(resource.details)
+        self.assertTrue(resource.is_loaded())
+
+
 class BaseManagerTestCase(CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Base Manager."""
 
@@ -278,6 +593,27 @@ class BaseManagerTestCase(CoriolisBaseTestCase):
         super(BaseManagerTestCase, self).setUp()
         self.manager = base.BaseManager(mock_client)
 
+    def test_get_cache_scope(self):
+        self.manager.client.get_endpoint.return_value = "mock_url"
+        self.manager.client.get_project_id.return_value = "mock_project"
+
+        self.assertEqual(
+            "mock_url:mock_project", self.manager._get_cache_scope())
+
+    def test_get_cache_scope_error(self):
+        self.manager.client.get_endpoint.side_effect = Exception
+
+        self.assertIsNone(self.manager._get_cache_scope())
+
+    def test_get_file_cache(self):
+        self.assertIsNone(self.manager._get_file_cache("mock_name"))
+
+        self.manager.cache_dir = "mock_dir"
+        result = self.manager._get_file_cache("mock_name", ttl=10)
+
+        self.assertEqual(
+            ("mock_dir/mock_name.json", 10), (result.path, result.ttl))
+
     def test_list(self):
         self.manager.client.get.return_value.json.return_value = {
             "mock_response_key": {
@@ -304,6 +640,24 @@ class BaseManagerTestCase(CoriolisBaseTestCase):
             mock.call(self.manager, mock.sentinel.data2, loaded=True)
         ])
 
+    def test_list_compact(self):
+        self.manager.compact_resources = True
+        self.manager.client.get.return_value.json.return_value = {
+            "mock_response_key": [{"id": "id1"}]
+        }
+        obj_class = mock.Mock()
+
+        result = testutils.get_wrapped_function(self.manager._list)(
+            self.manager,
+            url=mock.sentinel.url,
+            response_key="mock_response_key",
+            obj_class=obj_class
+        )
+
+        self.assertEqual([obj_class.return_value], result)
+        obj_class.assert_called_once_with(
+            self.manager, {"id": "id1"}, loaded=True, compact=True)
+
     def test_list_with_dict_query(self):
         self.manager.client.get.return_value.json.return_value = {
             "mock_response_key": {"data": []}
@@ -344,6 +698,22 @@ class BaseManagerTestCase(CoriolisBaseTestCase):
             "test-url?some_filter=some_value&"
             "some_other_filter=some_other_value")
 
+    def test_list_with_fields(self):
+        self.manager.client.get.return_value.json.return_value = {
+            "mock_response_key": []
+        }
+        testutils.get_wrapped_function(self.manager._list)(
+            self.manager,
+            url="test-url",
+            response_key="mock_response_key",
+            obj_class=mock.Mock(),
+            query={"some_filter": "some_value"},
+            fields=["name", "status"]
+        )
+        self.manager.client.get.assert_called_once_with(
+            "test-url?some_filter=some_value&fields=id&fields=name&"
+            "fields=status")
+
     def test_list_json(self):
         (self.manager.client.post(mock.sentinel.url, json=True).json.
          return_value) = [mock.sentinel.data]
@@ -365,6 +735,143 @@ class BaseManagerTestCase(CoriolisBaseTestCase):
         self.manager.resource_class.assert_called_once_with(
             self.manager, mock.sentinel.data, loaded=True)
 
+    def test_list_stream(self):
+        mock_resp = self.manager.client.get.return_value
+        mock_resp.iter_content.return_value = [
+            b'{"mock_response_key": [{"id": "id1"}, ',
+            b'{}, {"id": "id2"}]}']
+        obj_class = mock.Mock()
+
+        result = testutils.get_wrapped_function(self.manager._list)(
+            self.manager,
+            url="test-url",
+            response_key="mock_response_key",
+            obj_class=obj_class,
+            query={"limit": 2},
+            stream=True
+        )
+
+        self.manager.client.get.assert_called_once_with(
+            "test-url?limit=2", stream=True)
+        mock_resp.close.assert_not_called()
+        self.assertEqual([obj_class.return_value] * 2, list(result))
+        obj_class.assert_has_calls([
+            mock.call(self.manager, {"id": "id1"}, loaded=True),
+            mock.call(self.manager, {"id": "id2"}, loaded=True)
+        ])
+        mock_resp.iter_content.assert_called_once_with(
+            chunk_size=base.STREAM_CHUNK_SIZE)
+        mock_resp.close.assert_called_once_with()
+
+    def test_list_stream_json(self):
+        mock_resp = self.manager.client.post.return_value
+        mock_resp.iter_content.return_value = [b'[{"id": "id1"}]']
+        self.manager.resource_class = mock.Mock()
+
+        result = testutils.get_wrapped_function(self.manager._list)(
+            self.manager,
+            url=mock.sentinel.url,
+            json=mock.sentinel.json,
+            stream=True
+        )
+
+        self.assertEqual(
+            [self.manager.resource_class.return_value], list(result))
+        self.manager.client.post.assert_called_once_with(
+            mock.sentinel.url, json=mock.sentinel.json, stream=True)
+
+    def test_paginate(self):
+        pages = {
+            None: [mock.Mock(id="id1"), mock.Mock(id="id2")],
+            "id2": [mock.Mock(id="id3"), mock.Mock(id="id4")],
+            "id4": [mock.Mock(id="id5")],
+        }
+        list_method = mock.Mock(
+            side_effect=lambda marker, limit, **kw: pages[marker])
+
+        result = list(self.manager._paginate(
+            list_method, page_size=2, detail=True))
+
+        self.assertEqual(
+            ["id1", "id2", "id3", "id4", "id5"],
+            [obj.id for obj in result]
+        )
+        list_method.assert_has_calls([
+            mock.call(marker=None, limit=2, detail=True),
+            mock.call(marker="id2", limit=2, detail=True),
+            mock.call(marker="id4", limit=2, detail=True),
+        ])
+
+    def test_paginate_empty(self):
+        list_method = mock.Mock(return_value=[])
+
+        result = list(self.manager._paginate(list_method, page_size=2))
+
+        self.assertEqual([], result)
+        list_method.assert_called_once_with(marker=None, limit=2)
+
+    def test_paginate_stops_early(self):
+        list_method = mock.Mock(
+            return_value=[mock.Mock(id="id1"), mock.Mock(id="id2")])
+
+        pager = self.manager._paginate(list_method, page_size=2)
+        next(pager)
+        pager.close()
+
+        # NOTE: at most the prefetched second page may have been requested:
+        self.assertLessEqual(list_method.call_count, 2)
+
+    def test_paginate_error(self):
+        list_method = mock.Mock(side_effect=exceptions.HTTPError("err"))
+
+        self.assertRaises(
+            exceptions.HTTPError,
+            list,
+            self.manager._paginate(list_method)
+        )
+
+    def test_paginate_invalid_page_size(self):
+        self.assertRaises(
+            ValueError,
+            list,
+            self.manager._paginate(mock.Mock(), page_size=0)
+        )
+
+    def test_get_many(self):
+        error = exceptions.HTTPClientError("not found", 404)
+
+        def _get(obj_id):
+            if obj_id == "missing":
+                raise error
+            return "resource-%s" % obj_id
+
+        self.manager.get = mock.Mock(side_effect=_get)
+
+        result = self.manager.get_many(
+            ["id1", "missing", "id2"], max_workers=2)
+
+        self.assertEqual(
+            [
+                base.GetManyResult("id1", "resource-id1", None),
+                base.GetManyResult("missing", None, error),
+                base.GetManyResult("id2", "resource-id2", None),
+            ],
+            result
+        )
+
+    def test_get_many_empty(self):
+        self.manager.get = mock.Mock()
+
+        self.assertEqual([], self.manager.get_many([]))
+        self.manager.get.assert_not_called()
+
+    def test_get_many_not_supported(self):
+        self.assertRaises(
+            NotImplementedError,
+            self.manager.get_many,
+            ["id1"]
+        )
+
     def test_get(self):
         self.manager.client.get().json.return_value = {
             "mock_response_key": mock.sentinel.data
@@ -384,6 +891,22 @@ class BaseManagerTestCase(CoriolisBaseTestCase):
         self.manager.resource_class.assert_called_once_with(
             self.manager, mock.sentinel.data, loaded=True)
 
+    def test_get_with_fields(self):
+        self.manager.client.get.return_value.json.return_value = {}
+        self.manager.resource_class = mock.Mock()
+
+        testutils.get_wrapped_function(self.manager._get)(
+            self.manager, "test-url?include_task_info=true",
+            fields=["id", "name"])
+        testutils.get_wrapped_function(self.manager._get)(
+            self.manager, "test-url", fields=["name"])
+
+        self.manager.client.get.assert_has_calls([
+            mock.call("test-url?include_task_info=true&fields=id&fields=name"),
+            mock.call().json(),
+            mock.call("test-url?fields=id&fields=name"),
+            mock.call().json()])
+
     def test_get_no_response_key(self):
         self.manager.client.get().json.return_value = mock.sentinel.data
         self.manager.resource_class = mock.Mock()
@@ -0,0 +1,132 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import os
+import tempfile
+from unittest import mock
+
+from coriolisclient import cache
+from coriolisclient.tests import test_base
+
+
+class TTLCacheTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the in-memory TTL cache."""
+
+    def test_get_set(self):
+        ttl_cache = cache.TTLCache()
+        ttl_cache.set(mock.sentinel.key, mock.sentinel.value)
+
+        self.assertEqual(
+            (mock.sentinel.value, mock.sentinel.default),
+            (ttl_cache.get(mock.sentinel.key),
+             ttl_cache.get(mock.sentinel.other_key, mock.sentinel.default))
+        )
+
+    @mock.patch.object(cache.time, "monotonic")
+    def test_get_expired(self, mock_monotonic):
+        ttl_cache = cache.TTLCache(ttl=10)
+        mock_monotonic.return_value = 100
+        ttl_cache.set(mock.sentinel.key, mock.sentinel.value)
+
+        mock_monotonic.return_value = 109
+        self.assertEqual(mock.sentinel.value, ttl_cache.get(mock.sentinel.key))
+        mock_monotonic.return_value = 110
+        self.assertIsNone(ttl_cache.get(mock.sentinel.key))
+        self.assertEqual(0, len(ttl_cache))
+
+    def test_maxsize(self):
+        ttl_cache = cache.TTLCache(maxsize=2)
+        ttl_cache.set("key1", 1)
+        ttl_cache.set("key2", 2)
+        ttl_cache.get("key1")
+        ttl_cache.set("key3", 3)
+
+        self.assertEqual(
+            (1, None, 3),
+            (ttl_cache.get("key1"), ttl_cache.get("key2"),
+             ttl_cache.get("key3"))
+        )
+
+    def test_invalidate(self):
+        ttl_cache = cache.TTLCache(ttl=None)
+        ttl_cache.set("key1", 1)
+        ttl_cache.set("key2", 2)
+
+        ttl_cache.invalidate("key1")
+        self.assertEqual(
+            (None, 2), (ttl_cache.get("key1"), ttl_cache.get("key2")))
+        ttl_cache.invalidate()
+        self.assertEqual(0, len(ttl_cache))
+
+    def test_invalidate_if(self):
+        ttl_cache = cache.TTLCache(ttl=None)
+        ttl_cache.set(("endpoint1", "url1"), 1)
+        ttl_cache.set(("endpoint1", "url2"), 2)
+        ttl_cache.set(("endpoint2", "url1"), 3)
+
+        ttl_cache.invalidate_if(lambda key: key[0] == "endpoint1")
+
+        self.assertEqual(1, len(ttl_cache))
+        self.assertEqual(3, ttl_cache.get(("endpoint2", "url1")))
+
+
+class FileCacheTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the on-disk cache."""
+
+    def setUp(self):
+        super(FileCacheTestCase, self).setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "cache", "test.json")
+
+    def test_get_set(self):
+        cache.FileCache(self.path).set("key", {"value": [1, 2]})
+
+        file_cache = cache.FileCache(self.path)
+        self.assertEqual(
+            ({"value": [1, 2]}, mock.sentinel.default),
+            (file_cache.get("key"),
+             file_cache.get("other_key", mock.sentinel.default))
+        )
+
+    @mock.patch.object(cache.time, "time")
+    def test_get_expired(self, mock_time):
+        file_cache = cache.FileCache(self.path, ttl=10)
+        mock_time.return_value = 100
+        file_cache.set("key", "value")
+
+        mock_time.return_value = 110
+        self.assertIsNone(file_cache.get("key"))
+
+    def test_get_unreadable(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as fd:
+            fd.write("invalid")
+
+        self.assertIsNone(cache.FileCache(self.path).get("key"))
+
+    def test_set_unserializable(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.set("key", "value")
+
+        file_cache.set("other_key", object())
+
+        self.assertEqual("value", file_cache.get("key"))
+        self.assertEqual(
+            ["test.json"], os.listdir(os.path.dirname(self.path)))
+
+    def test_invalidate(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.set("key1", 1)
+        file_cache.set("key2", 2)
+
+        file_cache.invalidate("key1")
+        self.assertEqual(
+            (None, 2), (file_cache.get("key1"), file_cache.get("key2")))
+        file_cache.invalidate()
+        self.assertIsNone(file_cache.get("key2"))
+
+    def test_invalidate_missing(self):
+        cache.FileCache(self.path).invalidate()
+
+        self.assertFalse(os.path.exists(self.path))
@@ -38,3 +38,90 @@ class ClientTestCase(test_base.CoriolisBaseTestCase):
         except Exception:
             self.fail("Failed to initialize Client")
         mock_HTTPClient.assert_called_once_with(session=mock.sentinel.session)
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__compact_resources(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, compact_resources=True)
+
+        mock_HTTPClient.assert_called_once_with(session=mock.sentinel.session)
+        self.assertEqual(
+            (True, True),
+            (self.client.transfers.compact_resources,
+             self.client.endpoints.compact_resources)
+        )
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__cache_dir(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, cache_dir=mock.sentinel.cache_dir)
+
+        mock_HTTPClient.assert_called_once_with(session=mock.sentinel.session)
+        self.assertEqual(
+            (mock.sentinel.cache_dir, mock.sentinel.cache_dir),
+            (self.client.endpoints.cache_dir, self.client.providers.cache_dir)
+        )
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__schema_validator(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(session=mock.sentinel.session)
+
+        self.assertEqual(
+            (self.client.schema_validator, self.client.schema_validator),
+            (self.client.transfers.schema_validator,
+             self.client.minion_pools.schema_validator)
+        )
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__transfer_executions_manager(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, compact_resources=True)
+
+        self.assertIs(
+            self.client.transfer_executions,
+            self.client.transfers.executions_manager)
+        self.assertTrue(
+            self.client.transfers.executions_manager.compact_resources)
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__options_cache_ttl(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, options_cache_ttl=None)
+
+        self.assertEqual(
+            (None, None),
+            (self.client.endpoint_networks.options_cache.ttl,
+             self.client.endpoint_source_options.options_cache.ttl)
+        )
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__lazy_load_policy(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, lazy_load_policy="batch")
+
+        self.assertEqual(
+            ("batch", "batch", self.client.lazy_loads),
+            (self.client.transfers.lazy_load_policy,
+             self.client.deployments.lazy_load_policy,
+             self.client.transfers.lazy_loads)
+        )
+        self.assertIs(
+            self.client.lazy_loads, self.client.deployments.lazy_loads)
+
+    def test__init__invalid_lazy_load_policy(self):
+        self.assertRaises(
+            ValueError, coriolis_client.Client,
+            session=mock.sentinel.session, lazy_load_policy="invalid")
+
+    @mock.patch.object(coriolis_client, "_HTTPClient")
+    def test__init__licensing_client(self, mock_HTTPClient):
+        self.client = coriolis_client.Client(
+            session=mock.sentinel.session, licensing_pool_size=4)
+
+        licensing_client = self.client.licensing_client
+        self.assertEqual(4, licensing_client._pool_size)
+        for manager in (self.client.licensing,
+                        self.client.licensing_appliances,
+                        self.client.licensing_reservations,
+                        self.client.licensing_server):
+            self.assertIs(licensing_client, manager._licensing_cli)
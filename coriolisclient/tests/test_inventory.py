@@ -0,0 +1,92 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import os
+import tempfile
+
+from coriolisclient import inventory
+from coriolisclient.tests import test_base
+
+
+class InventorySnapshotTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the local instance inventory snapshots."""
+
+    def setUp(self):
+        super(InventorySnapshotTestCase, self).setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.snapshot = inventory.InventorySnapshot(
+            os.path.join(tmpdir.name, "cache", "inventory.sqlite"))
+        self.vm1 = {"id": "id1", "name": "vm1", "num_cpu": 1}
+        self.vm2 = {"id": "id2", "name": "vm2", "num_cpu": 2}
+
+    def test_sync_initial(self):
+        result = self.snapshot.sync("scope", [self.vm1, self.vm2])
+
+        self.assertEqual(
+            inventory.InventoryDiff([self.vm1, self.vm2], [], [], 0),
+            result)
+        self.assertIsNotNone(self.snapshot.get_synced_at("scope"))
+
+    def test_sync_diff(self):
+        self.snapshot.sync("scope", [self.vm1, self.vm2])
+        vm1_changed = dict(self.vm1, num_cpu=4)
+        vm3 = {"id": "id3", "name": "vm3"}
+
+        result = self.snapshot.sync("scope", [vm1_changed, vm3])
+
+        self.assertEqual(
+            inventory.InventoryDiff([vm3], [self.vm2], [vm1_changed], 0),
+            result)
+        self.assertEqual(
+            [vm1_changed, vm3], self.snapshot.list("scope"))
+
+    def test_sync_unchanged(self):
+        self.snapshot.sync("scope", [self.vm1, self.vm2])
+
+        result = self.snapshot.sync("scope", [self.vm2, self.vm1])
+
+        self.assertEqual(inventory.InventoryDiff([], [], [], 2), result)
+
+    def test_sync_failure_keeps_previous(self):
+        self.snapshot.sync("scope", [self.vm1])
+
+        def _instances():
+            yield self.vm2
+            raise ValueError("mock error")
+
+        self.assertRaises(ValueError, self.snapshot.sync, "scope",
+                          _instances())
+        self.assertEqual([self.vm1], self.snapshot.list("scope"))
+
+    def test_scopes(self):
+        self.snapshot.sync("scope1", [self.vm1])
+        self.snapshot.sync("scope2", [self.vm2])
+
+        self.assertEqual(
+            ([self.vm1], [self.vm2], []),
+            (self.snapshot.list("scope1"), self.snapshot.list("scope2"),
+             self.snapshot.list("scope3")))
+        self.assertIsNone(self.snapshot.get_synced_at("scope3"))
+
+    def test_list_name(self):
+        self.snapshot.sync("scope", [self.vm1, self.vm2])
+
+        self.assertEqual(
+            [self.vm2], self.snapshot.list("scope", name="vm2"))
+
+    def test_get(self):
+        self.snapshot.sync("scope", [self.vm1])
+
+        self.assertEqual(
+            (self.vm1, None),
+            (self.snapshot.get("scope", "id1"),
+             self.snapshot.get("scope", "id2")))
+
+    def test_delete(self):
+        self.snapshot.sync("scope", [self.vm1])
+
+        self.snapshot.delete("scope")
+
+        self.assertEqual([], self.snapshot.list("scope"))
+        self.assertIsNone(self.snapshot.get_synced_at("scope"))
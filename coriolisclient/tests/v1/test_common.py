@@ -1,6 +1,8 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+from unittest import mock
+
 import ddt
 
 from coriolisclient import exceptions
@@ -63,3 +65,150 @@ class CommonTestCase(test_base.CoriolisBaseTestCase):
             param,
             is_json=is_json
         )
+
+    @mock.patch.object(common.adapters, "HTTPAdapter")
+    @mock.patch.object(common.requests, "Session")
+    def test_make_http_session(self, mock_session, mock_adapter):
+        result = common.make_http_session(mock.sentinel.pool_size)
+
+        self.assertEqual(mock_session.return_value, result)
+        mock_adapter.assert_called_once_with(
+            pool_connections=mock.sentinel.pool_size,
+            pool_maxsize=mock.sentinel.pool_size)
+        result.mount.assert_has_calls([
+            mock.call('https://', mock_adapter.return_value),
+            mock.call('http://', mock_adapter.return_value)])
+
+    def test_get_response_chunks(self):
+        resp = mock.Mock(headers={"Content-Encoding": "gzip"})
+
+        self.assertEqual(
+            [(resp.raw.stream.return_value, True),
+             (resp.iter_content.return_value, False)],
+            [common.get_response_chunks(resp, 10, keep_gzip=True),
+             common.get_response_chunks(resp, 10)])
+        resp.raw.stream.assert_called_once_with(10, decode_content=False)
+        resp.iter_content.assert_called_once_with(chunk_size=10)
+
+
+class ListingIndexTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis v1 listing index."""
+
+    def setUp(self):
+        super(ListingIndexTestCase, self).setUp()
+        self.build = mock.Mock(side_effect=lambda: {"a": 1})
+        self.index = common.ListingIndex(self.build, ttl=60)
+
+    def test_get(self):
+        self.assertEqual(({"a": 1}, False), self.index.get())
+        self.assertEqual(({"a": 1}, True), self.index.get())
+        self.assertEqual(({"a": 1}, False), self.index.get(refresh=True))
+        self.assertEqual(2, self.build.call_count)
+
+    def test_get_for(self):
+        self.index.get()
+
+        self.assertEqual({"a": 1}, self.index.get_for(["a"]))
+        self.assertEqual(1, self.build.call_count)
+        self.assertEqual({"a": 1}, self.index.get_for(["a", "b"]))
+        self.assertEqual(2, self.build.call_count)
+
+    def test_invalidate(self):
+        self.index.get()
+        self.index.invalidate()
+        self.index.get()
+
+        self.assertEqual(2, self.build.call_count)
+
+    def test_file_cache(self):
+        file_cache = mock.Mock()
+        file_cache.get.return_value = {"b": 2}
+        index = common.ListingIndex(
+            self.build, ttl=60, get_file_cache=lambda: file_cache,
+            get_scope=lambda: mock.sentinel.scope)
+
+        self.assertEqual(({"b": 2}, True), index.get())
+        self.assertEqual(({"a": 1}, False), index.get(refresh=True))
+        index.invalidate()
+
+        file_cache.get.assert_called_once_with(mock.sentinel.scope)
+        file_cache.set.assert_called_once_with(
+            mock.sentinel.scope, {"a": 1})
+        file_cache.invalidate.assert_called_once_with()
+
+
+class EndpointOptionsManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis v1 memoizing endpoint options manager."""
+
+    def setUp(self):
+        super(EndpointOptionsManagerTestCase, self).setUp()
+        self.manager = common.EndpointOptionsManager(mock.Mock())
+        self.manager.resource_class = common.SourceEnvironment
+        self.func = mock.Mock(return_value={"option": ["value"]})
+
+    def test__memoized(self):
+        result = self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+        result["option"].append("modified")
+
+        self.assertEqual(
+            {"option": ["value"]},
+            self.manager._memoized(
+                mock.sentinel.endpoint, mock.sentinel.url, self.func))
+        self.func.assert_called_once_with()
+
+    def test__memoized_refresh(self):
+        self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+        self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func,
+            refresh=True)
+
+        self.assertEqual(2, self.func.call_count)
+
+    def test__memoized_disabled(self):
+        self.manager.options_cache.ttl = 0
+
+        self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+        self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+
+        self.assertEqual(2, self.func.call_count)
+        self.assertEqual(0, len(self.manager.options_cache))
+
+    def test__memoized_none(self):
+        self.func.return_value = None
+
+        self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+        result = self.manager._memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, self.func)
+
+        self.assertIsNone(result)
+        self.func.assert_called_once_with()
+
+    def test_invalidate_options_cache(self):
+        self.manager._memoized("endpoint1", "url1", self.func)
+        self.manager._memoized("endpoint1", "url2", self.func)
+        self.manager._memoized("endpoint2", "url1", self.func)
+
+        self.manager.invalidate_options_cache("endpoint1")
+        self.assertEqual(1, len(self.manager.options_cache))
+        self.manager.invalidate_options_cache()
+        self.assertEqual(0, len(self.manager.options_cache))
+
+    @mock.patch.object(common.EndpointOptionsManager, "_list")
+    def test__list_memoized(self, mock_list):
+        mock_list.return_value = [
+            common.SourceEnvironment(mock.Mock(), {"name": "option1"})]
+
+        self.manager._list_memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, "options")
+        result = self.manager._list_memoized(
+            mock.sentinel.endpoint, mock.sentinel.url, "options")
+
+        self.assertEqual(mock_list.return_value, result)
+        self.assertTrue(result[0].is_loaded())
+        mock_list.assert_called_once_with(
+            mock.sentinel.url, "options", values_key="values")
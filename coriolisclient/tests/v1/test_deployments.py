@@ -75,7 +75,7 @@ class DeploymentManagerTestCase(test_base.CoriolisBaseTestCase):
             result = self.deployments.list(detail=True)
             self.assertEqual(mock_list.return_value, result)
             mock_list.assert_called_once_with(
-                '/deployments/detail', 'deployments', query=[])
+                '/deployments/detail', 'deployments', query=[], fields=None)
 
     def test_list_with_pagination(self):
         with mock.patch.object(self.deployments, '_list') as mock_list:
@@ -98,7 +98,28 @@ class DeploymentManagerTestCase(test_base.CoriolisBaseTestCase):
             ]
             self.assertEqual(mock_list.return_value, result)
             mock_list.assert_called_once_with(
-                '/deployments/detail', 'deployments', query=exp_query)
+                '/deployments/detail', 'deployments', query=exp_query,
+                fields=None)
+
+    def test_list_stream(self):
+        with mock.patch.object(self.deployments, '_list') as mock_list:
+            result = self.deployments.list(stream=True)
+            self.assertEqual(mock_list.return_value, result)
+            mock_list.assert_called_once_with(
+                '/deployments', 'deployments', query=[], stream=True,
+                fields=None)
+
+    def test_iter_all(self):
+        with mock.patch.object(
+                self.deployments, '_paginate') as mock_paginate:
+            result = self.deployments.iter_all(
+                page_size=mock.sentinel.page_size,
+                sort_keys=[mock.sentinel.sort_key])
+            self.assertEqual(mock_paginate.return_value, result)
+            mock_paginate.assert_called_once_with(
+                self.deployments.list, page_size=mock.sentinel.page_size,
+                detail=False, sort_keys=[mock.sentinel.sort_key],
+                sort_dirs=None, filters=None, fields=None)
 
     def test_get(self):
         deployment = mock.Mock(uuid=DEPLOYMENT_ID)
@@ -106,7 +127,7 @@ class DeploymentManagerTestCase(test_base.CoriolisBaseTestCase):
             result = self.deployments.get(deployment)
             self.assertEqual(mock_get.return_value, result)
             mock_get.assert_called_once_with(
-                f'/deployments/{DEPLOYMENT_ID}', 'deployment')
+                f'/deployments/{DEPLOYMENT_ID}', 'deployment', fields=None)
 
     def test_create_from_transfer(self):
         with mock.patch.object(self.deployments, '_post') as mock_post:
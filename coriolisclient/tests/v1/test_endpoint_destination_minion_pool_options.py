@@ -30,6 +30,10 @@ class EndpointDestinationMinionPoolOptionsManagerTestCase(
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_list.return_value = [
+            endpoint_destination_minion_pool_options.
+            EndpointDestinationMinionPoolOption(
+                mock.Mock(), {"name": "mock_option"})]
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -41,9 +45,10 @@ class EndpointDestinationMinionPoolOptionsManagerTestCase(
             mock_list.return_value,
             result
         )
+        self.assertIsNot(mock_list.return_value[0], result[0])
         mock_list.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/'
              'destination-minion-pool-options'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='
              '&options=WyJvcHRpb24xIiwgIm9wdGlvbjIiXQ=='),
-            'destination_minion_pool_options')
+            'destination_minion_pool_options', values_key='values')
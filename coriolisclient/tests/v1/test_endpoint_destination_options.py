@@ -26,6 +26,9 @@ class EndpointDestinationOptionsManagerTestCase(
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_list.return_value = [
+            endpoint_destination_options.EndpointDestinationOption(
+                mock.Mock(), {"name": "mock_option"})]
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -37,9 +40,10 @@ class EndpointDestinationOptionsManagerTestCase(
             mock_list.return_value,
             result
         )
+        self.assertIsNot(mock_list.return_value[0], result[0])
         mock_list.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/'
              'destination-options'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='
              '&options=WyJvcHRpb24xIiwgIm9wdGlvbjIiXQ=='),
-            'destination_options')
+            'destination_options', values_key='values')
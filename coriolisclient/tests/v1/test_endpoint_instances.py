@@ -1,8 +1,11 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+import os
+import tempfile
 from unittest import mock
 
+from coriolisclient import exceptions
 from coriolisclient.tests import test_base
 from coriolisclient.v1 import common
 from coriolisclient.v1 import endpoint_instances
@@ -113,3 +116,57 @@ class EndpointInstanceManagerTestCase(
             "mock_instance_id",
             env=mock.sentinel.env
         )
+
+    def test_iter_all(self):
+        with mock.patch.object(self.endpoint, "list") as mock_list:
+            mock_list.side_effect = [
+                [endpoint_instances.EndpointInstance(
+                    None, {"id": "id%d" % i}, loaded=True)
+                 for i in range(2)],
+                []]
+            result = list(self.endpoint.iter_all(
+                mock.sentinel.endpoint, env=mock.sentinel.env,
+                refresh=True, page_size=2))
+
+        self.assertEqual(["id0", "id1"], [r.id for r in result])
+        mock_list.assert_has_calls([
+            mock.call(
+                mock.sentinel.endpoint, env=mock.sentinel.env, marker=None,
+                limit=2, name=None, refresh=True),
+            mock.call(
+                mock.sentinel.endpoint, env=mock.sentinel.env, marker="id1",
+                limit=2, name=None, refresh=False)])
+
+    @mock.patch.object(endpoint_instances.EndpointInstanceManager,
+                       'iter_all')
+    def test_sync_inventory(self, mock_iter_all):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.endpoint.cache_dir = tmpdir.name
+        instance = endpoint_instances.EndpointInstance(
+            self.endpoint, {"id": "id1", "name": "vm1"}, loaded=True)
+        mock_iter_all.return_value = iter([instance])
+
+        result = self.endpoint.sync_inventory(
+            mock.sentinel.endpoint, env={"env": "mock_env"},
+            refresh=True, page_size=10)
+
+        self.assertEqual([{"id": "id1", "name": "vm1"}], result.added)
+        mock_iter_all.assert_called_once_with(
+            mock.sentinel.endpoint, env={"env": "mock_env"}, refresh=True,
+            page_size=10)
+        self.assertTrue(os.path.exists(
+            os.path.join(tmpdir.name, "inventory.sqlite")))
+        self.assertEqual(
+            [instance],
+            self.endpoint.list_inventory(
+                mock.sentinel.endpoint, env={"env": "mock_env"}))
+        self.assertEqual(
+            [], self.endpoint.list_inventory(mock.sentinel.endpoint))
+        self.assertIsNotNone(self.endpoint.get_inventory_synced_at(
+            mock.sentinel.endpoint, env={"env": "mock_env"}))
+
+    def test_sync_inventory_no_path(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.endpoint.sync_inventory, mock.sentinel.endpoint)
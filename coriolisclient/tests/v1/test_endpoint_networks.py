@@ -23,6 +23,8 @@ class EndpointNetworkManagerTestCase(
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_list.return_value = [endpoint_networks.EndpointNetwork(
+            mock.Mock(), {"name": "mock_option"})]
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -33,7 +35,8 @@ class EndpointNetworkManagerTestCase(
             mock_list.return_value,
             result
         )
+        self.assertIsNot(mock_list.return_value[0], result[0])
         mock_list.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/networks'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='),
-            'networks')
+            'networks', values_key='values')
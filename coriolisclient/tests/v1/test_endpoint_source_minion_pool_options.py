@@ -30,6 +30,9 @@ class EndpointSourceMinionPoolOptionsManagerTestCase(
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_list.return_value = [
+            endpoint_source_minion_pool_options.EndpointSourceMinionPoolOption(
+                mock.Mock(), {"name": "mock_option"})]
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -41,9 +44,10 @@ class EndpointSourceMinionPoolOptionsManagerTestCase(
             mock_list.return_value,
             result
         )
+        self.assertIsNot(mock_list.return_value[0], result[0])
         mock_list.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/'
              'source-minion-pool-options'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='
              '&options=WyJvcHRpb24xIiwgIm9wdGlvbjIiXQ=='),
-            'source_minion_pool_options')
+            'source_minion_pool_options', values_key='values')
@@ -26,6 +26,8 @@ class EndpointSourceOptionsManagerTestCase(
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_list.return_value = [endpoint_source_options.EndpointSourceOption(
+            mock.Mock(), {"name": "mock_option"})]
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -37,8 +39,9 @@ class EndpointSourceOptionsManagerTestCase(
             mock_list.return_value,
             result
         )
+        self.assertIsNot(mock_list.return_value[0], result[0])
         mock_list.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/source-options'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='
              '&options=WyJvcHRpb24xIiwgIm9wdGlvbjIiXQ=='),
-            'source_options')
+            'source_options', values_key='values')
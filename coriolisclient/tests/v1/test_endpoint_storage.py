@@ -16,13 +16,15 @@ class EndpointStorageManagerTestCase(
         super(EndpointStorageManagerTestCase, self).setUp()
         self.endpoint = endpoint_storage.EndpointStorageManager(mock_client)
 
-    @mock.patch.object(endpoint_storage.EndpointStorageManager, '_list')
+    @mock.patch.object(endpoint_storage.EndpointStorageManager, '_get')
     def test_list(
         self,
-        mock_list
+        mock_get
     ):
         mock_endpoint = mock.Mock()
         mock_endpoint.uuid = '53773ab8-1474-4cf7-bf0c-a496a6595ecb'
+        mock_get.return_value = endpoint_storage.EndpointStorage(
+            mock.Mock(), {"storage_backends": [{"name": "mock_option"}]})
 
         result = self.endpoint.list(
             mock_endpoint,
@@ -30,14 +32,14 @@ class EndpointStorageManagerTestCase(
         )
 
         self.assertEqual(
-            mock_list.return_value,
-            result
+            [{"name": "mock_option"}],
+            [res.to_dict() for res in result]
         )
-        mock_list.assert_called_once_with(
+        self.assertIsInstance(result[0], endpoint_storage.EndpointStorage)
+        mock_get.assert_called_once_with(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/storage'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='),
-            'storage',
-            values_key='storage_backends')
+            'storage')
 
     @mock.patch.object(endpoint_storage.EndpointStorageManager, '_get')
     def test_get_default(
@@ -62,3 +64,35 @@ class EndpointStorageManagerTestCase(
             ('/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/storage'
              '?env=eyJlbnYiOiAibW9ja19lbnYifQ=='),
             'storage')
+
+    @mock.patch.object(endpoint_storage.EndpointStorageManager, '_get')
+    def test_get_default_memoized(
+        self,
+        mock_get
+    ):
+        mock_get.return_value = endpoint_storage.EndpointStorage(
+            mock.Mock(), {"config_default": "mock_default"})
+
+        self.endpoint.get_default(mock.sentinel.endpoint)
+        result = self.endpoint.get_default(mock.sentinel.endpoint)
+
+        self.assertEqual("mock_default", result)
+        mock_get.assert_called_once_with(
+            '/endpoints/sentinel.endpoint/storage', 'storage')
+
+    @mock.patch.object(endpoint_storage.EndpointStorageManager, '_get')
+    def test_list_and_get_default_memoized_together(
+        self,
+        mock_get
+    ):
+        mock_get.return_value = endpoint_storage.EndpointStorage(
+            mock.Mock(), {"storage_backends": [{"name": "mock_option"}],
+                          "config_default": "mock_default"})
+
+        result = (
+            [res.name for res in self.endpoint.list(mock.sentinel.endpoint)],
+            self.endpoint.get_default(mock.sentinel.endpoint))
+
+        self.assertEqual((["mock_option"], "mock_default"), result)
+        mock_get.assert_called_once_with(
+            '/endpoints/sentinel.endpoint/storage', 'storage')
@@ -1,6 +1,9 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+import gzip
+import io
+import tempfile
 from unittest import mock
 
 from coriolisclient import exceptions
@@ -160,6 +163,167 @@ class EndpointManagerTestCase(
             '/endpoints/53773ab8-1474-4cf7-bf0c-a496a6595ecb/actions',
             json={'validate-connection': None})
 
+    def test_get_inventory_csv(self):
+        result = self.endpoint.get_inventory_csv(
+            mock.sentinel.endpoint, source_environment={"env": "mock_env"})
+
+        self.assertEqual(self.mock_client.get.return_value.text, result)
+        self.mock_client.get.assert_called_once_with(
+            '/endpoints/sentinel.endpoint/inventory'
+            '?env=eyJlbnYiOiAibW9ja19lbnYifQ==',
+            headers={'Accept': 'text/csv'})
+
+    def test_get_inventory_csv_invalid_env(self):
+        self.assertRaises(
+            ValueError, self.endpoint.get_inventory_csv,
+            mock.sentinel.endpoint, source_environment="invalid")
+
+    def test_export_inventory_csv(self):
+        mock_resp = self.mock_client.get.return_value
+        mock_resp.headers = {'Content-Length': '8'}
+        mock_resp.iter_content.return_value = [b"a,b\n", b"1,2\n"]
+        progress_callback = mock.Mock()
+        out = io.BytesIO()
+
+        result = self.endpoint.export_inventory_csv(
+            mock.sentinel.endpoint, out, chunk_size=4,
+            progress_callback=progress_callback)
+
+        self.assertEqual(8, result)
+        self.assertEqual(b"a,b\n1,2\n", out.getvalue())
+        self.mock_client.get.assert_called_once_with(
+            '/endpoints/sentinel.endpoint/inventory',
+            headers={'Accept': 'text/csv'}, stream=True)
+        mock_resp.iter_content.assert_called_once_with(chunk_size=4)
+        progress_callback.assert_has_calls(
+            [mock.call(4, 8), mock.call(8, 8)])
+        mock_resp.close.assert_called_once_with()
+
+    def test_export_inventory_csv_compress(self):
+        mock_resp = self.mock_client.get.return_value
+        mock_resp.headers = {
+            'Content-Length': '4', 'Content-Encoding': 'deflate'}
+        mock_resp.iter_content.return_value = [b"a,b\n", b"1,2\n"]
+        progress_callback = mock.Mock()
+        out = io.BytesIO()
+
+        self.endpoint.export_inventory_csv(
+            mock.sentinel.endpoint, out, compress=True,
+            progress_callback=progress_callback)
+
+        self.assertEqual(b"a,b\n1,2\n", gzip.decompress(out.getvalue()))
+        progress_callback.assert_has_calls(
+            [mock.call(4, None), mock.call(8, None)])
+
+    def test_export_inventory_csv_compress_gzip_encoded(self):
+        mock_resp = self.mock_client.get.return_value
+        mock_resp.headers = {
+            'Content-Length': '7', 'Content-Encoding': 'gzip'}
+        mock_resp.raw.stream.return_value = [b"gzipped"]
+        progress_callback = mock.Mock()
+        out = io.BytesIO()
+
+        self.endpoint.export_inventory_csv(
+            mock.sentinel.endpoint, out, compress=True, chunk_size=4,
+            progress_callback=progress_callback)
+
+        self.assertEqual(b"gzipped", out.getvalue())
+        mock_resp.raw.stream.assert_called_once_with(
+            4, decode_content=False)
+        progress_callback.assert_called_once_with(7, 7)
+
+    def test_export_inventory_csv_error(self):
+        mock_resp = self.mock_client.get.return_value
+        mock_resp.headers = {}
+        mock_resp.iter_content.side_effect = ValueError("mock error")
+
+        self.assertRaises(
+            ValueError, self.endpoint.export_inventory_csv,
+            mock.sentinel.endpoint, io.BytesIO())
+        mock_resp.close.assert_called_once_with()
+
+    def _mock_inventory(self, content, chunk_size=7):
+        mock_resp = self.mock_client.get.return_value
+        mock_resp.encoding = None
+        mock_resp.iter_content.return_value = [
+            content[i:i + chunk_size]
+            for i in range(0, len(content), chunk_size)]
+        return mock_resp
+
+    def test_iter_inventory(self):
+        mock_resp = self._mock_inventory(
+            b'ID,Instance Name,Memory MB,Notes\r\n'
+            b'id1,vm1,1024,"multi\r\nline"\r\n'
+            b'\r\n'
+            b'id2,vm\xc3\xa92,2048\r\n')
+
+        result = list(self.endpoint.iter_inventory(
+            mock.sentinel.endpoint, converters={"Memory MB": int}))
+
+        self.assertEqual(
+            [("id1", "vm1", 1024, "multi\r\nline"),
+             ("id2", "vm\xe92", 2048, "")],
+            result)
+        self.assertEqual(
+            ("id", "instance_name", "memory_mb", "notes"),
+            result[0]._fields)
+        self.mock_client.get.assert_called_once_with(
+            '/endpoints/sentinel.endpoint/inventory',
+            headers={'Accept': 'text/csv'}, stream=True)
+        mock_resp.close.assert_called_once_with()
+
+    def test_iter_inventory_line_separators(self):
+        self._mock_inventory(
+            b'ID,Notes\r\n'
+            b'id1,group\x1dsep\r\n'
+            b'id2,line\xe2\x80\xa8sep\x0cfeed\r\n')
+
+        result = list(self.endpoint.iter_inventory(mock.sentinel.endpoint))
+
+        self.assertEqual(
+            [("id1", "group\x1dsep"), ("id2", "line\u2028sep\x0cfeed")],
+            [tuple(row) for row in result])
+
+    def test_iter_inventory_projection_and_filters(self):
+        self._mock_inventory(
+            b'ID,Instance Name,Memory MB,OS Type\n'
+            b'id1,vm1,1024,linux\n'
+            b'id2,vm2,2048,windows\n'
+            b'id3,vm3,4096,linux\n')
+
+        result = list(self.endpoint.iter_inventory(
+            mock.sentinel.endpoint, columns=["id", "Memory MB"],
+            filters={"os_type": "linux",
+                     "memory_mb": lambda value: int(value) > 2000}))
+
+        self.assertEqual([("id3", "4096")], result)
+        self.assertEqual(("id", "memory_mb"), result[0]._fields)
+
+    def test_iter_inventory_limit(self):
+        mock_resp = self._mock_inventory(
+            b'ID,Name\nid1,vm1\nid2,vm2\nid3,vm3\n')
+
+        result = list(self.endpoint.iter_inventory(
+            mock.sentinel.endpoint, limit=2))
+
+        self.assertEqual([("id1", "vm1"), ("id2", "vm2")], result)
+        mock_resp.close.assert_called_once_with()
+
+    def test_iter_inventory_empty(self):
+        self._mock_inventory(b'')
+
+        self.assertEqual(
+            [], list(self.endpoint.iter_inventory(mock.sentinel.endpoint)))
+
+    def test_iter_inventory_unknown_column(self):
+        mock_resp = self._mock_inventory(b'ID,Name\nid1,vm1\n')
+
+        self.assertRaises(
+            exceptions.CoriolisException, list,
+            self.endpoint.iter_inventory(
+                mock.sentinel.endpoint, columns=["missing"]))
+        mock_resp.close.assert_called_once_with()
+
     @mock.patch.object(endpoints.EndpointManager, '_get_endpoint_id_for_name')
     def test_get_endpoint_id_for_name_uuid(
         self,
@@ -260,3 +424,90 @@ class EndpointManagerTestCase(
             self.endpoint._get_endpoint_id_for_name,
             endpoint_name
         )
+
+    def _mock_endpoints(self, mock_list, *names):
+        obj_list = []
+        for (i, name) in enumerate(names):
+            obj = mock.Mock()
+            obj.id = str(i)
+            obj.name = name
+            obj_list.append(obj)
+        mock_list.return_value = obj_list
+
+    @mock.patch.object(endpoints.EndpointManager, 'list')
+    def test__get_endpoint_id_for_name_cached(self, mock_list):
+        self._mock_endpoints(mock_list, 'mock_name0', 'mock_name1')
+
+        result = (
+            self.endpoint._get_endpoint_id_for_name('mock_name0'),
+            self.endpoint._get_endpoint_id_for_name('mock_name1'))
+
+        self.assertEqual(('0', '1'), result)
+        mock_list.assert_called_once_with()
+
+    @mock.patch.object(endpoints.EndpointManager, 'list')
+    def test__get_endpoint_id_for_name_refresh(self, mock_list):
+        self._mock_endpoints(mock_list, 'mock_name0')
+        self.endpoint._get_endpoint_id_for_name('mock_name0')
+        self._mock_endpoints(mock_list, 'mock_name0', 'mock_name1')
+
+        result = self.endpoint._get_endpoint_id_for_name('mock_name1')
+
+        self.assertEqual('1', result)
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(endpoints.EndpointManager, 'list')
+    def test__get_endpoint_id_for_name_expired(self, mock_list):
+        self._mock_endpoints(mock_list, 'mock_name0')
+        self.endpoint._name_index.ttl = 0
+
+        self.endpoint._get_endpoint_id_for_name('mock_name0')
+        self.endpoint._get_endpoint_id_for_name('mock_name0')
+
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(endpoints.EndpointManager, '_delete')
+    @mock.patch.object(endpoints.EndpointManager, '_put')
+    @mock.patch.object(endpoints.EndpointManager, '_post')
+    @mock.patch.object(endpoints.EndpointManager, 'list')
+    def test__get_endpoint_id_for_name_invalidated(
+        self,
+        mock_list,
+        *_
+    ):
+        self._mock_endpoints(mock_list, 'mock_name0')
+        for action in (
+                lambda: self.endpoint.create(
+                    'mock_name1', mock.sentinel.endpoint_type,
+                    mock.sentinel.connection_info, mock.sentinel.description,
+                    mock.sentinel.regions),
+                lambda: self.endpoint.update(
+                    mock.sentinel.endpoint, {"name": "mock_name2"}),
+                lambda: self.endpoint.delete(mock.sentinel.endpoint)):
+            self.endpoint._get_endpoint_id_for_name('mock_name0')
+            action()
+
+        self.endpoint._get_endpoint_id_for_name('mock_name0')
+
+        self.assertEqual(4, mock_list.call_count)
+
+    @mock.patch.object(endpoints.EndpointManager, 'list')
+    def test__get_endpoint_id_for_name_file_cache(self, mock_list):
+        self._mock_endpoints(mock_list, 'mock_name0')
+        self.mock_client.get_endpoint.return_value = "mock_url"
+        self.mock_client.get_project_id.return_value = "mock_project_id"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.endpoint.cache_dir = tmpdir
+            self.endpoint._get_endpoint_id_for_name('mock_name0')
+            other_manager = endpoints.EndpointManager(self.mock_client)
+            other_manager.cache_dir = tmpdir
+
+            result = other_manager._get_endpoint_id_for_name('mock_name0')
+
+            other_manager.invalidate_name_index()
+            self.endpoint._name_index.invalidate()
+            self.endpoint._get_endpoint_id_for_name('mock_name0')
+
+        self.assertEqual('0', result)
+        self.assertEqual(2, mock_list.call_count)
@@ -0,0 +1,153 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import asyncio
+from unittest import mock
+
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import execution_watcher
+from coriolisclient.v1 import transfer_executions
+
+
+class _FakeLoggingClient(object):
+
+    def __init__(self, records, error=None):
+        self.records = records
+        self.error = error
+
+    async def iter_logs(self, app_name=None, severity=None):
+        for record in self.records:
+            yield record
+        if self.error:
+            raise self.error
+        await asyncio.Event().wait()
+
+
+def _execution(status, tasks=None):
+    return transfer_executions.TransferExecution(
+        mock.Mock(),
+        {"id": "execution1", "action_id": "transfer1", "status": status,
+         "tasks": tasks or []},
+        loaded=True)
+
+
+def _task(status, progress_updates=None):
+    return {"id": "task1", "task_type": "DEPLOY", "instance": "vm1",
+            "status": status, "progress_updates": progress_updates or []}
+
+
+class ExecutionStateTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for tracking the changes of watched executions."""
+
+    def test_update(self):
+        state = execution_watcher._ExecutionState()
+        update1 = {"index": 0, "created_at": "t0", "current_step": 1}
+        update1_changed = dict(update1, current_step=2)
+        update2 = {"index": 1, "created_at": "t1"}
+
+        events1 = state.update(
+            _execution("RUNNING", [_task("RUNNING", [update1])]))
+        events2 = state.update(
+            _execution("RUNNING", [_task("RUNNING", [update1])]))
+        events3 = state.update(_execution(
+            "COMPLETED",
+            [_task("COMPLETED", [update2, update1_changed])]))
+
+        self.assertEqual(
+            [("task_status", "RUNNING"), ("progress_update", update1),
+             ("execution_status", "RUNNING")],
+            [(e.type, e.data) for e in events1])
+        self.assertEqual([], events2)
+        self.assertEqual(
+            [("task_status", "COMPLETED"),
+             ("progress_update", update1_changed),
+             ("progress_update", update2),
+             ("execution_status", "COMPLETED")],
+            [(e.type, e.data) for e in events3])
+        self.assertEqual({"task1"}, state.task_ids)
+
+
+class ExecutionWatcherTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the push-based execution watcher."""
+
+    def setUp(self):
+        super(ExecutionWatcherTestCase, self).setUp()
+        self.executions = mock.Mock()
+
+    def _watch(self, logging_client, **kwargs):
+        watcher = execution_watcher.ExecutionWatcher(
+            self.executions, logging_client, "transfer1", "execution1",
+            **kwargs)
+
+        async def _collect():
+            return [event async for event in watcher.watch()]
+
+        return asyncio.run(_collect())
+
+    def test_watch_finished(self):
+        self.executions.get.return_value = _execution("COMPLETED")
+        logging_client = mock.Mock()
+
+        result = self._watch(logging_client)
+
+        self.assertEqual(
+            [("execution_status", "COMPLETED")],
+            [(e.type, e.data) for e in result])
+        logging_client.iter_logs.assert_not_called()
+
+    def test_watch_logs(self):
+        progress_update = {"index": 0, "created_at": "t0"}
+        self.executions.get.side_effect = [
+            _execution("RUNNING", [_task("RUNNING")]),
+            _execution(
+                "COMPLETED", [_task("COMPLETED", [progress_update])]),
+        ]
+        self.executions.list.side_effect = [
+            [_execution("RUNNING")], [_execution("COMPLETED")]]
+        unrelated = {"message": "Unrelated record"}
+        relevant = {"message": "Task 'task1' finished"}
+
+        result = self._watch(
+            _FakeLoggingClient([unrelated, relevant]),
+            reconcile_interval=0.01, full_reconcile_interval=60)
+
+        self.assertEqual(
+            [("task_status", "RUNNING"),
+             ("execution_status", "RUNNING"),
+             ("log", relevant),
+             ("task_status", "COMPLETED"),
+             ("progress_update", progress_update),
+             ("execution_status", "COMPLETED")],
+            [(e.type, e.data) for e in result])
+        self.assertEqual({"id": "task1"}, result[2].task)
+        # NOTE: log records alone must not trigger fetching the execution:
+        self.executions.get.assert_has_calls(
+            [mock.call("transfer1", "execution1")] * 2)
+        self.executions.list.assert_has_calls(
+            [mock.call("transfer1")] * 2)
+
+    def test_watch_polling(self):
+        self.executions.get.side_effect = [
+            _execution("RUNNING"), _execution("COMPLETED")]
+        self.executions.list.side_effect = [
+            [_execution("RUNNING")], [_execution("COMPLETED")]]
+
+        result = self._watch(
+            None, reconcile_interval=0, full_reconcile_interval=60)
+
+        self.assertEqual(
+            ["RUNNING", "COMPLETED"], [e.data for e in result])
+        self.assertEqual(2, self.executions.get.call_count)
+        self.executions.list.assert_has_calls(
+            [mock.call("transfer1")] * 2)
+
+    def test_watch_log_stream_error(self):
+        self.executions.get.side_effect = [
+            _execution("RUNNING"), _execution("ERROR")]
+
+        result = self._watch(
+            _FakeLoggingClient([], error=ValueError("mock error")),
+            reconcile_interval=0, full_reconcile_interval=0)
+
+        self.assertEqual(["RUNNING", "ERROR"], [e.data for e in result])
+        self.executions.list.assert_not_called()
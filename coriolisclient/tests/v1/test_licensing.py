@@ -7,6 +7,7 @@ import requests
 
 from coriolisclient import exceptions
 from coriolisclient.tests import test_base
+from coriolisclient.v1 import common
 from coriolisclient.v1 import licensing
 
 
@@ -21,6 +22,7 @@ class LicensingClientTestCase(
             mock_client, "endpoint_name")
         mock_client.verify = True
         self.licence._cli = mock_client
+        self.licence._session = mock.Mock()
 
     def test_get_licensing_endpoint_url(self):
         self.licence._cli.get_endpoint.return_value = "url/endpoint_url/"
@@ -34,6 +36,44 @@ class LicensingClientTestCase(
         self.licence._cli.get_endpoint.assert_called_once_with(
             service_type="endpoint_name")
 
+    def test_get_licensing_endpoint_url_cached(self):
+        self.licence._cli.get_endpoint.return_value = "url/endpoint_url/"
+
+        self.licence._get_licensing_endpoint_url()
+        result = self.licence._get_licensing_endpoint_url()
+
+        self.assertEqual(
+            "url/endpoint_url",
+            result
+        )
+        self.licence._cli.get_endpoint.assert_called_once_with(
+            service_type="endpoint_name")
+
+    def test_get_licensing_endpoint_url_invalidated(self):
+        self.licence._cli.get_endpoint.side_effect = [
+            "url/endpoint_url/", "url/new_endpoint_url/"]
+
+        self.licence._get_licensing_endpoint_url()
+        self.licence._invalidate_licensing_endpoint_url()
+        result = self.licence._get_licensing_endpoint_url()
+
+        self.assertEqual(
+            "url/new_endpoint_url",
+            result
+        )
+
+    @mock.patch.object(common, "make_http_session")
+    def test_http_session(self, mock_make_http_session):
+        self.licence._session = None
+        self.licence._pool_size = mock.sentinel.pool_size
+
+        result = self.licence._http_session
+        self.assertIs(result, self.licence._http_session)
+
+        self.assertEqual(mock_make_http_session.return_value, result)
+        mock_make_http_session.assert_called_once_with(
+            mock.sentinel.pool_size)
+
     def test_get_licensing_endpoint_url_raises(self):
         self.licence._cli.get_endpoint.side_effect = Exception()
 
@@ -55,7 +95,7 @@ class LicensingClientTestCase(
         mock_resp = mock.Mock()
         mock_resp.ok = True
         mock_method.return_value = mock_resp
-        setattr(requests, "mock_method", mock_method)
+        self.licence._session.mock_method = mock_method
         mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
         result = self.licence._do_req(
             method_name="mock_method",
@@ -85,7 +125,7 @@ class LicensingClientTestCase(
         mock_resp.ok = True
         mock_resp.json.return_value = {"response_key": mock.sentinel.data}
         mock_method.return_value = mock_resp
-        setattr(requests, "mock_method", mock_method)
+        self.licence._session.mock_method = mock_method
         mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
         result = self.licence._do_req(
             method_name="mock_method",
@@ -105,6 +145,25 @@ class LicensingClientTestCase(
             data='{"mock_body": "value"}'
         )
 
+    @mock.patch.object(licensing.LicensingClient,
+                       "_get_licensing_endpoint_url")
+    def test_do_req_connection_error(
+        self,
+        mock_get_licensing_endpoint_url
+    ):
+        self.licence._endpoint_url = mock.sentinel.endpoint_url
+        self.licence._session.get.side_effect = (
+            requests.exceptions.ConnectionError)
+        mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
+
+        self.assertRaises(
+            requests.exceptions.ConnectionError,
+            self.licence._do_req,
+            method_name="GET",
+            resource='url/resource_url/'
+        )
+        self.assertIsNone(self.licence._endpoint_url)
+
     @mock.patch.object(licensing.LicensingClient,
                        "_get_licensing_endpoint_url")
     def test_do_req_error(
@@ -117,7 +176,7 @@ class LicensingClientTestCase(
         mock_resp.json.side_effect = Exception
         mock_resp.raise_for_status.side_effect = exceptions.CoriolisException
         mock_method.return_value = mock_resp
-        setattr(requests, "mock_method", mock_method)
+        self.licence._session.mock_method = mock_method
         mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
 
         with self.assertLogs(level="DEBUG"):
@@ -146,7 +205,7 @@ class LicensingClientTestCase(
         mock_resp.ok = False
         mock_resp.json.return_value = {"error": {"code": 123, "message": ""}}
         mock_method.return_value = mock_resp
-        setattr(requests, "mock_method", mock_method)
+        self.licence._session.mock_method = mock_method
         mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
 
         self.assertRaises(
@@ -174,7 +233,7 @@ class LicensingClientTestCase(
         mock_resp.ok = False
         mock_resp.json.return_value = {"response_key": mock.sentinel.data}
         mock_method.return_value = mock_resp
-        setattr(requests, "mock_method", mock_method)
+        self.licence._session.mock_method = mock_method
         mock_get_licensing_endpoint_url.return_value = 'url/endpoint_url/'
 
         self.assertRaises(
@@ -192,7 +251,7 @@ class LicensingClientTestCase(
         )
 
     def test_do_req_method_error(self):
-        setattr(requests, "mock_method", None)
+        self.licence._session.mock_method = None
 
         self.assertRaises(
             ValueError,
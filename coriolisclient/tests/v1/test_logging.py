@@ -1,20 +1,48 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+import asyncio
 import copy
 import datetime
 import ddt
-import requests
+import gzip
+import json
+import os
 import tempfile
 from unittest import mock
 
 from keystoneauth1.exceptions import http
+from websockets import exceptions as websockets_exceptions
 
 from coriolisclient import exceptions
 from coriolisclient.tests import test_base
+from coriolisclient.v1 import common
 from coriolisclient.v1 import logging
 
 
+class _FakeWebsocket(object):
+
+    def __init__(self, records, error=None):
+        self.records = records
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def _receive(self):
+        for record in self.records:
+            yield json.dumps(record)
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+    def __aiter__(self):
+        return self._receive()
+
+
 @ddt.ddt
 class LoggingClientTestCase(
     test_base.CoriolisBaseTestCase):
@@ -27,6 +55,7 @@ class LoggingClientTestCase(
         mock_client.verify = True
         super(LoggingClientTestCase, self).setUp()
         self.logger = logging.LoggingClient(mock_client)
+        self.logger._session = mock.Mock()
         self.datetime = copy.deepcopy(datetime.datetime)
 
     @mock.patch.object(logging.LoggingClient, '_get_endpoint_url')
@@ -162,18 +191,82 @@ class LoggingClientTestCase(
             result
         )
 
-    @mock.patch.object(requests, "get")
+    def test_token(self):
+        self.logger._cli.get_token.return_value = mock.sentinel.token
+
+        self.assertEqual(mock.sentinel.token, self.logger._token)
+        self.assertEqual(mock.sentinel.token, self.logger._token)
+        self.logger._cli.get_token.assert_called_once_with()
+
+    def test_invalidate_token(self):
+        self.logger._cached_token = mock.sentinel.token
+
+        self.logger._invalidate_token()
+
+        self.assertIsNone(self.logger._cached_token)
+        self.logger._cli.invalidate.assert_called_once_with()
+
+    @mock.patch.object(common, "make_http_session")
+    def test_http_session(self, mock_make_http_session):
+        self.logger._session = None
+
+        result = self.logger._http_session
+        self.assertIs(result, self.logger._http_session)
+
+        self.assertEqual(mock_make_http_session.return_value, result)
+        mock_make_http_session.assert_called_once_with(
+            logging.DEFAULT_POOL_SIZE)
+
+    def test_request(self):
+        self.logger._cached_token = mock.sentinel.token
+        mock_request = self.logger._session.request
+        mock_request.return_value.status_code = 200
+
+        result = self.logger._request(
+            "GET", mock.sentinel.url, stream=True)
+
+        self.assertEqual(mock_request.return_value, result)
+        mock_request.assert_called_once_with(
+            "GET", mock.sentinel.url,
+            headers={"X-Auth-Token": mock.sentinel.token},
+            stream=True, verify=True)
+        self.logger._cli.get_token.assert_not_called()
+
+    def test_request_unauthorized(self):
+        self.logger._cached_token = mock.sentinel.expired_token
+        self.logger._cli.get_token.return_value = mock.sentinel.token
+        unauthorized_resp = mock.Mock(status_code=401)
+        ok_resp = mock.Mock(status_code=200)
+        mock_request = self.logger._session.request
+        mock_request.side_effect = [unauthorized_resp, ok_resp]
+
+        result = self.logger._request("GET", mock.sentinel.url)
+
+        self.assertEqual(ok_resp, result)
+        unauthorized_resp.close.assert_called_once_with()
+        self.logger._cli.invalidate.assert_called_once_with()
+        mock_request.assert_has_calls([
+            mock.call(
+                "GET", mock.sentinel.url,
+                headers={"X-Auth-Token": mock.sentinel.expired_token},
+                verify=True),
+            mock.call(
+                "GET", mock.sentinel.url,
+                headers={"X-Auth-Token": mock.sentinel.token},
+                verify=True)])
+
+    @mock.patch.object(logging.LoggingClient, "_request")
     @mock.patch.object(logging.LoggingClient, "_construct_url")
     @mock.patch.object(logging.LoggingClient, "_convert_period_to_timestamp")
     def test_download_logs(
         self,
         mock_convert_period_to_timestamp,
         mock_construct_url,
-        mock_get
+        mock_request
     ):
         mock_r = mock.Mock()
         mock_r.iter_content.return_value = [b'test_chunk1', b'test_chunk2']
-        mock_get.return_value.__enter__.return_value = mock_r
+        mock_request.return_value.__enter__.return_value = mock_r
         with tempfile.NamedTemporaryFile() as fd:
             self.logger.download_logs(
                 mock.sentinel.app,
@@ -187,12 +280,14 @@ class LoggingClientTestCase(
             result,
             b'test_chunk1test_chunk2'
         )
-        mock_get.assert_called_once_with(
+        mock_request.assert_called_once_with(
+            "GET",
             mock_construct_url.return_value,
-            headers=self.logger._auth_headers,
-            stream=True,
-            verify=True
+            headers={},
+            stream=True
         )
+        mock_r.iter_content.assert_called_once_with(
+            chunk_size=logging.DEFAULT_CHUNK_SIZE)
         mock_construct_url.assert_called_once_with(
             "logs/sentinel.app/",
             {
@@ -201,6 +296,253 @@ class LoggingClientTestCase(
             }
         )
 
+    @ddt.data(
+        (206, b'chunk1chunk2'),
+        (200, b'chunk2'),
+    )
+    @ddt.unpack
+    @mock.patch.object(logging.LoggingClient, "_request")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_download_logs_resume(
+        self,
+        status_code,
+        expected_content,
+        mock_construct_url,
+        mock_request
+    ):
+        mock_r = mock_request.return_value.__enter__.return_value
+        mock_r.status_code = status_code
+        mock_r.iter_content.return_value = [b'chunk2']
+        with tempfile.NamedTemporaryFile() as fd:
+            fd.write(b'chunk1')
+            fd.flush()
+
+            self.logger.download_logs(
+                "app", fd.name, chunk_size=mock.sentinel.chunk_size,
+                resume=True)
+
+            fd.seek(0)
+            result = fd.read()
+
+        self.assertEqual(expected_content, result)
+        mock_request.assert_called_once_with(
+            "GET",
+            mock_construct_url.return_value,
+            headers={"Range": "bytes=6-"},
+            stream=True
+        )
+        mock_r.iter_content.assert_called_once_with(
+            chunk_size=mock.sentinel.chunk_size)
+
+    @mock.patch.object(logging.LoggingClient, "_request")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_download_logs_resume_complete(
+        self,
+        mock_construct_url,
+        mock_request
+    ):
+        mock_r = mock_request.return_value.__enter__.return_value
+        mock_r.status_code = 416
+        with tempfile.NamedTemporaryFile() as fd:
+            fd.write(b'chunk1')
+            fd.flush()
+
+            self.logger.download_logs("app", fd.name, resume=True)
+
+            fd.seek(0)
+            result = fd.read()
+
+        self.assertEqual(b'chunk1', result)
+        mock_r.raise_for_status.assert_not_called()
+        mock_r.iter_content.assert_not_called()
+
+    @mock.patch.object(logging.LoggingClient, "_request")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_download_logs_gzip(self, mock_construct_url, mock_request):
+        mock_r = mock_request.return_value.__enter__.return_value
+        mock_r.headers = {}
+        mock_r.iter_content.return_value = [b'chunk1', b'chunk2']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "app.log.gz")
+            self.logger.download_logs(
+                "app", path, compression=logging.COMPRESSION_GZIP)
+
+            with gzip.open(path, 'rb') as fd:
+                result = fd.read()
+
+        self.assertEqual(b'chunk1chunk2', result)
+        mock_request.assert_called_once_with(
+            "GET",
+            mock_construct_url.return_value,
+            headers={"Accept-Encoding": "gzip"},
+            stream=True
+        )
+
+    @mock.patch.object(logging.LoggingClient, "_request")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_download_logs_gzip_encoded(
+        self,
+        mock_construct_url,
+        mock_request
+    ):
+        mock_r = mock_request.return_value.__enter__.return_value
+        mock_r.headers = {"Content-Encoding": "gzip"}
+        mock_r.raw.stream.return_value = [gzip.compress(b'chunk1')]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "app.log.gz")
+            self.logger.download_logs(
+                "app", path, chunk_size=mock.sentinel.chunk_size,
+                compression=logging.COMPRESSION_GZIP)
+
+            with gzip.open(path, 'rb') as fd:
+                result = fd.read()
+
+        self.assertEqual(b'chunk1', result)
+        mock_r.raw.stream.assert_called_once_with(
+            mock.sentinel.chunk_size, decode_content=False)
+        mock_r.iter_content.assert_not_called()
+
+    @mock.patch.object(logging, "zstandard")
+    @mock.patch.object(logging.LoggingClient, "_request")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_download_logs_zstd(
+        self,
+        mock_construct_url,
+        mock_request,
+        mock_zstandard
+    ):
+        mock_r = mock_request.return_value.__enter__.return_value
+        mock_r.headers = {"Content-Encoding": "gzip"}
+        mock_r.iter_content.return_value = [b'chunk1']
+        mock_writer = (mock_zstandard.ZstdCompressor.return_value.
+                       stream_writer.return_value.__enter__.return_value)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.logger.download_logs(
+                "app", os.path.join(tmpdir, "app.log.zst"),
+                compression=logging.COMPRESSION_ZSTD)
+
+        mock_writer.write.assert_called_once_with(b'chunk1')
+        mock_r.raw.stream.assert_not_called()
+
+    @ddt.data(
+        ("invalid", False),
+        (logging.COMPRESSION_GZIP, True),
+    )
+    @ddt.unpack
+    def test_download_logs_invalid_compression(self, compression, resume):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.logger.download_logs,
+            "app",
+            mock.sentinel.to,
+            resume=resume,
+            compression=compression
+        )
+
+    @mock.patch.object(logging, "zstandard", None)
+    def test_download_logs_zstd_unavailable(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.logger.download_logs,
+            "app",
+            mock.sentinel.to,
+            compression=logging.COMPRESSION_ZSTD
+        )
+
+    @mock.patch.object(logging.LoggingClient, "download_logs")
+    @mock.patch.object(logging.LoggingClient, "list_logs")
+    @mock.patch.object(logging.LoggingClient, "_convert_period_to_timestamp")
+    def test_download_all_logs(
+        self,
+        mock_convert_period_to_timestamp,
+        mock_list_logs,
+        mock_download_logs
+    ):
+        mock_convert_period_to_timestamp.side_effect = [
+            mock.sentinel.start_ts, mock.sentinel.end_ts]
+        mock_list_logs.return_value = [
+            {"log_name": "app1"}, {"log_name": "app2"}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            to_dir = os.path.join(tmpdir, "logs")
+            result = self.logger.download_all_logs(
+                to_dir, start_time="1h", end_time=mock.sentinel.end_time,
+                concurrency=2, chunk_size=mock.sentinel.chunk_size,
+                resume=True)
+
+            self.assertTrue(os.path.isdir(to_dir))
+
+        expected_paths = {
+            "app1": os.path.join(to_dir, "app1.log"),
+            "app2": os.path.join(to_dir, "app2.log"),
+        }
+        self.assertEqual(expected_paths, result)
+        mock_download_logs.assert_has_calls([
+            mock.call("app1", expected_paths["app1"],
+                      start_time=mock.sentinel.start_ts,
+                      end_time=mock.sentinel.end_ts,
+                      chunk_size=mock.sentinel.chunk_size, resume=True,
+                      compression=None),
+            mock.call("app2", expected_paths["app2"],
+                      start_time=mock.sentinel.start_ts,
+                      end_time=mock.sentinel.end_ts,
+                      chunk_size=mock.sentinel.chunk_size, resume=True,
+                      compression=None),
+        ], any_order=True)
+
+    @mock.patch.object(logging.LoggingClient, "download_logs")
+    @mock.patch.object(logging.LoggingClient, "list_logs")
+    def test_download_all_logs_errors(
+        self,
+        mock_list_logs,
+        mock_download_logs
+    ):
+        mock_list_logs.return_value = [
+            {"log_name": "app1"}, {"log_name": "app2"}]
+
+        def _download(app, *args, **kwargs):
+            if app == "app2":
+                raise exceptions.CoriolisException("mock error")
+
+        mock_download_logs.side_effect = _download
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ex = self.assertRaises(
+                exceptions.CoriolisException,
+                self.logger.download_all_logs,
+                tmpdir
+            )
+
+        self.assertIn("app2 (mock error)", str(ex))
+        self.assertEqual(2, mock_download_logs.call_count)
+
+    @mock.patch.object(logging.LoggingClient, "download_logs")
+    @mock.patch.object(logging.LoggingClient, "list_logs")
+    def test_download_all_logs_compressed(
+        self,
+        mock_list_logs,
+        mock_download_logs
+    ):
+        mock_list_logs.return_value = [{"log_name": "app1"}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = self.logger.download_all_logs(
+                tmpdir, compression=logging.COMPRESSION_GZIP)
+
+        expected_path = os.path.join(tmpdir, "app1.log.gz")
+        self.assertEqual({"app1": expected_path}, result)
+        mock_download_logs.assert_called_once_with(
+            "app1", expected_path, start_time=None, end_time=None,
+            chunk_size=logging.DEFAULT_CHUNK_SIZE, resume=False,
+            compression=logging.COMPRESSION_GZIP)
+
+    @mock.patch.object(logging.LoggingClient, "list_logs")
+    def test_download_all_logs_none(self, mock_list_logs):
+        mock_list_logs.return_value = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual({}, self.logger.download_all_logs(tmpdir))
+
     def test_download_logs_no_app(self):
         self.assertRaises(
             exceptions.CoriolisException,
@@ -209,10 +551,11 @@ class LoggingClientTestCase(
             None
         )
 
-    @mock.patch.object(requests, "get")
-    def test_list_logs(self, mock_get):
-        mock_get.return_value.raise_for_status.return_value = None
-        mock_get.return_value.json.return_value = {
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    @mock.patch.object(logging.LoggingClient, "_request")
+    def test_list_logs(self, mock_request, mock_construct_url):
+        mock_request.return_value.raise_for_status.return_value = None
+        mock_request.return_value.json.return_value = {
             "logs": ["mock_log1", "mock_log2"]
         }
 
@@ -222,6 +565,225 @@ class LoggingClientTestCase(
             ['mock_log1', 'mock_log2'],
             result
         )
+        mock_construct_url.assert_called_once_with("logs/")
+        mock_request.assert_called_once_with(
+            "GET", mock_construct_url.return_value)
+
+    def _collect_logs(self, count, **kwargs):
+        async def _collect():
+            records = []
+            async for record in self.logger.iter_logs(**kwargs):
+                records.append(record)
+                if len(records) == count:
+                    break
+            return records
+        return asyncio.run(_collect())
+
+    @mock.patch.object(logging.LoggingClient, "_connect_websocket")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_iter_logs_reconnects(
+        self,
+        mock_construct_url,
+        mock_connect_websocket
+    ):
+        mock_connect_websocket.side_effect = [
+            _FakeWebsocket([{"message": "1"}, {"message": "2"}],
+                           error=OSError("mock error")),
+            _FakeWebsocket([{"message": "3"}]),
+        ]
+        stats = logging.LogStreamStats()
+
+        result = self._collect_logs(
+            3, app_name=mock.sentinel.app_name, backoff=0, stats=stats)
+
+        self.assertEqual(
+            [{"message": "1"}, {"message": "2"}, {"message": "3"}], result)
+        self.assertEqual((3, 1), (stats.received, stats.reconnects))
+        mock_construct_url.assert_called_once_with(
+            "ws", {"app_name": mock.sentinel.app_name, "severity": None},
+            is_websocket=True)
+
+    @mock.patch.object(logging.LoggingClient, "_invalidate_token")
+    @mock.patch.object(logging.LoggingClient, "_connect_websocket")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_iter_logs_unauthorized(
+        self,
+        mock_construct_url,
+        mock_connect_websocket,
+        mock_invalidate_token
+    ):
+        mock_connect_websocket.side_effect = [
+            websockets_exceptions.InvalidStatus(mock.Mock(status_code=401)),
+            _FakeWebsocket([{"message": "1"}]),
+        ]
+
+        result = self._collect_logs(1, backoff=0)
+
+        self.assertEqual([{"message": "1"}], result)
+        mock_invalidate_token.assert_called_once_with()
+
+    @mock.patch.object(logging.LoggingClient, "_connect_websocket")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_iter_logs_max_reconnects(
+        self,
+        mock_construct_url,
+        mock_connect_websocket
+    ):
+        mock_connect_websocket.side_effect = [
+            _FakeWebsocket([{"message": "1"}], error=OSError("mock error")),
+            OSError("mock error"),
+            OSError("mock error"),
+        ]
+
+        async def _collect():
+            return [record async for record in self.logger.iter_logs(
+                max_reconnects=2, backoff=0)]
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            asyncio.run,
+            _collect()
+        )
+        self.assertEqual(3, mock_connect_websocket.call_count)
+
+    @mock.patch.object(logging.LoggingClient, "_connect_websocket")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_iter_logs_max_reconnects_closed_immediately(
+        self,
+        mock_construct_url,
+        mock_connect_websocket
+    ):
+        mock_connect_websocket.side_effect = [
+            _FakeWebsocket([], error=OSError("mock error"))
+            for _ in range(3)]
+
+        async def _collect():
+            return [record async for record in self.logger.iter_logs(
+                max_reconnects=2, backoff=0)]
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            asyncio.run,
+            _collect()
+        )
+        self.assertEqual(3, mock_connect_websocket.call_count)
+
+    @mock.patch.object(logging.LoggingClient, "_connect_websocket")
+    @mock.patch.object(logging.LoggingClient, "_construct_url")
+    def test_iter_logs_handshake_error(
+        self,
+        mock_construct_url,
+        mock_connect_websocket
+    ):
+        mock_connect_websocket.side_effect = (
+            websockets_exceptions.InvalidStatus(mock.Mock(status_code=404)))
+
+        async def _collect():
+            return [record async for record in self.logger.iter_logs()]
+
+        self.assertRaises(
+            websockets_exceptions.InvalidStatus,
+            asyncio.run,
+            _collect()
+        )
+        mock_connect_websocket.assert_called_once()
+
+    def test_format_log_records(self):
+        records = [
+            {"app_name": "app", "message": "msg1"},
+            {"app_name": "app", "message": "msg2", "repeated": 2},
+        ]
+
+        self.assertEqual(
+            "msg1\nmsg2 (repeated 2 times)",
+            self.logger._format_log_records(records, app_name="app"))
+        self.assertIn(
+            "app\x1b[0m>>", self.logger._format_log_records(records))
+
+    @mock.patch("builtins.print")
+    @mock.patch.object(logging.LoggingClient, "_stream_log_batches")
+    def test_stream_logs(self, mock_stream_log_batches, mock_print):
+        async def _batches(**kwargs):
+            yield [{"app_name": "app", "message": "msg1"},
+                   {"app_name": "app", "message": "msg2"}]
+            kwargs["stats"].dropped = 1
+            raise KeyboardInterrupt()
+        mock_stream_log_batches.side_effect = _batches
+
+        with self.assertLogs(logger=logging.LOG, level="WARNING"):
+            stats = self.logger.stream_logs(
+                app_name="app", drop_policy=logging.COALESCE)
+
+        self.assertEqual(1, stats.dropped)
+        mock_print.assert_called_once_with("msg1\nmsg2")
+        mock_stream_log_batches.assert_called_once_with(
+            app_name="app", severity=None,
+            queue_size=logging.DEFAULT_STREAM_QUEUE_SIZE,
+            drop_policy=logging.COALESCE, max_reconnects=None, stats=stats)
+
+
+class LogRecordBufferTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the log stream record buffer."""
+
+    def setUp(self):
+        super(LogRecordBufferTestCase, self).setUp()
+        self.stats = logging.LogStreamStats()
+
+    def _put_all(self, policy, records, maxsize=2):
+        buffer = logging._LogRecordBuffer(maxsize, policy, self.stats)
+        for record in records:
+            buffer.put(record)
+        return asyncio.run(buffer.get_batch())
+
+    def test_drop_oldest(self):
+        result = self._put_all(
+            logging.DROP_OLDEST,
+            [{"message": "1"}, {"message": "2"}, {"message": "3"}])
+
+        self.assertEqual([{"message": "2"}, {"message": "3"}], result)
+        self.assertEqual((3, 1), (self.stats.received, self.stats.dropped))
+
+    def test_drop_newest(self):
+        result = self._put_all(
+            logging.DROP_NEWEST,
+            [{"message": "1"}, {"message": "2"}, {"message": "3"}])
+
+        self.assertEqual([{"message": "1"}, {"message": "2"}], result)
+        self.assertEqual((3, 1), (self.stats.received, self.stats.dropped))
+
+    def test_coalesce(self):
+        result = self._put_all(
+            logging.COALESCE,
+            [{"message": "1"}, {"message": "1"}, {"message": "1"},
+             {"message": "2"}])
+
+        self.assertEqual(
+            [{"message": "1", "repeated": 3}, {"message": "2"}], result)
+        self.assertEqual(
+            (4, 2, 0),
+            (self.stats.received, self.stats.coalesced, self.stats.dropped))
+
+    def test_invalid_policy(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            logging._LogRecordBuffer,
+            1,
+            "invalid",
+            self.stats
+        )
+
+    def test_get_batch_error(self):
+        buffer = logging._LogRecordBuffer(
+            1, logging.DROP_OLDEST, self.stats)
+        buffer.put({"message": "1"})
+        buffer.set_error(exceptions.CoriolisException())
+
+        self.assertEqual([{"message": "1"}], asyncio.run(buffer.get_batch()))
+        self.assertRaises(
+            exceptions.CoriolisException,
+            asyncio.run,
+            buffer.get_batch()
+        )
 
 
 class CoriolisLogDownloadManagerTestCase(
@@ -268,6 +830,30 @@ class CoriolisLogDownloadManagerTestCase(
             mock.sentinel.to,
             start_time=mock.sentinel.start_time,
             end_time=mock.sentinel.end_time,
+            chunk_size=logging.DEFAULT_CHUNK_SIZE,
+            resume=False,
+            compression=None,
+        )
+
+    def test_download_all(self):
+        result = self.logger.download_all(
+            mock.sentinel.to_dir,
+            start_time=mock.sentinel.start_time,
+            end_time=mock.sentinel.end_time,
+        )
+
+        self.assertEqual(
+            self.logger._coriolis_cli.download_all_logs.return_value,
+            result
+        )
+        self.logger._coriolis_cli.download_all_logs.assert_called_once_with(
+            mock.sentinel.to_dir,
+            start_time=mock.sentinel.start_time,
+            end_time=mock.sentinel.end_time,
+            concurrency=logging.DEFAULT_DOWNLOAD_CONCURRENCY,
+            chunk_size=logging.DEFAULT_CHUNK_SIZE,
+            resume=False,
+            compression=None,
         )
 
     def test_stream(self):
@@ -279,4 +865,23 @@ class CoriolisLogDownloadManagerTestCase(
         self.logger._coriolis_cli.stream_logs.assert_called_once_with(
             app_name=mock.sentinel.app_name,
             severity=mock.sentinel.severity,
+            queue_size=logging.DEFAULT_STREAM_QUEUE_SIZE,
+            drop_policy=logging.DROP_OLDEST,
+            max_reconnects=None,
+        )
+
+    def test_iter_logs(self):
+        result = self.logger.iter_logs(
+            app_name=mock.sentinel.app_name,
+            drop_policy=mock.sentinel.drop_policy,
+        )
+
+        self.assertEqual(
+            self.logger._coriolis_cli.iter_logs.return_value,
+            result
+        )
+        self.logger._coriolis_cli.iter_logs.assert_called_once_with(
+            app_name=mock.sentinel.app_name,
+            severity=None,
+            drop_policy=mock.sentinel.drop_policy,
         )
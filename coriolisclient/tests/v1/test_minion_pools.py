@@ -76,6 +76,28 @@ class MinionPoolManagerTestCase(test_base.CoriolisBaseTestCase):
         mock_post.assert_called_once_with(
             "/minion_pools", expected_data, response_key="minion_pool")
 
+    @mock.patch.object(minion_pools.MinionPoolManager, "_post")
+    def test_create_validate(self, mock_post):
+        self.minion_pool.schema_validator = mock.Mock()
+
+        result = self.minion_pool.create(
+            mock.sentinel.name,
+            mock.sentinel.endpoint,
+            mock.sentinel.platform,
+            mock.sentinel.os_type,
+            environment_options=mock.sentinel.environment_options,
+            validate=True,
+        )
+
+        self.assertEqual(
+            mock_post.return_value,
+            result
+        )
+        (self.minion_pool.schema_validator.validate_minion_pool.
+            assert_called_once_with(
+                mock.sentinel.endpoint, mock.sentinel.platform,
+                mock.sentinel.environment_options))
+
     @mock.patch.object(minion_pools.MinionPoolManager, "_put")
     def test_update(self, mock_put):
         result = self.minion_pool.update(
@@ -1,6 +1,7 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+import tempfile
 from unittest import mock
 
 from coriolisclient.tests import test_base
@@ -60,26 +61,106 @@ class ProvidersManagerTestCase(test_base.CoriolisBaseTestCase):
         super(ProvidersManagerTestCase, self).setUp()
         self.provider = providers.ProvidersManager(mock_client)
 
-    @mock.patch.object(providers.ProvidersManager, "_get")
-    def test_list(self, mock_get):
+    def _mock_response(self, body=None, status_code=200, etag=None):
+        resp = mock.Mock()
+        resp.status_code = status_code
+        resp.json.return_value = body
+        resp.headers = {}
+        if etag:
+            resp.headers["ETag"] = etag
+        return resp
+
+    def test_list(self):
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider1": {"types": [1]}}})
+
         result = self.provider.list()
 
         self.assertEqual(
-            mock_get.return_value,
-            result
+            {"provider1": {"types": [1]}},
+            result.to_dict()
         )
-        mock_get.assert_called_once_with("/providers", "providers")
+        self.provider.client.get.assert_called_once_with(
+            "/providers", headers={})
+
+    def test_schemas_list(self):
+        self.provider.client.get.return_value = self._mock_response(
+            {"schemas": {"destination": {"type": "object"}}})
 
-    @mock.patch.object(providers.ProvidersManager, "_get")
-    def test_schemas_list(self, mock_get):
         result = self.provider.schemas_list(
             mock.sentinel.provider_name, mock.sentinel.provider_type)
 
         self.assertEqual(
-            mock_get.return_value,
-            result
+            {"destination": {"type": "object"}},
+            result.to_dict()
         )
-        mock_get.assert_called_once_with(
+        self.provider.client.get.assert_called_once_with(
             '/providers/%s/schemas/%s' % (mock.sentinel.provider_name,
                                           mock.sentinel.provider_type),
-            "schemas")
+            headers={})
+
+    def test_list_cached(self):
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider1": {"types": [1]}}})
+
+        result1 = self.provider.list()
+        result1.provider1["types"].append(2)
+        result2 = self.provider.list()
+
+        self.assertEqual({"provider1": {"types": [1]}}, result2.to_dict())
+        self.provider.client.get.assert_called_once()
+
+    @mock.patch.object(providers.time, "time")
+    def test_list_revalidated(self, mock_time):
+        mock_time.return_value = 100
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider1": {"types": [1]}}}, etag='"etag1"')
+        self.provider.list()
+
+        mock_time.return_value = 100 + providers.DEFAULT_CACHE_TTL
+        self.provider.client.get.return_value = self._mock_response(
+            status_code=304)
+        result = self.provider.list()
+
+        self.assertEqual({"provider1": {"types": [1]}}, result.to_dict())
+        self.provider.client.get.assert_called_with(
+            "/providers", headers={"If-None-Match": '"etag1"'})
+        self.assertEqual(
+            100 + providers.DEFAULT_CACHE_TTL,
+            self.provider.response_cache.get("/providers")["cached_at"])
+
+    def test_list_refresh_changed(self):
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider1": {"types": [1]}}}, etag='"etag1"')
+        self.provider.list()
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider2": {"types": [2]}}}, etag='"etag2"')
+
+        result = self.provider.list(refresh=True)
+
+        self.assertEqual({"provider2": {"types": [2]}}, result.to_dict())
+        self.provider.client.get.assert_called_with(
+            "/providers", headers={"If-None-Match": '"etag1"'})
+        self.assertEqual(
+            '"etag2"',
+            self.provider.response_cache.get("/providers")["etag"])
+
+    def test_list_file_cache(self):
+        self.provider.client.get_endpoint.return_value = "mock_url"
+        self.provider.client.get_project_id.return_value = "mock_project"
+        self.provider.client.get.return_value = self._mock_response(
+            {"providers": {"provider1": {"types": [1]}}})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.provider.cache_dir = tmpdir
+            self.provider.list()
+            other_provider = providers.ProvidersManager(self.provider.client)
+            other_provider.cache_dir = tmpdir
+
+            result = other_provider.list()
+
+            other_provider.invalidate_cache()
+            other_provider.list()
+
+        self.assertEqual({"provider1": {"types": [1]}}, result.to_dict())
+        self.assertEqual(2, self.provider.client.get.call_count)
@@ -194,3 +194,77 @@ class RegionManagerTestCase(test_base.CoriolisBaseTestCase):
                 getattr(self, str(data.get("expected_region")), None),
                 result
             )
+
+    def _mock_regions(self, mock_list, *names):
+        regions = []
+        for (i, name) in enumerate(names):
+            region = mock.Mock()
+            region.id = "id%d" % i
+            region.name = name
+            regions.append(region)
+        mock_list.return_value = regions
+        return regions
+
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_region_by_name_or_id_cached(self, mock_list):
+        mock_regions = self._mock_regions(mock_list, "name0", "name1")
+
+        result = (
+            self.region.get_region_by_name_or_id("name1"),
+            self.region.get_region_by_name_or_id("id0"))
+
+        self.assertEqual((mock_regions[1], mock_regions[0]), result)
+        mock_list.assert_called_once_with()
+
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_regions_by_name_or_id(self, mock_list):
+        mock_regions = self._mock_regions(mock_list, "name0", "name1")
+
+        result = self.region.get_regions_by_name_or_id(
+            ["id1", "name0", "missing"], raise_on_not_found=False)
+
+        self.assertEqual([mock_regions[1], mock_regions[0], None], result)
+        mock_list.assert_called_once_with()
+
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_regions_by_name_or_id_duplicate_name(self, mock_list):
+        self._mock_regions(mock_list, "name0", "name0")
+
+        self.assertRaises(
+            ValueError,
+            self.region.get_regions_by_name_or_id,
+            ["name0"]
+        )
+
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_regions_by_name_or_id_none(self, mock_list):
+        self.assertEqual([], self.region.get_regions_by_name_or_id([]))
+        mock_list.assert_not_called()
+
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_regions_by_name_or_id_refresh(self, mock_list):
+        self._mock_regions(mock_list, "name0")
+        self.region.get_regions_by_name_or_id(["name0"])
+        mock_regions = self._mock_regions(mock_list, "name0", "name1")
+
+        result = self.region.get_regions_by_name_or_id(["name1"])
+
+        self.assertEqual([mock_regions[1]], result)
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(regions.RegionManager, "_delete")
+    @mock.patch.object(regions.RegionManager, "_put")
+    @mock.patch.object(regions.RegionManager, "_post")
+    @mock.patch.object(regions.RegionManager, "list")
+    def test_get_regions_by_name_or_id_invalidated(self, mock_list, *_):
+        self._mock_regions(mock_list, "name0")
+        for action in (
+                lambda: self.region.create("name1"),
+                lambda: self.region.update(mock.sentinel.region, {}),
+                lambda: self.region.delete(mock.sentinel.region)):
+            self.region.get_regions_by_name_or_id(["name0"])
+            action()
+
+        self.region.get_regions_by_name_or_id(["name0"])
+
+        self.assertEqual(4, mock_list.call_count)
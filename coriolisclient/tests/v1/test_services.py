@@ -146,3 +146,77 @@ class ServiceManagerTestCase(test_base.CoriolisBaseTestCase):
                 getattr(self, str(data.get("expected_service")), None),
                 result
             )
+
+    def _mock_services(self, mock_list, *pairs):
+        services = []
+        for (host, topic) in pairs:
+            svc = mock.Mock()
+            svc.host = host
+            svc.topic = topic
+            services.append(svc)
+        mock_list.return_value = services
+        return services
+
+    @mock.patch.object(services.ServiceManager, "list")
+    def test_find_services(self, mock_list):
+        mock_services = self._mock_services(
+            mock_list, ("host1", "topic1"), ("host1", "topic2"),
+            ("host2", "topic1"))
+
+        result = self.service.find_services(
+            [("host2", "topic1"), ["host1", "topic2"], ("host3", "topic1")],
+            raise_on_not_found=False)
+        other_result = self.service.find_service_by_host_and_topic(
+            "host1", "topic1")
+
+        self.assertEqual(
+            ([mock_services[2], mock_services[1], None], mock_services[0]),
+            (result, other_result)
+        )
+        mock_list.assert_called_once_with()
+
+    @mock.patch.object(services.ServiceManager, "list")
+    def test_find_services_none(self, mock_list):
+        self.assertEqual([], self.service.find_services([]))
+        mock_list.assert_not_called()
+
+    @mock.patch.object(services.ServiceManager, "list")
+    def test_find_services_refresh(self, mock_list):
+        self._mock_services(mock_list, ("host1", "topic1"))
+        self.service.find_services([("host1", "topic1")])
+        mock_services = self._mock_services(
+            mock_list, ("host1", "topic1"), ("host2", "topic1"))
+
+        result = self.service.find_services([("host2", "topic1")])
+
+        self.assertEqual([mock_services[1]], result)
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(services.ServiceManager, "list")
+    def test_find_services_expired(self, mock_list):
+        self._mock_services(mock_list, ("host1", "topic1"))
+        self.service._index.ttl = 0
+
+        self.service.find_services([("host1", "topic1")])
+        self.service.find_services([("host1", "topic1")])
+
+        self.assertEqual(2, mock_list.call_count)
+
+    @mock.patch.object(services.ServiceManager, "_delete")
+    @mock.patch.object(services.ServiceManager, "_put")
+    @mock.patch.object(services.ServiceManager, "_post")
+    @mock.patch.object(services.ServiceManager, "list")
+    def test_find_services_invalidated(self, mock_list, *_):
+        self._mock_services(mock_list, ("host1", "topic1"))
+        for action in (
+                lambda: self.service.create(
+                    "host2", mock.sentinel.binary, "topic1",
+                    mock.sentinel.regions),
+                lambda: self.service.update(mock.sentinel.service, {}),
+                lambda: self.service.delete(mock.sentinel.service)):
+            self.service.find_services([("host1", "topic1")])
+            action()
+
+        self.service.find_services([("host1", "topic1")])
+
+        self.assertEqual(4, mock_list.call_count)
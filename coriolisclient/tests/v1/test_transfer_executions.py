@@ -30,6 +30,22 @@ class TransferExecutionTestCase(test_base.CoriolisBaseTestCase):
             )
         )
 
+    def test_tasks_lazy_load(self):
+        manager = transfer_executions.TransferExecutionManager(mock.Mock())
+        execution = transfer_executions.TransferExecution(
+            manager, {"id": "execution1", "action_id": "transfer1"},
+            loaded=True)
+
+        with mock.patch.object(manager, "get") as mock_get:
+            mock_get.return_value = transfer_executions.TransferExecution(
+                manager, {"id": "execution1", "tasks": [{"id": "task1"}]},
+                loaded=True)
+            result = execution.tasks
+
+        self.assertEqual(["task1"], [task.id for task in result])
+        mock_get.assert_called_once_with("transfer1", "execution1")
+        self.assertEqual({"TransferExecution": 1}, manager.lazy_loads)
+
 
 class TransferExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis v1 Transfer Execution Manager."""
@@ -50,7 +66,7 @@ class TransferExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
         )
         mock_list.assert_called_once_with(
             '/transfers/%s/executions' % mock.sentinel.transfer, "executions",
-            query=[])
+            query=[], fields=None)
 
     @mock.patch.object(transfer_executions.TransferExecutionManager, "_list")
     def test_list_with_pagination(self, mock_list):
@@ -77,7 +93,7 @@ class TransferExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
         )
         mock_list.assert_called_once_with(
             '/transfers/%s/executions' % mock.sentinel.transfer, "executions",
-            query=exp_query)
+            query=exp_query, fields=None)
 
     @mock.patch.object(transfer_executions.TransferExecutionManager, "_get")
     def test_get(self, mock_get):
@@ -91,7 +107,7 @@ class TransferExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
         mock_get.assert_called_once_with(
             "/transfers/%s/executions/%s" % (mock.sentinel.transfer,
                                              mock.sentinel.execution),
-            "execution")
+            "execution", fields=None)
 
     @mock.patch.object(transfer_executions.TransferExecutionManager, "_post")
     def test_create(self, mock_post):
@@ -140,3 +156,34 @@ class TransferExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
             "/transfers/%s/executions/%s/actions" % (mock.sentinel.transfer,
                                                      mock.sentinel.execution),
             json={'cancel': {'force': False}})
+
+    @mock.patch.object(transfer_executions.coriolis_logging, "LoggingClient")
+    @mock.patch.object(transfer_executions.execution_watcher,
+                       "ExecutionWatcher")
+    def test_watch(self, mock_ExecutionWatcher, mock_LoggingClient):
+        result = self.transfer_execution.watch(
+            mock.sentinel.transfer, mock.sentinel.execution,
+            reconcile_interval=mock.sentinel.reconcile_interval)
+
+        self.assertEqual(
+            mock_ExecutionWatcher.return_value.watch.return_value,
+            result
+        )
+        mock_LoggingClient.assert_called_once_with(
+            self.transfer_execution.client)
+        mock_ExecutionWatcher.assert_called_once_with(
+            self.transfer_execution, mock_LoggingClient.return_value,
+            mock.sentinel.transfer, mock.sentinel.execution,
+            reconcile_interval=mock.sentinel.reconcile_interval)
+
+    @mock.patch.object(transfer_executions.coriolis_logging, "LoggingClient")
+    @mock.patch.object(transfer_executions.execution_watcher,
+                       "ExecutionWatcher")
+    def test_watch_no_logs(self, mock_ExecutionWatcher, mock_LoggingClient):
+        self.transfer_execution.watch(
+            mock.sentinel.transfer, mock.sentinel.execution, logs=False)
+
+        mock_LoggingClient.assert_not_called()
+        mock_ExecutionWatcher.assert_called_once_with(
+            self.transfer_execution, None, mock.sentinel.transfer,
+            mock.sentinel.execution)
@@ -3,6 +3,7 @@
 
 from unittest import mock
 
+from coriolisclient import exceptions
 from coriolisclient.tests import test_base
 from coriolisclient.v1 import transfer_executions
 from coriolisclient.v1 import transfers
@@ -85,7 +86,8 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
             mock_list.return_value,
             result
         )
-        mock_list.assert_called_once_with("/transfers", "transfers", query=[])
+        mock_list.assert_called_once_with(
+            "/transfers", "transfers", query=[], fields=None)
 
     @mock.patch.object(transfers.TransferManager, "_list")
     def test_list_with_pagination(self, mock_list):
@@ -96,6 +98,7 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
             sort_keys=[mock.sentinel.sort_key0, mock.sentinel.sort_key1],
             sort_dirs=[mock.sentinel.sort_dir0, mock.sentinel.sort_dir1],
             filters={"status": mock.sentinel.status},
+            fields=mock.sentinel.fields,
         )
         exp_query = [
             ("marker", mock.sentinel.marker),
@@ -111,7 +114,8 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
             result
         )
         mock_list.assert_called_once_with(
-            "/transfers", "transfers", query=exp_query)
+            "/transfers", "transfers", query=exp_query,
+            fields=mock.sentinel.fields)
 
     @mock.patch.object(transfers.TransferManager, "_list")
     def test_list_details(self, mock_list):
@@ -122,18 +126,43 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
             result
         )
         mock_list.assert_called_once_with(
-            "/transfers/detail", "transfers", query=[])
+            "/transfers/detail", "transfers", query=[], fields=None)
+
+    def test_list_stream(self):
+        with mock.patch.object(self.transfer, '_list') as mock_list:
+            result = self.transfer.list(stream=True)
+            self.assertEqual(mock_list.return_value, result)
+            mock_list.assert_called_once_with(
+                '/transfers', 'transfers', query=[], stream=True,
+                fields=None)
+
+    @mock.patch.object(transfers.TransferManager, "_paginate")
+    def test_iter_all(self, mock_paginate):
+        result = self.transfer.iter_all(
+            detail=True, page_size=mock.sentinel.page_size,
+            filters={"status": mock.sentinel.status})
+
+        self.assertEqual(
+            mock_paginate.return_value,
+            result
+        )
+        mock_paginate.assert_called_once_with(
+            self.transfer.list, page_size=mock.sentinel.page_size,
+            detail=True, sort_keys=None, sort_dirs=None,
+            filters={"status": mock.sentinel.status}, fields=None)
 
     @mock.patch.object(transfers.TransferManager, "_get")
     def test_get(self, mock_get):
-        result = self.transfer.get(mock.sentinel.transfer)
+        result = self.transfer.get(
+            mock.sentinel.transfer, fields=mock.sentinel.fields)
 
         self.assertEqual(
             mock_get.return_value,
             result
         )
         mock_get.assert_called_once_with(
-            "/transfers/%s" % mock.sentinel.transfer, "transfer")
+            "/transfers/%s" % mock.sentinel.transfer, "transfer",
+            fields=mock.sentinel.fields)
 
     @mock.patch.object(transfers.TransferManager, "_get")
     def test_get_with_task_info(self, mock_get):
@@ -146,7 +175,47 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
         )
         mock_get.assert_called_once_with(
             "/transfers/%s?include_task_info=true" % mock.sentinel.transfer,
-            "transfer")
+            "transfer", fields=None)
+
+    @mock.patch.object(transfers.TransferManager, "get")
+    @mock.patch.object(transfer_executions.TransferExecutionManager, "list")
+    def test_get_with_executions(self, mock_list, mock_get):
+        mock_get.return_value = transfers.Transfer(
+            self.transfer, {"id": "transfer1", "executions": None},
+            loaded=True)
+        mock_list.return_value = [
+            transfer_executions.TransferExecution(
+                None, {"id": "execution1"}, loaded=True)]
+
+        result = self.transfer.get_with_executions(
+            mock.sentinel.transfer, include_task_info=True,
+            executions_limit=mock.sentinel.limit)
+
+        self.assertEqual(
+            ["execution1"], [e.id for e in result.executions])
+        mock_get.assert_called_once_with(
+            mock.sentinel.transfer, include_task_info=True)
+        mock_list.assert_called_once_with(
+            mock.sentinel.transfer, limit=mock.sentinel.limit,
+            sort_keys=["number"], sort_dirs=["desc"])
+
+    @mock.patch.object(transfers.TransferManager, "get")
+    def test_get_with_executions_manager(self, mock_get):
+        mock_get.return_value = transfers.Transfer(
+            self.transfer, {"id": "transfer1", "executions": None},
+            loaded=True)
+        self.transfer.executions_manager = mock.Mock()
+        self.transfer.executions_manager.list.return_value = [
+            transfer_executions.TransferExecution(
+                None, {"id": "execution1"}, loaded=True)]
+
+        result = self.transfer.get_with_executions(mock.sentinel.transfer)
+
+        self.assertEqual(
+            ["execution1"], [e.id for e in result.executions])
+        self.transfer.executions_manager.list.assert_called_once_with(
+            mock.sentinel.transfer, limit=None,
+            sort_keys=["number"], sort_dirs=["desc"])
 
     @mock.patch.object(transfers.TransferManager, "_post")
     def test_create(self, mock_post):
@@ -204,6 +273,52 @@ class TransferManagerTestCase(test_base.CoriolisBaseTestCase):
         mock_post.assert_called_once_with(
             "/transfers", expected_data, "transfer")
 
+    @mock.patch.object(transfers.TransferManager, "_post")
+    def test_create_validate(self, mock_post):
+        self.transfer.schema_validator = mock.Mock()
+        destination_environment = {"network_map": mock.sentinel.network_map}
+
+        result = self.transfer.create(
+            mock.sentinel.origin_endpoint_id,
+            mock.sentinel.destination_endpoint_id,
+            mock.sentinel.source_environment,
+            destination_environment,
+            mock.sentinel.instances,
+            mock.sentinel.scenario,
+            validate=True,
+        )
+
+        self.assertEqual(
+            mock_post.return_value,
+            result
+        )
+        (self.transfer.schema_validator.validate_transfer.
+            assert_called_once_with(
+                mock.sentinel.origin_endpoint_id,
+                mock.sentinel.destination_endpoint_id,
+                mock.sentinel.source_environment,
+                destination_environment))
+
+    @mock.patch.object(transfers.TransferManager, "_post")
+    def test_create_validate_invalid(self, mock_post):
+        self.transfer.schema_validator = mock.Mock()
+        (self.transfer.schema_validator.validate_transfer.
+            side_effect) = exceptions.SchemaValidationFailed(
+                "destination_environment", ["network_map: invalid"])
+
+        self.assertRaises(
+            exceptions.SchemaValidationFailed,
+            self.transfer.create,
+            mock.sentinel.origin_endpoint_id,
+            mock.sentinel.destination_endpoint_id,
+            mock.sentinel.source_environment,
+            {"network_map": mock.sentinel.network_map},
+            mock.sentinel.instances,
+            mock.sentinel.scenario,
+            validate=True,
+        )
+        mock_post.assert_not_called()
+
     @mock.patch.object(transfers.TransferManager, "_delete")
     def test_delete(self, mock_delete):
         result = self.transfer.delete(mock.sentinel.transfer)
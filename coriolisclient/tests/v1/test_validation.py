@@ -0,0 +1,158 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import validation
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "network": {"type": "string"},
+        "count": {"type": "integer"},
+    },
+    "required": ["network"],
+}
+
+
+class SchemaValidatorTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis v1 provider schema validator."""
+
+    def setUp(self):
+        super(SchemaValidatorTestCase, self).setUp()
+        self.providers = mock.Mock()
+        self.providers.schemas_list.return_value.to_dict.return_value = {
+            "destination_environment_schema": SCHEMA}
+        self.endpoints = mock.Mock()
+        self.endpoints.get.return_value.type = "openstack"
+        self.validator = validation.SchemaValidator(
+            self.providers, self.endpoints)
+
+    def test_get_validator(self):
+        result = self.validator.get_validator(
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT)
+
+        self.assertIs(
+            result,
+            self.validator.get_validator(
+                "openstack",
+                validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT))
+        self.providers.schemas_list.assert_called_once_with("openstack", 4)
+
+    def test_get_validator_single_schema(self):
+        self.providers.schemas_list.return_value.to_dict.return_value = {
+            "schema": SCHEMA}
+
+        result = self.validator.get_validator(
+            "openstack", validation.SCHEMA_TYPE_SOURCE_MINION_POOL)
+
+        self.assertEqual(SCHEMA, result.schema)
+        self.providers.schemas_list.assert_called_once_with(
+            "openstack", 524288)
+
+    def test_get_validator_no_schema(self):
+        self.providers.schemas_list.return_value.to_dict.return_value = {}
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.validator.get_validator,
+            "openstack", validation.SCHEMA_TYPE_SOURCE_ENVIRONMENT)
+
+    def test_get_validator_invalid_schema_type(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.validator.get_validator, "openstack", "invalid")
+
+    @mock.patch.object(validation, "jsonschema", None)
+    def test_get_validator_no_jsonschema(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.validator.get_validator,
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT)
+
+    def test_validate(self):
+        self.validator.validate(
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT,
+            {"network": "net1"})
+
+    def test_validate_invalid(self):
+        ex = self.assertRaises(
+            exceptions.SchemaValidationFailed,
+            self.validator.validate,
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT,
+            {"count": "one"})
+
+        self.assertEqual(
+            ["<root>: 'network' is a required property",
+             "count: 'one' is not of type 'integer'"],
+            ex.errors)
+
+    def test_validate_many(self):
+        result = self.validator.validate_many(
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT,
+            [{"network": "net1"}, {}, {"network": 1}])
+
+        self.assertEqual(
+            {1: ["<root>: 'network' is a required property"],
+             2: ["network: 1 is not of type 'string'"]},
+            result)
+        self.providers.schemas_list.assert_called_once_with("openstack", 4)
+
+    def test_get_endpoint_type(self):
+        result = self.validator.get_endpoint_type(mock.sentinel.endpoint)
+
+        self.assertEqual("openstack", result)
+        self.assertEqual(
+            "openstack",
+            self.validator.get_endpoint_type(mock.sentinel.endpoint))
+        self.endpoints.get.assert_called_once_with(mock.sentinel.endpoint)
+
+    def test_get_endpoint_type_no_endpoints_manager(self):
+        validator = validation.SchemaValidator(self.providers)
+
+        self.assertRaises(
+            exceptions.CoriolisException,
+            validator.get_endpoint_type, mock.sentinel.endpoint)
+
+    @mock.patch.object(validation.SchemaValidator, "validate")
+    def test_validate_transfer(self, mock_validate):
+        self.validator.validate_transfer(
+            mock.sentinel.origin, mock.sentinel.destination,
+            mock.sentinel.source_environment,
+            mock.sentinel.destination_environment)
+
+        mock_validate.assert_has_calls([
+            mock.call("openstack",
+                      validation.SCHEMA_TYPE_SOURCE_ENVIRONMENT,
+                      mock.sentinel.source_environment),
+            mock.call("openstack",
+                      validation.SCHEMA_TYPE_DESTINATION_ENVIRONMENT,
+                      mock.sentinel.destination_environment)])
+
+    @mock.patch.object(validation.SchemaValidator, "validate")
+    def test_validate_minion_pool(self, mock_validate):
+        self.validator.validate_minion_pool(
+            mock.sentinel.endpoint, "destination",
+            mock.sentinel.environment_options)
+
+        mock_validate.assert_called_once_with(
+            "openstack", validation.SCHEMA_TYPE_DESTINATION_MINION_POOL,
+            mock.sentinel.environment_options)
+
+    def test_validate_minion_pool_invalid_platform(self):
+        self.assertRaises(
+            exceptions.CoriolisException,
+            self.validator.validate_minion_pool,
+            mock.sentinel.endpoint, "invalid", {})
+
+    @mock.patch.object(validation, "SchemaValidator")
+    def test_get_validator_for_manager(self, mock_SchemaValidator):
+        manager = mock.Mock(schema_validator=None)
+
+        result = validation.get_validator_for_manager(manager)
+
+        self.assertEqual(mock_SchemaValidator.return_value, result)
+        self.assertEqual(result, manager.schema_validator)
@@ -0,0 +1,215 @@
+# Copyright 2026 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from keystoneauth1 import exceptions as keystoneauth_exceptions
+
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import deployments
+from coriolisclient.v1 import transfer_executions
+from coriolisclient.v1 import transfers
+from coriolisclient.v1 import waiters
+
+
+class WaitersTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis v1 execution and deployment waiters."""
+
+    def setUp(self):
+        super(WaitersTestCase, self).setUp()
+        self.executions = mock.Mock()
+        self.deployments = mock.Mock()
+        mock_sleep = mock.patch.object(waiters.time, "sleep")
+        self.mock_sleep = mock_sleep.start()
+        self.addCleanup(mock_sleep.stop)
+        mock_uniform = mock.patch.object(
+            waiters.random, "uniform", return_value=1)
+        mock_uniform.start()
+        self.addCleanup(mock_uniform.stop)
+
+    def _execution(self, execution_id, status, transfer_id="transfer1"):
+        return transfer_executions.TransferExecution(
+            self.executions,
+            {"id": execution_id, "action_id": transfer_id,
+             "status": status},
+            loaded=True)
+
+    def _deployment(self, deployment_id, status):
+        return deployments.Deployment(
+            self.deployments,
+            {"id": deployment_id, "last_execution_status": status},
+            loaded=True)
+
+    def test_get_status(self):
+        self.assertEqual(
+            ("RUNNING", "COMPLETED"),
+            (waiters.get_status(self._execution("id1", "RUNNING")),
+             waiters.get_status(self._deployment("id2", "COMPLETED"))))
+
+    def test_wait_for_executions(self):
+        self.executions.list.side_effect = [
+            [self._execution("id1", "RUNNING"),
+             self._execution("id2", "RUNNING")],
+            [self._execution("id1", "COMPLETED"),
+             self._execution("id2", "RUNNING")],
+            [self._execution("id2", "ERROR")],
+        ]
+
+        result = list(waiters.wait_for([
+            self._execution("id1", "UNEXECUTED"),
+            self._execution("id2", "RUNNING")]))
+
+        self.assertEqual(
+            [("id1", "UNEXECUTED", "RUNNING"),
+             ("id1", "RUNNING", "COMPLETED"),
+             ("id2", "RUNNING", "ERROR")],
+            [(t.resource.id, t.previous_status, t.status) for t in result])
+        self.executions.list.assert_has_calls([mock.call("transfer1")] * 3)
+        self.executions.get.assert_not_called()
+        self.mock_sleep.assert_has_calls(
+            [mock.call(waiters.DEFAULT_MIN_POLL_INTERVAL)] * 2)
+
+    def test_wait_for_backoff(self):
+        self.executions.list.side_effect = (
+            [[self._execution("id1", "RUNNING")]] * 4 +
+            [[self._execution("id1", "COMPLETED")]])
+
+        list(waiters.wait_for(
+            [self._execution("id1", "RUNNING")], min_interval=2,
+            max_interval=5, backoff=2))
+
+        self.mock_sleep.assert_has_calls(
+            [mock.call(4), mock.call(5), mock.call(5), mock.call(5)])
+
+    def test_wait_for_deployments_listed(self):
+        self.deployments.list.return_value = [
+            self._deployment("id1", "COMPLETED"),
+            self._deployment("id2", "ERROR"),
+            self._deployment("id3", "RUNNING")]
+
+        result = list(waiters.wait_for([
+            self._deployment("id1", "RUNNING"),
+            self._deployment("id2", "RUNNING")]))
+
+        self.assertEqual(
+            [("id1", "COMPLETED"), ("id2", "ERROR")],
+            [(t.resource.id, t.status) for t in result])
+        self.deployments.list.assert_called_once_with()
+        self.deployments.get.assert_not_called()
+
+    def test_wait_for_deployment_get(self):
+        deployment = self._deployment("id1", "RUNNING")
+        self.deployments.get.return_value = self._deployment(
+            "id1", "COMPLETED")
+
+        result = list(waiters.wait_for([deployment]))
+
+        self.assertEqual(["COMPLETED"], [t.status for t in result])
+        self.deployments.get.assert_called_once_with(deployment)
+        self.deployments.list.assert_not_called()
+
+    def test_wait_for_missing_from_listing(self):
+        execution = self._execution("id1", "RUNNING")
+        self.executions.list.return_value = []
+        self.executions.get.return_value = self._execution(
+            "id1", "COMPLETED")
+
+        result = list(waiters.wait_for([execution]))
+
+        self.assertEqual(["COMPLETED"], [t.status for t in result])
+        self.executions.get.assert_called_once_with("transfer1", execution)
+
+    @mock.patch.object(transfer_executions.TransferExecutionManager, "list")
+    def test_wait_for_transfer_update_execution(self, mock_list):
+        api = mock.Mock()
+        api.put.return_value.json.return_value = {"execution": {
+            "id": "id1", "action_id": "transfer1", "status": "RUNNING"}}
+        transfer_manager = transfers.TransferManager(api)
+        transfer_manager.lazy_loads = mock.sentinel.lazy_loads
+        execution = transfer_manager.update("transfer1", {})
+        mock_list.return_value = [self._execution("id1", "COMPLETED")]
+
+        result = list(waiters.wait_for([execution]))
+
+        self.assertEqual(["COMPLETED"], [t.status for t in result])
+        self.assertIsInstance(
+            result[0].resource, transfer_executions.TransferExecution)
+        mock_list.assert_called_once_with("transfer1")
+        api.get.assert_not_called()
+
+    def test_wait_for_transfer_executions_manager(self):
+        transfer_manager = transfers.TransferManager(mock.Mock())
+        transfer_manager.executions_manager = self.executions
+        execution = transfer_executions.TransferExecution(
+            transfer_manager,
+            {"id": "id1", "action_id": "transfer1", "status": "RUNNING"},
+            loaded=True)
+        self.executions.list.return_value = [
+            self._execution("id1", "COMPLETED")]
+
+        result = list(waiters.wait_for([execution]))
+
+        self.assertEqual(["COMPLETED"], [t.status for t in result])
+        self.executions.list.assert_called_once_with("transfer1")
+
+    def test_wait_for_deleted(self):
+        execution = self._execution("id1", "RUNNING")
+        self.executions.list.return_value = []
+        self.executions.get.side_effect = (
+            keystoneauth_exceptions.http.NotFound())
+
+        result = list(waiters.wait_for([execution]))
+
+        self.assertEqual(
+            [(execution, "RUNNING", None)],
+            [tuple(t) for t in result])
+
+    @mock.patch.object(waiters.time, "monotonic")
+    def test_wait_for_timeout(self, mock_monotonic):
+        mock_monotonic.side_effect = [0, 1, 10]
+        self.executions.list.return_value = [
+            self._execution("id1", "RUNNING")]
+
+        ex = self.assertRaises(
+            exceptions.WaitTimeout, list,
+            waiters.wait_for(
+                [self._execution("id1", "RUNNING")], timeout=5))
+
+        self.assertEqual([("id1", "RUNNING")], ex.pending)
+        self.mock_sleep.assert_called_once_with(3.0)
+
+    def test_wait_for_terminal_states(self):
+        self.executions.list.return_value = [
+            self._execution("id1", "CANCELLING")]
+
+        result = list(waiters.wait_for(
+            [self._execution("id1", "RUNNING")],
+            terminal_states=["CANCELLING"]))
+
+        self.assertEqual(["CANCELLING"], [t.status for t in result])
+        self.mock_sleep.assert_not_called()
+
+    def test_wait_for_unsupported_resource(self):
+        self.assertRaises(
+            exceptions.CoriolisException, list,
+            waiters.wait_for([mock.Mock()]))
+
+    def test_wait_for_execution_no_transfer(self):
+        self.assertRaises(
+            exceptions.CoriolisException, list,
+            waiters.wait_for([self._execution("id1", "RUNNING", None)]))
+
+    def test_wait(self):
+        self.executions.list.return_value = [
+            self._execution("id2", "COMPLETED")]
+        self.deployments.get.return_value = self._deployment(
+            "id1", "ERROR")
+
+        result = waiters.wait([
+            self._deployment("id1", "RUNNING"),
+            self._execution("id2", "RUNNING")])
+
+        self.assertEqual(
+            [("id1", "ERROR"), ("id2", "COMPLETED")],
+            [(r.id, waiters.get_status(r)) for r in result])
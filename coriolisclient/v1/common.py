@@ -14,11 +14,21 @@
 # limitations under the License.
 
 import base64
+import copy
 import json
 
+import requests
+from requests import adapters
+
 from coriolisclient import base
+from coriolisclient import cache
 from coriolisclient import exceptions
 
+DEFAULT_OPTIONS_CACHE_TTL = 60
+DEFAULT_OPTIONS_CACHE_MAXSIZE = 256
+
+_MISSING = object()
+
 
 class ProgressUpdate(base.Resource):
     pass
@@ -28,7 +38,7 @@ class Task(base.Resource):
     @property
     def progress_updates(self):
         if not self._loaded or self._info.get('progress_updates') is None:
-            self.get()
+            self._lazy_load('progress_updates')
         return [ProgressUpdate(None, d, loaded=True) for d in
                 self._info.get('progress_updates', [])]
 
@@ -49,6 +59,98 @@ class TransferResult(base.Resource):
     pass
 
 
+def make_http_session(pool_size):
+    """Returns a persistent `requests` session keeping up to `pool_size`
+    connections per host alive across requests.
+    """
+    session = requests.Session()
+    adapter = adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_response_chunks(resp, chunk_size, keep_gzip=False):
+    """Returns an iterator over the body of a streamed response and whether
+    its chunks are gzip-compressed.
+
+    With `keep_gzip`, a gzip-encoded body is returned as it was received, so
+    that it can be stored without being decompressed and compressed again.
+    """
+    if keep_gzip and resp.headers.get("Content-Encoding") == "gzip":
+        return resp.raw.stream(chunk_size, decode_content=False), True
+    return resp.iter_content(chunk_size=chunk_size), False
+
+
+class ListingIndex(object):
+    """Lookup index built out of a single listing of resources.
+
+    The index returned by `build` is reused for `ttl` seconds, and is also
+    persisted in the on-disk cache returned by `get_file_cache`, if any,
+    under the scope returned by `get_scope`. Lookups of keys missing from a
+    cached index cause it to be rebuilt once, as the resources may have
+    been created since, possibly by another client.
+    """
+
+    def __init__(self, build, ttl, get_file_cache=None, get_scope=None):
+        self._build = build
+        self._cache = cache.TTLCache(ttl=ttl)
+        self._get_file_cache = get_file_cache
+        self._get_scope = get_scope
+
+    @property
+    def ttl(self):
+        return self._cache.ttl
+
+    @ttl.setter
+    def ttl(self, ttl):
+        self._cache.ttl = ttl
+
+    def _file_cache(self):
+        if self._get_file_cache is None:
+            return None
+        return self._get_file_cache()
+
+    def invalidate(self):
+        """Drops the cached index, including its on-disk copy."""
+        self._cache.invalidate()
+        file_cache = self._file_cache()
+        if file_cache is not None:
+            file_cache.invalidate()
+
+    def get(self, refresh=False):
+        """Returns the index, and whether it was cached."""
+        file_cache = self._file_cache()
+        scope = None
+        if file_cache is not None and self._get_scope is not None:
+            scope = self._get_scope()
+
+        if not refresh:
+            index = self._cache.get(scope)
+            if index is None and file_cache is not None and scope:
+                index = file_cache.get(scope)
+                if index is not None:
+                    self._cache.set(scope, index)
+            if index is not None:
+                return index, True
+
+        index = self._build()
+        self._cache.set(scope, index)
+        if file_cache is not None and scope:
+            file_cache.set(scope, index)
+        return index, False
+
+    def get_for(self, keys):
+        """Returns an index containing all the given keys, as far as the
+        current listing allows.
+        """
+        index, cached = self.get()
+        if cached and any(key not in index for key in keys):
+            index, _ = self.get(refresh=True)
+        return index
+
+
 def encode_base64_param(param, is_json=False):
     try:
         if is_json:
@@ -56,3 +158,56 @@ def encode_base64_param(param, is_json=False):
         return base64.urlsafe_b64encode(param.encode()).decode()
     except Exception as ex:
         raise exceptions.CoriolisException(str(ex))
+
+
+class EndpointOptionsManager(base.BaseManager):
+    """Base class for the managers of endpoint options, networks and storage.
+
+    Listing these requires the provider to query the endpoint's platform,
+    so results are memoized per endpoint and query (i.e. the encoded
+    environment and option names) for the lifetime of the manager, or for
+    `options_cache.ttl` seconds unless it is None. A TTL of 0 disables the
+    memoization and `refresh=True` bypasses it for a single call.
+    """
+
+    def __init__(self, api):
+        super(EndpointOptionsManager, self).__init__(api)
+        self.options_cache = cache.TTLCache(
+            ttl=DEFAULT_OPTIONS_CACHE_TTL,
+            maxsize=DEFAULT_OPTIONS_CACHE_MAXSIZE)
+
+    def invalidate_options_cache(self, endpoint=None):
+        """Drops the memoized results for the given endpoint, or all of them
+        if no endpoint is given.
+        """
+        if endpoint is None:
+            self.options_cache.invalidate()
+        else:
+            endpoint_id = base.getid(endpoint)
+            self.options_cache.invalidate_if(
+                lambda key: key[0] == endpoint_id)
+
+    def _memoized(self, endpoint, url, func, refresh=False):
+        """Returns a copy of the memoized result of `func` for the given
+        endpoint and URL, calling it if needed.
+        """
+        key = (base.getid(endpoint), url)
+        result = _MISSING
+        if not refresh:
+            result = self.options_cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = func()
+            if self.options_cache.ttl != 0:
+                self.options_cache.set(key, result)
+        return copy.deepcopy(result)
+
+    def _list_memoized(self, endpoint, url, response_key, values_key='values',
+                       refresh=False):
+        infos = self._memoized(
+            endpoint, url,
+            lambda: [
+                res.to_dict() for res in self._list(
+                    url, response_key, values_key=values_key)],
+            refresh=refresh)
+        return [self._make_resource(self.resource_class, info, loaded=True)
+                for info in infos]
@@ -41,7 +41,7 @@ class Deployment(base.Resource):
     @property
     def tasks(self):
         if self._info.get('tasks') is None:
-            self.get()
+            self._lazy_load('tasks')
         return [common.Task(None, d, loaded=True) for d in
                 self._info.get('tasks', [])]
 
@@ -54,7 +54,8 @@ class DeploymentManager(base.BaseManager):
 
     def list(self, detail=False,
              marker=None, limit=None,
-             sort_keys=None, sort_dirs=None, filters=None):
+             sort_keys=None, sort_dirs=None, filters=None, stream=False,
+             fields=None):
         query = []
         if marker is not None:
             query.append(("marker", marker))
@@ -72,11 +73,23 @@ class DeploymentManager(base.BaseManager):
         path = "/deployments"
         if detail:
             path = "%s/detail" % path
-        return self._list(path, 'deployments', query=query)
-
-    def get(self, deployment):
+        if stream:
+            return self._list(
+                path, 'deployments', query=query, stream=True, fields=fields)
+        return self._list(path, 'deployments', query=query, fields=fields)
+
+    def iter_all(self, detail=False, page_size=base.DEFAULT_PAGE_SIZE,
+                 sort_keys=None, sort_dirs=None, filters=None, fields=None):
+        """Lazily iterates over all deployments, one page at a time."""
+        return self._paginate(
+            self.list, page_size=page_size, detail=detail,
+            sort_keys=sort_keys, sort_dirs=sort_dirs, filters=filters,
+            fields=fields)
+
+    def get(self, deployment, fields=None):
         return self._get(
-            '/deployments/%s' % base.getid(deployment), 'deployment')
+            '/deployments/%s' % base.getid(deployment), 'deployment',
+            fields=fields)
 
     def create_from_transfer(self, transfer_id, clone_disks=True, force=False,
                              skip_os_morphing=False, user_scripts=None,
@@ -21,13 +21,15 @@ class EndpointDestinationMinionPoolOption(base.Resource):
     pass
 
 
-class EndpointDestinationMinionPoolOptionsManager(base.BaseManager):
+class EndpointDestinationMinionPoolOptionsManager(
+        common.EndpointOptionsManager):
     resource_class = EndpointDestinationMinionPoolOption
 
     def __init__(self, api):
         super(EndpointDestinationMinionPoolOptionsManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None, option_names=None):
+    def list(self, endpoint, environment=None, option_names=None,
+             refresh=False):
         url = '/endpoints/%s/destination-minion-pool-options' % (
             base.getid(endpoint))
 
@@ -43,4 +45,5 @@ class EndpointDestinationMinionPoolOptionsManager(base.BaseManager):
                 option_names, is_json=True)
             url = '%s%soptions=%s' % (url, sep, encoded_option_names)
 
-        return self._list(url, 'destination_minion_pool_options')
+        return self._list_memoized(
+            endpoint, url, 'destination_minion_pool_options', refresh=refresh)
@@ -21,13 +21,14 @@ class EndpointDestinationOption(base.Resource):
     pass
 
 
-class EndpointDestinationOptionsManager(base.BaseManager):
+class EndpointDestinationOptionsManager(common.EndpointOptionsManager):
     resource_class = EndpointDestinationOption
 
     def __init__(self, api):
         super(EndpointDestinationOptionsManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None, option_names=None):
+    def list(self, endpoint, environment=None, option_names=None,
+             refresh=False):
         url = '/endpoints/%s/destination-options' % base.getid(endpoint)
 
         if environment:
@@ -42,4 +43,5 @@ class EndpointDestinationOptionsManager(base.BaseManager):
                 option_names, is_json=True)
             url = '%s%soptions=%s' % (url, sep, encoded_option_names)
 
-        return self._list(url, 'destination_options')
+        return self._list_memoized(
+            endpoint, url, 'destination_options', refresh=refresh)
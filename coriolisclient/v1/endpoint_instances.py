@@ -13,9 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
+
 from six.moves.urllib import parse as urlparse
 
 from coriolisclient import base
+from coriolisclient import cache
+from coriolisclient import exceptions
+from coriolisclient import inventory
 from coriolisclient.v1 import common
 
 
@@ -55,6 +61,21 @@ class EndpointInstanceManager(base.BaseManager):
 
         return self._list(url, 'instances')
 
+    def iter_all(self, endpoint, env=None, name=None, refresh=False,
+                 page_size=base.DEFAULT_PAGE_SIZE):
+        """Lazily iterates over all instances, one page at a time.
+
+        With `refresh`, only the first page is requested with it, so that
+        the provider re-queries the cloud once and the following pages are
+        served from that same listing.
+        """
+        def _list_page(marker=None, limit=None):
+            return self.list(
+                endpoint, env=env, marker=marker, limit=limit, name=name,
+                refresh=refresh and marker is None)
+
+        return self._paginate(_list_page, page_size=page_size)
+
     def get(self, endpoint, instance_id, env=None):
         encoded_instance = common.encode_base64_param(instance_id)
         url = '/endpoints/%s/instances/%s' % (
@@ -68,3 +89,51 @@ class EndpointInstanceManager(base.BaseManager):
             url = "%s?env=%s" % (url, encoded_env)
 
         return self._get(url, 'instance')
+
+    def _get_inventory(self, path=None):
+        if path is None:
+            if not self.cache_dir:
+                raise exceptions.CoriolisException(
+                    "No inventory snapshot path given and no cache "
+                    "directory is configured")
+            path = os.path.join(
+                self.cache_dir, inventory.DEFAULT_INVENTORY_FILE_NAME)
+        return inventory.InventorySnapshot(path)
+
+    def _get_inventory_scope(self, endpoint, env=None):
+        return cache.make_key(
+            self._get_cache_scope(), base.getid(endpoint),
+            json.dumps(env or {}, sort_keys=True))
+
+    def sync_inventory(self, endpoint, env=None, path=None, refresh=False,
+                       page_size=base.DEFAULT_PAGE_SIZE):
+        """Stores a local snapshot of the instances of the endpoint.
+
+        :param path: SQLite database to store the snapshot in, defaults to
+            one in the `cache_dir` of the manager
+        :param refresh: whether to have the provider refresh its own cache
+            of the instances
+        :returns: `coriolisclient.inventory.InventoryDiff` against the
+            previous snapshot of the endpoint and environment
+        """
+        instances = (
+            instance.to_dict() for instance in self.iter_all(
+                endpoint, env=env, refresh=refresh, page_size=page_size))
+        return self._get_inventory(path).sync(
+            self._get_inventory_scope(endpoint, env), instances)
+
+    def list_inventory(self, endpoint, env=None, path=None, name=None):
+        """Lists the instances of the endpoint from its last local snapshot,
+        without querying the API.
+        """
+        infos = self._get_inventory(path).list(
+            self._get_inventory_scope(endpoint, env), name=name)
+        return [self._make_resource(self.resource_class, info, loaded=True)
+                for info in infos]
+
+    def get_inventory_synced_at(self, endpoint, env=None, path=None):
+        """Returns the timestamp of the last local snapshot of the endpoint,
+        or None if it was never synced.
+        """
+        return self._get_inventory(path).get_synced_at(
+            self._get_inventory_scope(endpoint, env))
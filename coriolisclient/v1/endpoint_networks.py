@@ -21,17 +21,18 @@ class EndpointNetwork(base.Resource):
     pass
 
 
-class EndpointNetworkManager(base.BaseManager):
+class EndpointNetworkManager(common.EndpointOptionsManager):
     resource_class = EndpointNetwork
 
     def __init__(self, api):
         super(EndpointNetworkManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None):
+    def list(self, endpoint, environment=None, refresh=False):
         url = '/endpoints/%s/networks' % base.getid(endpoint)
 
         if environment:
             encoded_env = common.encode_base64_param(environment, is_json=True)
             url = '%s?env=%s' % (url, encoded_env)
 
-        return self._list(url, 'networks')
+        return self._list_memoized(
+            endpoint, url, 'networks', refresh=refresh)
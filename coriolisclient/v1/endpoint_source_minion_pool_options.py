@@ -21,13 +21,14 @@ class EndpointSourceMinionPoolOption(base.Resource):
     pass
 
 
-class EndpointSourceMinionPoolOptionsManager(base.BaseManager):
+class EndpointSourceMinionPoolOptionsManager(common.EndpointOptionsManager):
     resource_class = EndpointSourceMinionPoolOption
 
     def __init__(self, api):
         super(EndpointSourceMinionPoolOptionsManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None, option_names=None):
+    def list(self, endpoint, environment=None, option_names=None,
+             refresh=False):
         url = '/endpoints/%s/source-minion-pool-options' % base.getid(endpoint)
 
         if environment:
@@ -42,4 +43,5 @@ class EndpointSourceMinionPoolOptionsManager(base.BaseManager):
                 option_names, is_json=True)
             url = '%s%soptions=%s' % (url, sep, encoded_option_names)
 
-        return self._list(url, 'source_minion_pool_options')
+        return self._list_memoized(
+            endpoint, url, 'source_minion_pool_options', refresh=refresh)
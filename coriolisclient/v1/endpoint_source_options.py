@@ -21,13 +21,14 @@ class EndpointSourceOption(base.Resource):
     pass
 
 
-class EndpointSourceOptionsManager(base.BaseManager):
+class EndpointSourceOptionsManager(common.EndpointOptionsManager):
     resource_class = EndpointSourceOption
 
     def __init__(self, api):
         super(EndpointSourceOptionsManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None, option_names=None):
+    def list(self, endpoint, environment=None, option_names=None,
+             refresh=False):
         url = '/endpoints/%s/source-options' % base.getid(endpoint)
 
         if environment:
@@ -42,4 +43,5 @@ class EndpointSourceOptionsManager(base.BaseManager):
                 option_names, is_json=True)
             url = '%s%soptions=%s' % (url, sep, encoded_option_names)
 
-        return self._list(url, 'source_options')
+        return self._list_memoized(
+            endpoint, url, 'source_options', refresh=refresh)
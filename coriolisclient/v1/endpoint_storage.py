@@ -21,26 +21,35 @@ class EndpointStorage(base.Resource):
     pass
 
 
-class EndpointStorageManager(base.BaseManager):
+class EndpointStorageManager(common.EndpointOptionsManager):
     resource_class = EndpointStorage
 
     def __init__(self, api):
         super(EndpointStorageManager, self).__init__(api)
 
-    def list(self, endpoint, environment=None):
+    def _get_storage(self, endpoint, environment=None, refresh=False):
+        """ Returns the memoized storage of the endpoint, from which both
+        its storage backends and its default one are read, so that the
+        provider is only queried once for them.
+        """
         url = '/endpoints/%s/storage' % base.getid(endpoint)
 
         if environment:
             encoded_env = common.encode_base64_param(environment, is_json=True)
             url = '%s?env=%s' % (url, encoded_env)
 
-        return self._list(url, 'storage', values_key='storage_backends')
-
-    def get_default(self, endpoint, environment=None):
-        url = '/endpoints/%s/storage' % base.getid(endpoint)
-
-        if environment:
-            encoded_env = common.encode_base64_param(environment, is_json=True)
-            url = '%s?env=%s' % (url, encoded_env)
-
-        return self._get(url, 'storage').to_dict().get('config_default')
+        return self._memoized(
+            endpoint, url, lambda: self._get(url, 'storage').to_dict(),
+            refresh=refresh)
+
+    def list(self, endpoint, environment=None, refresh=False):
+        storage = self._get_storage(
+            endpoint, environment=environment, refresh=refresh)
+        return [
+            self._make_resource(self.resource_class, info, loaded=True)
+            for info in storage.get('storage_backends') or []]
+
+    def get_default(self, endpoint, environment=None, refresh=False):
+        storage = self._get_storage(
+            endpoint, environment=environment, refresh=refresh)
+        return storage.get('config_default')
@@ -13,12 +13,60 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
+import collections
+import csv
+import functools
+import gzip
+import operator
+import re
+
 from coriolisclient import base
 from coriolisclient.cli import utils
 from coriolisclient import exceptions
 from coriolisclient.v1 import common
 
 
+DEFAULT_NAME_INDEX_TTL = 60
+DEFAULT_INVENTORY_CHUNK_SIZE = 64 * 1024
+_NAME_INDEX_CACHE_NAME = "endpoint_names"
+
+
+def _iter_text_lines(chunks, encoding):
+    """ Decodes the given byte chunks and splits them into lines, keeping
+    the line endings so that quoted multi-line CSV fields are preserved.
+
+    Only '\n' ends lines, as `str.splitlines` would also split rows on
+    characters such as '\x1d' or '\u2028' which may be found in fields.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        # NOTE: the last line may continue in the next chunk:
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def _get_field_name(column, index):
+    name = re.sub(r'\W+', '_', column.strip()).strip('_').lower()
+    return name or 'column_%d' % index
+
+
+def _get_column_index(columns, field_names, column):
+    if column in columns:
+        return columns.index(column)
+    if column in field_names:
+        return field_names.index(column)
+    raise exceptions.CoriolisException(
+        "Inventory has no column named '%s'. Available columns: %s" % (
+            column, ", ".join(columns)))
+
+
 class ConnectionInfo(base.Resource):
     pass
 
@@ -32,9 +80,17 @@ class Endpoint(base.Resource):
 
 class EndpointManager(base.BaseManager):
     resource_class = Endpoint
+    # NOTE: seconds for which endpoint names are resolved from the index
+    # built out of a single listing, see `get_endpoint_id_for_name`:
+    name_index_ttl = DEFAULT_NAME_INDEX_TTL
 
     def __init__(self, api):
         super(EndpointManager, self).__init__(api)
+        self._name_index = common.ListingIndex(
+            self._build_name_index, ttl=self.name_index_ttl,
+            get_file_cache=lambda: self._get_file_cache(
+                _NAME_INDEX_CACHE_NAME, ttl=self.name_index_ttl),
+            get_scope=self._get_cache_scope)
 
     def list(self):
         return self._list('/endpoints', 'endpoints')
@@ -53,19 +109,25 @@ class EndpointManager(base.BaseManager):
                 "connection_info": connection_info,
                 "mapped_regions": regions}}
 
-        return self._post('/endpoints', data, 'endpoint')
+        endpoint = self._post('/endpoints', data, 'endpoint')
+        self.invalidate_name_index()
+        return endpoint
 
     def update(self, endpoint, updated_values):
         data = {
             "endpoint": updated_values
         }
-        return self._put(
+        endpoint = self._put(
             '/endpoints/%s' % base.getid(endpoint), data, 'endpoint')
+        self.invalidate_name_index()
+        return endpoint
 
     def delete(self, endpoint):
-        return self._delete('/endpoints/%s' % base.getid(endpoint))
+        result = self._delete('/endpoints/%s' % base.getid(endpoint))
+        self.invalidate_name_index()
+        return result
 
-    def get_inventory_csv(self, endpoint, source_environment=None):
+    def _get_inventory_url(self, endpoint, source_environment=None):
         url = '/endpoints/%s/inventory' % base.getid(endpoint)
         if source_environment:
             if not isinstance(source_environment, dict):
@@ -73,9 +135,136 @@ class EndpointManager(base.BaseManager):
             encoded_env = common.encode_base64_param(
                 source_environment, is_json=True)
             url = '%s?env=%s' % (url, encoded_env)
+        return url
+
+    def get_inventory_csv(self, endpoint, source_environment=None):
+        url = self._get_inventory_url(endpoint, source_environment)
         resp = self.client.get(url, headers={'Accept': 'text/csv'})
         return resp.text
 
+    def export_inventory_csv(self, endpoint, out, source_environment=None,
+                             compress=False,
+                             chunk_size=DEFAULT_INVENTORY_CHUNK_SIZE,
+                             progress_callback=None):
+        """ Streams the CSV inventory of the endpoint into `out` as it is
+        received, without buffering it in memory.
+
+        :param out: binary file object to write the CSV to
+        :param compress: whether to write the CSV gzip-compressed. A
+            gzip-encoded response is written as it is received.
+        :param progress_callback: called after each chunk with the number of
+            bytes received so far and the total number of bytes expected,
+            or None if unknown
+        :returns: the number of bytes received
+        """
+        url = self._get_inventory_url(endpoint, source_environment)
+        resp = self.client.get(
+            url, headers={'Accept': 'text/csv'}, stream=True)
+        try:
+            chunks, compressed = common.get_response_chunks(
+                resp, chunk_size, keep_gzip=compress)
+            content_encoding = None
+            writer = out
+            if not compressed:
+                content_encoding = resp.headers.get('Content-Encoding')
+                if compress:
+                    writer = gzip.GzipFile(fileobj=out, mode='wb')
+
+            # NOTE: the length of encoded responses does not match the
+            # length of the decoded content read from them:
+            total = resp.headers.get('Content-Length')
+            total = int(total) if total and not content_encoding else None
+
+            received = 0
+            for chunk in chunks:
+                writer.write(chunk)
+                received += len(chunk)
+                if progress_callback:
+                    progress_callback(received, total)
+            if writer is not out:
+                writer.close()
+        finally:
+            resp.close()
+        return received
+
+    def iter_inventory(self, endpoint, source_environment=None,
+                       columns=None, filters=None, converters=None,
+                       limit=None, chunk_size=DEFAULT_INVENTORY_CHUNK_SIZE):
+        """ Lazily parses the CSV inventory of the endpoint as it is received.
+
+        Rows are returned as namedtuples whose fields are the CSV columns,
+        lower-cased and with any non-alphanumeric characters replaced with
+        underscores (e.g. 'Memory MB' becomes 'memory_mb'). Columns may be
+        referred to by either name below. Rows not matching the filters are
+        skipped before any tuple is built for them.
+
+        :param columns: list of the columns to include in the rows, defaults
+            to all of them
+        :param filters: dict mapping columns to either the value to match
+            or a callable taking the column's value and returning whether
+            the row is included. Filtered columns need not be included.
+        :param converters: dict mapping columns to callables converting their
+            values (e.g. `int`); values are strings otherwise
+        :param limit: maximum number of rows to return, after which the
+            rest of the inventory is not downloaded
+        """
+        filters = filters or {}
+        converters = converters or {}
+        url = self._get_inventory_url(endpoint, source_environment)
+        resp = self.client.get(
+            url, headers={'Accept': 'text/csv'}, stream=True)
+        try:
+            reader = csv.reader(_iter_text_lines(
+                resp.iter_content(chunk_size=chunk_size),
+                resp.encoding or 'utf-8'))
+            header = next(reader, None)
+            if header is None or (limit is not None and limit < 1):
+                return
+            field_names = [
+                _get_field_name(column, i) for (i, column) in
+                enumerate(header)]
+
+            indexes = list(range(len(header)))
+            if columns is not None:
+                indexes = [
+                    _get_column_index(header, field_names, column)
+                    for column in columns]
+            row_class = collections.namedtuple(
+                'InventoryRow', [field_names[i] for i in indexes],
+                rename=True)
+
+            row_filters = []
+            for (column, value) in filters.items():
+                if not callable(value):
+                    value = functools.partial(operator.eq, str(value))
+                row_filters.append(
+                    (_get_column_index(header, field_names, column), value))
+            row_converters = {}
+            for (column, converter) in converters.items():
+                row_converters[_get_column_index(
+                    header, field_names, column)] = converter
+
+            count = 0
+            for row in reader:
+                if not row:
+                    continue
+                # NOTE: pad rows with missing trailing columns:
+                if len(row) < len(header):
+                    row += [''] * (len(header) - len(row))
+                if not all(match(row[i]) for (i, match) in row_filters):
+                    continue
+                if row_converters:
+                    yield row_class._make(
+                        row_converters[i](row[i]) if i in row_converters
+                        else row[i] for i in indexes)
+                else:
+                    yield row_class._make(row[i] for i in indexes)
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            resp.close()
+
     def validate_connection(self, endpoint):
         data = self.client.post(
             '/endpoints/%s/actions' % base.getid(endpoint),
@@ -84,15 +273,34 @@ class EndpointManager(base.BaseManager):
         return validate_data.get("valid"), validate_data.get("message")
 
     def get_endpoint_id_for_name(self, endpoint):
-        """ Gets the UUID of the endpoint from the parsed name """
+        """ Gets the UUID of the endpoint from the parsed name
+
+        Names are resolved through an index built out of a single listing
+        of the endpoints, which is reused for `name_index_ttl` seconds and
+        persisted in the `cache_dir` of the manager, if set. Names missing
+        from a cached index cause it to be rebuilt once.
+        """
         if utils.validate_uuid_string(endpoint):
             return endpoint
         else:
             return self._get_endpoint_id_for_name(endpoint)
 
+    def invalidate_name_index(self):
+        """ Drops the cached endpoint name index """
+        self._name_index.invalidate()
+
+    def _build_name_index(self):
+        """ Returns a dict mapping endpoint names to the list of IDs of the
+        endpoints with that name.
+        """
+        index = {}
+        for endpoint in self.list():
+            index.setdefault(endpoint.name, []).append(endpoint.id)
+        return index
+
     def _get_endpoint_id_for_name(self, endpoint_name):
-        obj_list = self.list()
-        id_matches = [n.id for n in obj_list if n.name == endpoint_name]
+        index = self._name_index.get_for([endpoint_name])
+        id_matches = index.get(endpoint_name, [])
         matches = len(id_matches)
         if matches == 1:
             return id_matches[0]
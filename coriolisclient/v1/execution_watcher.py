@@ -0,0 +1,219 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Push-based progress watching of transfer executions.
+
+Log records of the execution are received from the coriolis-logger
+websocket as they are emitted and are reported right away, so that
+progress is rendered from them rather than from polling the execution.
+The execution's status is checked every `reconcile_interval` seconds with
+the lightweight executions listing, and the execution is only fetched in
+full when that status changed, or at least every `full_reconcile_interval`
+seconds to report the task statuses and progress updates since the
+previous fetch.
+"""
+
+import asyncio
+import collections
+import functools
+import logging
+
+from coriolisclient import base
+from coriolisclient import constants
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_RECONCILE_INTERVAL = 10
+DEFAULT_FULL_RECONCILE_INTERVAL = 60
+DEFAULT_LOG_QUEUE_SIZE = 1000
+
+EVENT_EXECUTION_STATUS = "execution_status"
+EVENT_TASK_STATUS = "task_status"
+EVENT_PROGRESS_UPDATE = "progress_update"
+EVENT_LOG = "log"
+
+WatchEvent = collections.namedtuple(
+    "WatchEvent", ["type", "task", "data"])
+WatchEvent.__doc__ = """Change observed while watching an execution.
+
+`task` is the dict of the task the event relates to, if any, and `data` is
+the new execution status, task status, progress update dict or log record,
+depending on the event type.
+"""
+
+
+def _get_progress_update_key(progress_update):
+    if progress_update.get("id") is not None:
+        return progress_update["id"]
+    return (progress_update.get("index"), progress_update.get("created_at"))
+
+
+class _ExecutionState(object):
+    """Keeps track of the last seen state of an execution, so that only
+    what changed in newer versions of it is reported.
+    """
+
+    def __init__(self):
+        self.status = None
+        self.task_ids = set()
+        self._task_statuses = {}
+        self._progress_updates = {}
+
+    def update(self, execution):
+        """Returns the list of `WatchEvent`s since the previous version."""
+        info = execution.to_dict()
+        events = []
+        for task in info.get("tasks") or []:
+            task_id = task.get("id")
+            self.task_ids.add(task_id)
+            if self._task_statuses.get(task_id) != task.get("status"):
+                self._task_statuses[task_id] = task.get("status")
+                events.append(WatchEvent(
+                    EVENT_TASK_STATUS, task, task.get("status")))
+
+            progress_updates = sorted(
+                task.get("progress_updates") or [],
+                key=lambda p: (p.get("index", 0), p.get("created_at") or ""))
+            for progress_update in progress_updates:
+                key = (task_id, _get_progress_update_key(progress_update))
+                if self._progress_updates.get(key) != progress_update:
+                    self._progress_updates[key] = progress_update
+                    events.append(WatchEvent(
+                        EVENT_PROGRESS_UPDATE, task, progress_update))
+
+        status = info.get("status")
+        if status != self.status:
+            self.status = status
+            events.append(WatchEvent(EVENT_EXECUTION_STATUS, None, status))
+        return events
+
+
+class ExecutionWatcher(object):
+    """Watches a transfer execution until it reaches a final status.
+
+    :param executions_manager: `TransferExecutionManager` to fetch the
+        execution with
+    :param logging_client: `coriolisclient.v1.logging.LoggingClient` to
+        receive the log records from, or None to only poll the API
+    """
+
+    def __init__(self, executions_manager, logging_client, transfer,
+                 execution, reconcile_interval=DEFAULT_RECONCILE_INTERVAL,
+                 full_reconcile_interval=DEFAULT_FULL_RECONCILE_INTERVAL,
+                 terminal_states=None, app_name=None, severity=None):
+        self._executions = executions_manager
+        self._logging_client = logging_client
+        self._transfer_id = base.getid(transfer)
+        self._execution_id = base.getid(execution)
+        self._reconcile_interval = reconcile_interval
+        self._full_reconcile_interval = full_reconcile_interval
+        self._terminal_states = set(
+            terminal_states or constants.FINALIZED_EXECUTION_STATUSES)
+        self._app_name = app_name
+        self._severity = severity
+        self._state = _ExecutionState()
+
+    async def _call(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args))
+
+    async def _get_execution(self):
+        return await self._call(
+            self._executions.get, self._transfer_id, self._execution_id)
+
+    async def _get_status(self):
+        """Gets the execution's status without its tasks, or None if it
+        could not be found in the listing.
+        """
+        executions = await self._call(
+            self._executions.list, self._transfer_id)
+        for execution in executions:
+            if base.getid(execution) == self._execution_id:
+                return execution.to_dict().get("status")
+        return None
+
+    async def _receive_logs(self, queue):
+        try:
+            async for record in self._logging_client.iter_logs(
+                    app_name=self._app_name, severity=self._severity):
+                await queue.put(record)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            LOG.warning(
+                "Log stream unavailable, falling back to polling the "
+                "execution: %s", ex)
+
+    def _is_relevant(self, record):
+        message = str(record.get("message", ""))
+        ids = [self._execution_id] + list(self._state.task_ids)
+        return any(i and i in message for i in ids)
+
+    def _find_task(self, record):
+        message = str(record.get("message", ""))
+        for task_id in self._state.task_ids:
+            if task_id and task_id in message:
+                return {"id": task_id}
+        return None
+
+    async def watch(self):
+        """Asynchronously iterates over the `WatchEvent`s of the execution,
+        starting with its current state.
+        """
+        loop = asyncio.get_running_loop()
+        for event in self._state.update(await self._get_execution()):
+            yield event
+        if self._state.status in self._terminal_states:
+            return
+
+        queue = asyncio.Queue(maxsize=DEFAULT_LOG_QUEUE_SIZE)
+        receiver = None
+        if self._logging_client is not None:
+            receiver = asyncio.ensure_future(self._receive_logs(queue))
+        try:
+            last_full = last_check = loop.time()
+            while True:
+                deadline = last_check + self._reconcile_interval
+                now = loop.time()
+                if now < deadline:
+                    try:
+                        record = await asyncio.wait_for(
+                            queue.get(), deadline - now)
+                    except asyncio.TimeoutError:
+                        record = None
+                    if record is not None and self._is_relevant(record):
+                        yield WatchEvent(
+                            EVENT_LOG, self._find_task(record), record)
+                    continue
+
+                now = last_check = loop.time()
+                refresh = now - last_full >= self._full_reconcile_interval
+                if not refresh:
+                    refresh = await self._get_status() != self._state.status
+                if not refresh:
+                    continue
+
+                execution = await self._get_execution()
+                last_full = loop.time()
+                for event in self._state.update(execution):
+                    yield event
+                if self._state.status in self._terminal_states:
+                    return
+        finally:
+            if receiver is not None:
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
@@ -20,9 +20,11 @@ import requests
 
 from coriolisclient import base
 from coriolisclient import exceptions
+from coriolisclient.v1 import common
 
 LOG = logging.getLogger(__name__)
 _LICENSING_ENDPOINT_NAME = "coriolis-licensing"
+DEFAULT_POOL_SIZE = 10
 
 
 class Licence(base.Resource):
@@ -31,13 +33,26 @@ class Licence(base.Resource):
 
 class LicensingClient(object):
 
-    def __init__(self, client, endpoint_name_override=None):
+    def __init__(self, client, endpoint_name_override=None,
+                 pool_size=DEFAULT_POOL_SIZE):
         self._cli = client
         self._endpoint_name = _LICENSING_ENDPOINT_NAME
         if endpoint_name_override:
             self._endpoint_name = endpoint_name_override
+        self._pool_size = pool_size
+        self._endpoint_url = None
+        self._session = None
+
+    @property
+    def _http_session(self):
+        if self._session is None:
+            self._session = common.make_http_session(self._pool_size)
+        return self._session
 
     def _get_licensing_endpoint_url(self):
+        if self._endpoint_url is not None:
+            return self._endpoint_url
+
         endpoint_url = None
         try:
             endpoint_url = self._cli.get_endpoint(
@@ -45,11 +60,15 @@ class LicensingClient(object):
         except Exception as ex:
             LOG.warning("Unable to determine licensing endpoint: %s", str(ex))
             raise exceptions.LicensingEndpointNotFound(self._endpoint_name)
-        return endpoint_url.rstrip('/')
+        self._endpoint_url = endpoint_url.rstrip('/')
+        return self._endpoint_url
+
+    def _invalidate_licensing_endpoint_url(self):
+        self._endpoint_url = None
 
     def _do_req(self, method_name, resource, body=None, response_key=None,
                 raw_response=False):
-        method = getattr(requests, method_name.lower(), None)
+        method = getattr(self._http_session, method_name.lower(), None)
         if not method:
             raise ValueError("No such HTTP method '%s'" % method_name)
 
@@ -62,7 +81,13 @@ class LicensingClient(object):
                 body = json.dumps(body)
             kwargs["data"] = body
 
-        resp = method(url, **kwargs)
+        try:
+            resp = method(url, **kwargs)
+        except requests.exceptions.ConnectionError:
+            # NOTE: the licensing endpoint may have been moved, so have the
+            # next request look it up in the service catalog again:
+            self._invalidate_licensing_endpoint_url()
+            raise
 
         if not resp.ok:
             # try to extract error from licensing server:
@@ -114,9 +139,10 @@ class LicensingClient(object):
 class LicensingManager(base.BaseManager):
     resource_class = Licence
 
-    def __init__(self, api):
+    def __init__(self, api, licensing_client=None):
         super(LicensingManager, self).__init__(api)
-        self._licensing_cli = LicensingClient(api)
+        self._licensing_cli = (
+            licensing_client or LicensingClient(api))
 
     def status(self, appliance_id):
         url = '/appliances/%s/status' % appliance_id
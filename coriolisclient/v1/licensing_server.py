@@ -24,9 +24,10 @@ class Server(base.Resource):
 class LicensingServerManager(base.BaseManager):
     resource_class = Server
 
-    def __init__(self, api):
+    def __init__(self, api, licensing_client=None):
         super().__init__(api)
-        self._licensing_cli = licensing.LicensingClient(api)
+        self._licensing_cli = (
+            licensing_client or licensing.LicensingClient(api))
 
     def status(self):
         data = self._licensing_cli.get(
@@ -14,14 +14,22 @@
 # limitations under the License.
 
 import asyncio
+import collections
+from concurrent import futures
 import datetime
+import gzip
 import json
 import logging
+import os
 import ssl
 import traceback
 
-import requests
 import websockets
+from websockets import exceptions as websockets_exceptions
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 from keystoneauth1.exceptions import catalog
 from keystoneauth1.exceptions import http
@@ -29,18 +37,148 @@ from six.moves.urllib import parse as urlparse
 
 from coriolisclient import base
 from coriolisclient import exceptions
+from coriolisclient.v1 import common
 
 
 LOG = logging.getLogger(__name__)
 _LOGGING_ENDPOINT_NAME = "coriolis-logger"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_FORMATS = (COMPRESSION_GZIP, COMPRESSION_ZSTD)
+_COMPRESSION_EXTENSIONS = {
+    None: ".log",
+    COMPRESSION_GZIP: ".log.gz",
+    COMPRESSION_ZSTD: ".log.zst",
+}
+
+
+DEFAULT_STREAM_QUEUE_SIZE = 10000
+DEFAULT_RECONNECT_BACKOFF = 1
+DEFAULT_MAX_RECONNECT_BACKOFF = 30
+
+DROP_OLDEST = "drop-oldest"
+DROP_NEWEST = "drop-newest"
+COALESCE = "coalesce"
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+class LogStreamStats(object):
+    """Counters of a log stream.
+
+    :ivar received: number of log records received from the server
+    :ivar dropped: number of records discarded because the buffer was full
+    :ivar coalesced: number of records merged into the previous one
+    :ivar reconnects: number of times the stream was re-established
+    """
+
+    def __init__(self):
+        self.received = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.reconnects = 0
+
+    def __repr__(self):
+        return (
+            "<LogStreamStats received=%d dropped=%d coalesced=%d "
+            "reconnects=%d>" % (
+                self.received, self.dropped, self.coalesced,
+                self.reconnects))
+
+
+class _LogRecordBuffer(object):
+    """Bounded buffer decoupling the reception of log records from their
+    consumption.
+
+    When full, either the oldest or the newest record is dropped. The
+    coalesce policy additionally merges a record repeating the last
+    buffered one into it, counting the repetitions in its 'repeated' field.
+    """
+
+    def __init__(self, maxsize, policy, stats):
+        if policy not in DROP_POLICIES:
+            raise exceptions.CoriolisException(
+                "Invalid drop policy '%s'. Supported policies are: %s" % (
+                    policy, ", ".join(DROP_POLICIES)))
+        self._maxsize = maxsize
+        self._policy = policy
+        self._stats = stats
+        self._records = collections.deque()
+        self._available = asyncio.Event()
+        self._error = None
+
+    def put(self, record):
+        self._stats.received += 1
+        if self._policy == COALESCE and self._records:
+            last = self._records[-1]
+            if (last.get("app_name") == record.get("app_name") and
+                    last.get("message") == record.get("message")):
+                last["repeated"] = last.get("repeated", 1) + 1
+                self._stats.coalesced += 1
+                return
+
+        if len(self._records) >= self._maxsize:
+            self._stats.dropped += 1
+            if self._policy == DROP_NEWEST:
+                return
+            self._records.popleft()
+        self._records.append(record)
+        self._available.set()
+
+    def set_error(self, error):
+        self._error = error
+        self._available.set()
+
+    async def get_batch(self):
+        """Returns all the buffered records, waiting for at least one."""
+        while not self._records:
+            if self._error is not None:
+                raise self._error
+            self._available.clear()
+            await self._available.wait()
+        batch = list(self._records)
+        self._records.clear()
+        return batch
+
+
+def _check_compression(compression):
+    if compression is None:
+        return
+    if compression not in COMPRESSION_FORMATS:
+        raise exceptions.CoriolisException(
+            "Invalid compression format '%s'. Supported formats are: %s" % (
+                compression, ", ".join(COMPRESSION_FORMATS)))
+    if compression == COMPRESSION_ZSTD and zstandard is None:
+        raise exceptions.CoriolisException(
+            "The 'zstandard' package is required for '%s' compression" % (
+                compression))
+
+
+def _open_log_file(path, mode, compression=None):
+    """Opens the given file for writing, compressing the data written
+    to it on the fly if requested.
+    """
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, mode)
+    if compression == COMPRESSION_ZSTD:
+        return zstandard.ZstdCompressor().stream_writer(
+            open(path, mode), closefd=True)
+    return open(path, mode)
 
 
 class LoggingClient(object):
 
-    def __init__(self, client, endpoint_name_override=None):
+    def __init__(self, client, endpoint_name_override=None,
+                 pool_size=DEFAULT_POOL_SIZE):
         self._cli = client
         self._ep_name = endpoint_name_override or _LOGGING_ENDPOINT_NAME
         self._ep_url = None
+        self._pool_size = pool_size
+        self._session = None
+        self._cached_token = None
         try:
             self._ep_url = self._get_endpoint_url(self._ep_name)
         except Exception as ex:
@@ -49,7 +187,38 @@ class LoggingClient(object):
 
     @property
     def _token(self):
-        return self._cli.get_token()
+        if self._cached_token is None:
+            self._cached_token = self._cli.get_token()
+        return self._cached_token
+
+    def _invalidate_token(self):
+        self._cached_token = None
+        self._cli.invalidate()
+
+    @property
+    def _http_session(self):
+        if self._session is None:
+            self._session = common.make_http_session(self._pool_size)
+        return self._session
+
+    def _request(self, method, url, **kwargs):
+        """Sends an authenticated request to the logging endpoint.
+
+        The cached token is only refreshed if the request is rejected
+        as unauthorized, in which case the request is retried once.
+        """
+        kwargs.setdefault("verify", self._cli.verify)
+        extra_headers = kwargs.pop("headers", None) or {}
+        resp = self._http_session.request(
+            method, url, headers=dict(self._auth_headers, **extra_headers),
+            **kwargs)
+        if resp.status_code == 401:
+            resp.close()
+            self._invalidate_token()
+            resp = self._http_session.request(
+                method, url,
+                headers=dict(self._auth_headers, **extra_headers), **kwargs)
+        return resp
 
     def _get_endpoint_url(self, name):
         try:
@@ -94,13 +263,7 @@ class LoggingClient(object):
             url = newURL.geturl()
         return url
 
-    def stream_logs(self, app_name=None, severity=None):
-        headers = self._auth_headers
-        args = {
-            "app_name": app_name,
-            "severity": severity,
-        }
-        url = self._construct_url("ws", args, is_websocket=True)
+    def _get_ssl_context(self):
         if self._cli.verify:
             cafile = None
             if isinstance(self._cli.verify, str):
@@ -109,25 +272,161 @@ class LoggingClient(object):
         else:
             ssl_context = ssl.SSLContext()
             ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+
+    def _connect_websocket(self, url, ssl_context):
+        return websockets.connect(
+            url, extra_headers=self._auth_headers, ssl=ssl_context)
+
+    async def _receive_logs(self, url, buffer, stats, max_reconnects,
+                            backoff, max_backoff):
+        """Receives log records into the given buffer, reconnecting to the
+        logging endpoint with exponential backoff whenever the connection
+        is lost. Any other error ends the reception.
+        """
+        ssl_context = self._get_ssl_context()
+        attempts = 0
+        while True:
+            try:
+                async with self._connect_websocket(url, ssl_context) as ws:
+                    async for msg in ws:
+                        # NOTE: only reset once the server actually sends
+                        # something, so that a server accepting connections
+                        # just to close them still uses up the attempts:
+                        attempts = 0
+                        buffer.put(json.loads(msg))
+                LOG.debug("Log stream closed by the server.")
+            except websockets_exceptions.InvalidHandshake as ex:
+                status_code = getattr(ex, "status_code", None) or getattr(
+                    getattr(ex, "response", None), "status_code", None)
+                if status_code != 401:
+                    raise
+                LOG.debug("Log stream unauthorized, refreshing token.")
+                self._invalidate_token()
+            except (OSError, asyncio.TimeoutError,
+                    websockets_exceptions.ConnectionClosed) as ex:
+                LOG.debug("Log stream disconnected: %s", ex)
+
+            if max_reconnects is not None and attempts >= max_reconnects:
+                raise exceptions.CoriolisException(
+                    "Log stream disconnected after %d reconnection "
+                    "attempts" % attempts)
+            delay = min(backoff * 2 ** attempts, max_backoff)
+            attempts += 1
+            stats.reconnects += 1
+            LOG.debug("Reconnecting log stream in %s seconds.", delay)
+            await asyncio.sleep(delay)
+
+    async def _stream_log_batches(self, app_name=None, severity=None,
+                                  queue_size=DEFAULT_STREAM_QUEUE_SIZE,
+                                  drop_policy=DROP_OLDEST,
+                                  max_reconnects=None,
+                                  backoff=DEFAULT_RECONNECT_BACKOFF,
+                                  max_backoff=DEFAULT_MAX_RECONNECT_BACKOFF,
+                                  stats=None):
+        if stats is None:
+            stats = LogStreamStats()
+        buffer = _LogRecordBuffer(queue_size, drop_policy, stats)
+        args = {
+            "app_name": app_name,
+            "severity": severity,
+        }
+        url = self._construct_url("ws", args, is_websocket=True)
+        receiver = asyncio.ensure_future(self._receive_logs(
+            url, buffer, stats, max_reconnects, backoff, max_backoff))
+
+        def _on_receiver_done(task):
+            if not task.cancelled() and task.exception() is not None:
+                buffer.set_error(task.exception())
+        receiver.add_done_callback(_on_receiver_done)
+        try:
+            while True:
+                yield await buffer.get_batch()
+        finally:
+            receiver.cancel()
+            await asyncio.gather(receiver, return_exceptions=True)
+
+    async def iter_logs(self, app_name=None, severity=None,
+                        queue_size=DEFAULT_STREAM_QUEUE_SIZE,
+                        drop_policy=DROP_OLDEST, max_reconnects=None,
+                        backoff=DEFAULT_RECONNECT_BACKOFF,
+                        max_backoff=DEFAULT_MAX_RECONNECT_BACKOFF,
+                        stats=None):
+        """Asynchronously iterates over the parsed records of the log stream.
+
+        Records are received in the background into a buffer of at most
+        `queue_size` records, which are dropped according to `drop_policy`
+        when the consumer falls behind. The stream is re-established after
+        disconnects, waiting `backoff` seconds (doubled for every
+        consecutive failure, up to `max_backoff`) in between attempts.
+
+        :param max_reconnects: number of consecutive failed reconnection
+            attempts after which a `CoriolisException` is raised, or None
+            to retry indefinitely
+        :param stats: optional `LogStreamStats` instance to keep counts in
+        """
+        batches = self._stream_log_batches(
+            app_name=app_name, severity=severity, queue_size=queue_size,
+            drop_policy=drop_policy, max_reconnects=max_reconnects,
+            backoff=backoff, max_backoff=max_backoff, stats=stats)
+        try:
+            async for batch in batches:
+                for record in batch:
+                    yield record
+        finally:
+            await batches.aclose()
+
+    @staticmethod
+    def _format_log_records(records, app_name=None):
+        lines = []
+        for record in records:
+            message = record["message"]
+            if record.get("repeated"):
+                message = "%s (repeated %d times)" % (
+                    message, record["repeated"])
+            if app_name is None:
+                app = "\033[2m\033[1m%s\x1b[0m" % record["app_name"]
+                spacing = " " * (max((22 - len(record["app_name"]), 1)))
+                lines.append("%s>>%s%s" % (app, spacing, message))
+            else:
+                lines.append(message)
+        return "\n".join(lines)
+
+    def stream_logs(self, app_name=None, severity=None,
+                    queue_size=DEFAULT_STREAM_QUEUE_SIZE,
+                    drop_policy=DROP_OLDEST, max_reconnects=None):
+        """Prints the log stream until interrupted.
+
+        Records are printed in batches from a worker thread, so that slow
+        output does not hold up the reception of new records.
+        """
+        stats = LogStreamStats()
 
         async def nested():
-            async with websockets.connect(
-                    url, extra_headers=headers, ssl=ssl_context) as ws:
-                while True:
-                    msg = await ws.recv()
-                    as_dict = json.loads(msg)
-                    if app_name is None:
-                        app = "\033[2m\033[1m%s\x1b[0m" % as_dict["app_name"]
-                        spacing = (" " *
-                                   (max((22 - len(as_dict["app_name"]), 1))))
-                        print("%s>>%s%s" % (app, spacing, as_dict["message"]))
-                    else:
-                        print(as_dict["message"])
+            loop = asyncio.get_running_loop()
+            batches = self._stream_log_batches(
+                app_name=app_name, severity=severity, queue_size=queue_size,
+                drop_policy=drop_policy, max_reconnects=max_reconnects,
+                stats=stats)
+            try:
+                async for batch in batches:
+                    await loop.run_in_executor(
+                        None, print,
+                        self._format_log_records(batch, app_name=app_name))
+            finally:
+                await batches.aclose()
 
         try:
-            asyncio.get_event_loop().run_until_complete(nested())
+            asyncio.run(nested())
         except KeyboardInterrupt:
             pass
+        finally:
+            if stats.dropped:
+                LOG.warning(
+                    "%d out of %d log records were dropped as they could "
+                    "not be output fast enough.",
+                    stats.dropped, stats.received)
+        return stats
 
     def _convert_period_to_timestamp(self, period):
         if period is None:
@@ -161,30 +460,123 @@ class LoggingClient(object):
         tm = datetime.datetime.utcnow() - datetime.timedelta(**args)
         return int(tm.timestamp())
 
-    def download_logs(self, app, to, start_time=None, end_time=None):
+    def download_logs(self, app, to, start_time=None, end_time=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, resume=False,
+                      compression=None):
+        """Downloads the log of the given app to the file at `to`.
+
+        :param chunk_size: size in bytes of the chunks read and written
+        :param resume: continue a previous, partial download of the same log
+            into `to` by requesting only the remaining bytes. The download
+            restarts from scratch if the server does not support ranges.
+            NOTE: the time window must be the same as the one of the partial
+            download, so relative periods (e.g. '1h') should not be used.
+        :param compression: one of `COMPRESSION_FORMATS` to compress the log
+            into while it is being written. gzip-encoded responses are
+            written as they are received when gzip compression is requested.
+        """
         if app == "":
             raise exceptions.CoriolisException("missing app_name")
+        _check_compression(compression)
+        if resume and compression:
+            raise exceptions.CoriolisException(
+                "Resuming compressed log downloads is not supported")
 
-        headers = self._auth_headers
         args = {
             "start_date": self._convert_period_to_timestamp(start_time),
             "end_date": self._convert_period_to_timestamp(end_time),
         }
         resource = "logs/%s/" % app
         url = self._construct_url(resource, args)
-        verify = self._cli.verify
-        with requests.get(
-                url, headers=headers, stream=True, verify=verify) as r:
+
+        headers = {}
+        offset = 0
+        if resume and os.path.exists(to):
+            offset = os.path.getsize(to)
+        if offset:
+            headers["Range"] = "bytes=%d-" % offset
+        if compression:
+            headers["Accept-Encoding"] = "gzip"
+
+        with self._request("GET", url, headers=headers, stream=True) as r:
+            if offset and r.status_code == 416:
+                LOG.debug("Log '%s' already fully downloaded to '%s'.",
+                          app, to)
+                return
             r.raise_for_status()
-            with open(to, 'wb') as fd:
-                for chunk in r.iter_content(chunk_size=8192):
+            mode = 'wb'
+            if offset and r.status_code == 206:
+                mode = 'ab'
+            elif offset:
+                LOG.warning(
+                    "Server does not support resuming the download of log "
+                    "'%s', restarting it.", app)
+
+            chunks, compressed = common.get_response_chunks(
+                r, chunk_size, keep_gzip=compression == COMPRESSION_GZIP)
+            if compressed:
+                compression = None
+            with _open_log_file(to, mode, compression=compression) as fd:
+                for chunk in chunks:
                     if chunk:
                         fd.write(chunk)
 
+    def download_all_logs(self, to_dir, start_time=None, end_time=None,
+                          concurrency=DEFAULT_DOWNLOAD_CONCURRENCY,
+                          chunk_size=DEFAULT_CHUNK_SIZE, resume=False,
+                          compression=None):
+        """Downloads the logs of all apps into the given directory.
+
+        Logs are downloaded in parallel, all of them for the same time window.
+        Compressed logs are written with the extension of their format.
+
+        :returns: dict mapping the name of each log to the path it was
+            written to
+        """
+        _check_compression(compression)
+        # NOTE: convert relative periods only once so that the logs of all
+        # apps cover the exact same time window:
+        start_time = self._convert_period_to_timestamp(start_time)
+        end_time = self._convert_period_to_timestamp(end_time)
+
+        os.makedirs(to_dir, exist_ok=True)
+        extension = _COMPRESSION_EXTENSIONS[compression]
+        paths = {
+            log["log_name"]: os.path.join(
+                to_dir, "%s%s" % (log["log_name"], extension))
+            for log in self.list_logs()}
+        if not paths:
+            return paths
+
+        errors = {}
+        with futures.ThreadPoolExecutor(
+                max_workers=min(concurrency, len(paths))) as executor:
+            downloads = {
+                executor.submit(
+                    self.download_logs, log_name, path,
+                    start_time=start_time, end_time=end_time,
+                    chunk_size=chunk_size, resume=resume,
+                    compression=compression): log_name
+                for (log_name, path) in paths.items()}
+            for download in futures.as_completed(downloads):
+                log_name = downloads[download]
+                try:
+                    download.result()
+                except Exception as ex:
+                    LOG.debug(
+                        "Failed to download log '%s': %s", log_name, ex)
+                    errors[log_name] = ex
+
+        if errors:
+            raise exceptions.CoriolisException(
+                "Failed to download the following logs: %s" % ", ".join(
+                    "%s (%s)" % (log_name, errors[log_name])
+                    for log_name in sorted(errors)))
+        return paths
+
     def list_logs(self):
-        headers = self._auth_headers
         url = self._construct_url("logs/")
-        req = requests.get(url, headers=headers, verify=self._cli.verify)
+        req = self._request("GET", url)
         req.raise_for_status()
         ret = req.json()
         return ret.get("logs", [])
@@ -209,10 +601,32 @@ class CoriolisLogDownloadManager(base.BaseManager):
                 self.resource_class(self, i, loaded=True))
         return res
 
-    def get(self, app, to, start_time=None, end_time=None):
+    def get(self, app, to, start_time=None, end_time=None,
+            chunk_size=DEFAULT_CHUNK_SIZE, resume=False, compression=None):
         return self._coriolis_cli.download_logs(
-            app, to, start_time=start_time, end_time=end_time)
-
-    def stream(self, app_name=None, severity=None):
-        self._coriolis_cli.stream_logs(
-            app_name=app_name, severity=severity)
+            app, to, start_time=start_time, end_time=end_time,
+            chunk_size=chunk_size, resume=resume, compression=compression)
+
+    def download_all(self, to_dir, start_time=None, end_time=None,
+                     concurrency=DEFAULT_DOWNLOAD_CONCURRENCY,
+                     chunk_size=DEFAULT_CHUNK_SIZE, resume=False,
+                     compression=None):
+        return self._coriolis_cli.download_all_logs(
+            to_dir, start_time=start_time, end_time=end_time,
+            concurrency=concurrency, chunk_size=chunk_size, resume=resume,
+            compression=compression)
+
+    def stream(self, app_name=None, severity=None,
+               queue_size=DEFAULT_STREAM_QUEUE_SIZE, drop_policy=DROP_OLDEST,
+               max_reconnects=None):
+        return self._coriolis_cli.stream_logs(
+            app_name=app_name, severity=severity, queue_size=queue_size,
+            drop_policy=drop_policy, max_reconnects=max_reconnects)
+
+    def iter_logs(self, app_name=None, severity=None, **kwargs):
+        """Returns an async generator of the parsed log stream records.
+
+        See `LoggingClient.iter_logs` for the accepted arguments.
+        """
+        return self._coriolis_cli.iter_logs(
+            app_name=app_name, severity=severity, **kwargs)
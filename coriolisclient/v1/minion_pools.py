@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient.v1 import validation
 
 
 class MinionPool(base.Resource):
@@ -22,6 +23,8 @@ class MinionPool(base.Resource):
 
 class MinionPoolManager(base.BaseManager):
     resource_class = MinionPool
+    # NOTE: `validation.SchemaValidator` used by `create(validate=True)`:
+    schema_validator = None
 
     def __init__(self, api):
         super(MinionPoolManager, self).__init__(api)
@@ -39,7 +42,10 @@ class MinionPoolManager(base.BaseManager):
             environment_options,
             minimum_minions=None, maximum_minions=None,
             minion_max_idle_time=None, minion_retention_strategy=None,
-            notes=None, skip_allocation=False):
+            notes=None, skip_allocation=False, validate=False):
+        if validate:
+            validation.get_validator_for_manager(self).validate_minion_pool(
+                endpoint, platform, environment_options)
         data = {
             "name": name,
             "platform": platform,
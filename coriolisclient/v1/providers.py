@@ -13,7 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import time
+
 from coriolisclient import base
+from coriolisclient import cache
+
+
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CACHE_MAXSIZE = 64
+_CACHE_NAME = "providers"
 
 
 class Providers(base.Resource):
@@ -36,13 +45,71 @@ class Providers(base.Resource):
 
 class ProvidersManager(base.BaseManager):
     resource_class = Providers
+    # NOTE: seconds for which provider data is served from the cache before
+    # being revalidated with the API, see `_get_cached`:
+    cache_ttl = DEFAULT_CACHE_TTL
 
     def __init__(self, api):
         super(ProvidersManager, self).__init__(api)
+        # NOTE: may be replaced with any object providing the same get/set/
+        # invalidate methods as `cache.TTLCache`:
+        self.response_cache = cache.TTLCache(
+            ttl=None, maxsize=DEFAULT_CACHE_MAXSIZE)
 
-    def list(self):
-        return self._get('/providers', 'providers')
+    def list(self, refresh=False):
+        return self._get_cached('/providers', 'providers', refresh=refresh)
 
-    def schemas_list(self, provider_name, provider_type):
+    def schemas_list(self, provider_name, provider_type, refresh=False):
         url = '/providers/%s/schemas/%s' % (provider_name, provider_type)
-        return self._get(url, 'schemas')
+        return self._get_cached(url, 'schemas', refresh=refresh)
+
+    def invalidate_cache(self):
+        """ Drops all cached provider data """
+        self.response_cache.invalidate()
+        file_cache = self._get_file_cache(_CACHE_NAME, ttl=None)
+        if file_cache is not None:
+            file_cache.invalidate()
+
+    @base.wrap_unauthorized_exception
+    def _get_cached(self, url, response_key, refresh=False):
+        """ Gets the given provider data, caching it along with its ETag.
+
+        Cached data is returned for `cache_ttl` seconds, after which (or
+        when refreshing) it is revalidated with an If-None-Match request,
+        so that unchanged data is not downloaded again. Data is also cached
+        in the `cache_dir` of the manager, if set.
+        """
+        file_cache = self._get_file_cache(_CACHE_NAME, ttl=None)
+        file_key = None
+        if file_cache is not None:
+            scope = self._get_cache_scope()
+            if scope:
+                file_key = cache.make_key(scope, url)
+
+        entry = self.response_cache.get(url)
+        if entry is None and file_key:
+            entry = file_cache.get(file_key)
+        if (entry is not None and not refresh and
+                time.time() - entry["cached_at"] < self.cache_ttl):
+            return self._make_resource(
+                self.resource_class, copy.deepcopy(entry["body"]),
+                loaded=True)
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        resp = self.client.get(url, headers=headers)
+        if entry is not None and resp.status_code == 304:
+            entry = dict(entry, cached_at=time.time())
+        else:
+            body = resp.json()
+            entry = {
+                "etag": resp.headers.get("ETag"),
+                "body": body[response_key],
+                "cached_at": time.time()}
+
+        self.response_cache.set(url, entry)
+        if file_key:
+            file_cache.set(file_key, entry)
+        return self._make_resource(
+            self.resource_class, copy.deepcopy(entry["body"]), loaded=True)
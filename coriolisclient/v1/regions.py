@@ -14,17 +14,65 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient.v1 import common
+
+
+DEFAULT_INDEX_TTL = 60
 
 
 class Region(base.Resource):
     pass
 
 
+class _RegionIndex(object):
+    """ Indexes regions by both their ID and name. """
+
+    def __init__(self, regions):
+        self.by_id = {}
+        self.by_name = {}
+        for region in regions:
+            self.by_id.setdefault(region.id, []).append(region)
+            self.by_name.setdefault(region.name, []).append(region)
+
+    def __contains__(self, region_name_or_id):
+        return (
+            region_name_or_id in self.by_id or
+            region_name_or_id in self.by_name)
+
+    def lookup(self, region_name_or_id, raise_on_not_found=True):
+        id_matches = self.by_id.get(region_name_or_id)
+        if id_matches:
+            if len(id_matches) > 1:
+                raise ValueError(
+                    "Multiple matches for region ID '%s': %s" % (
+                        region_name_or_id, id_matches))
+            return id_matches[0]
+
+        name_matches = self.by_name.get(region_name_or_id)
+        if name_matches:
+            if len(name_matches) > 1:
+                raise ValueError(
+                    "No matches on ID but multiple matches on name for "
+                    "provided region identifier '%s': %s" % (
+                        region_name_or_id, name_matches))
+            return name_matches[0]
+
+        if raise_on_not_found:
+            raise ValueError(
+                "Could not find region with name or ID '%s'" % (
+                    region_name_or_id))
+
+
 class RegionManager(base.BaseManager):
     resource_class = Region
+    # NOTE: seconds for which regions are looked up from the index built
+    # out of a single listing, see `get_region_by_name_or_id`:
+    index_ttl = DEFAULT_INDEX_TTL
 
     def __init__(self, api):
         super(RegionManager, self).__init__(api)
+        self._index = common.ListingIndex(
+            lambda: _RegionIndex(self.list()), ttl=self.index_ttl)
 
     def list(self):
         return self._list('/regions', 'regions')
@@ -39,46 +87,54 @@ class RegionManager(base.BaseManager):
         if enabled is not None:
             data['enabled'] = enabled
 
-        return self._post('/regions', {'region': data}, 'region')
+        region = self._post('/regions', {'region': data}, 'region')
+        self.invalidate_index()
+        return region
 
     def update(self, region, updated_values):
         data = {
             "region": updated_values
         }
-        return self._put(
+        region = self._put(
             '/regions/%s' % base.getid(region), data, 'region')
+        self.invalidate_index()
+        return region
 
     def delete(self, region):
-        return self._delete('/regions/%s' % base.getid(region))
+        result = self._delete('/regions/%s' % base.getid(region))
+        self.invalidate_index()
+        return result
+
+    def invalidate_index(self):
+        """ Drops the cached region index """
+        self._index.invalidate()
 
     def get_region_by_name_or_id(
             self, region_name_or_id, regions_cache=None,
             raise_on_not_found=True):
-
-        if not regions_cache:
-            regions_cache = self.list()
-        id_matches = [
-            region for region in regions_cache
-            if region.id == region_name_or_id]
-        if id_matches:
-            if len(id_matches) > 1:
-                raise ValueError(
-                    "Multiple matches for region ID '%s': %s" % (
-                        region_name_or_id, id_matches))
-            return id_matches[0]
-
-        name_matches = [
-            region for region in regions_cache
-            if region.name == region_name_or_id]
-        if name_matches:
-            if len(name_matches) > 1:
-                raise ValueError(
-                    "No matches on ID but multiple matches on name for "
-                    "provided region identifier '%s': %s" % (
-                        region_name_or_id, name_matches))
-            return name_matches[0]
-
-        if raise_on_not_found:
-            raise ValueError(
-                "Could not find region with name or ID '%s'" % (
-                    region_name_or_id))
+        """ Looks up a region by its ID or, failing that, its name.
+
+        Unless a list of regions to look it up in is passed as
+        `regions_cache`, the lookup is done in an index of all regions,
+        which is reused for `index_ttl` seconds.
+        """
+        if regions_cache:
+            index = _RegionIndex(regions_cache)
+        else:
+            index = self._index.get_for([region_name_or_id])
+        return index.lookup(
+            region_name_or_id, raise_on_not_found=raise_on_not_found)
+
+    def get_regions_by_name_or_id(
+            self, regions_names_or_ids, raise_on_not_found=True):
+        """ Looks up several regions by their IDs or names at once.
+
+        :returns: list of the matching regions, in the same order, with
+            None for the ones which were not found when not raising
+        """
+        if not regions_names_or_ids:
+            return []
+        index = self._index.get_for(regions_names_or_ids)
+        return [
+            index.lookup(region, raise_on_not_found=raise_on_not_found)
+            for region in regions_names_or_ids]
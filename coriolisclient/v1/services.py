@@ -14,6 +14,10 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient.v1 import common
+
+
+DEFAULT_INDEX_TTL = 60
 
 
 class Service(base.Resource):
@@ -22,9 +26,14 @@ class Service(base.Resource):
 
 class ServiceManager(base.BaseManager):
     resource_class = Service
+    # NOTE: seconds for which services are looked up from the index built
+    # out of a single listing, see `find_services`:
+    index_ttl = DEFAULT_INDEX_TTL
 
     def __init__(self, api):
         super(ServiceManager, self).__init__(api)
+        self._index = common.ListingIndex(
+            self._build_index, ttl=self.index_ttl)
 
     def list(self):
         return self._list('/services', 'services')
@@ -41,30 +50,68 @@ class ServiceManager(base.BaseManager):
         if enabled is not None:
             data['enabled'] = enabled
 
-        return self._post('/services', {'service': data}, 'service')
+        service = self._post('/services', {'service': data}, 'service')
+        self.invalidate_index()
+        return service
 
     def update(self, service, updated_values):
         data = {
             "service": updated_values
         }
-        return self._put(
+        service = self._put(
             '/services/%s' % base.getid(service), data, 'service')
+        self.invalidate_index()
+        return service
 
     def delete(self, service):
-        return self._delete('/services/%s' % base.getid(service))
+        result = self._delete('/services/%s' % base.getid(service))
+        self.invalidate_index()
+        return result
+
+    def invalidate_index(self):
+        """ Drops the cached host/topic service index """
+        self._index.invalidate()
+
+    def _build_index(self):
+        """ Returns a dict mapping (host, topic) pairs to the list of
+        services registered for them.
+        """
+        index = {}
+        for svc in self.list():
+            index.setdefault((svc.host, svc.topic), []).append(svc)
+        return index
 
     def find_service_by_host_and_topic(self, host, topic):
-        services = self.list()
-        matches = [
-            svc for svc in services
-            if svc.host == host and svc.topic == topic]
-        if not matches:
-            raise ValueError(
-                "No Service with the host/topic %s/%s was found." % (
-                    host, topic))
-        if len(matches) > 1:
-            raise ValueError(
-                "Multiple services with the host/topic %s/%s were found: %s"
-                % (host, topic, matches))
-
-        return matches[0]
+        return self.find_services([(host, topic)])[0]
+
+    def find_services(self, pairs, raise_on_not_found=True):
+        """ Finds the services for each of the given (host, topic) pairs.
+
+        All pairs are looked up in an index of the services built out of a
+        single listing, which is reused for `index_ttl` seconds. Pairs
+        missing from a cached index cause it to be rebuilt once.
+
+        :returns: list of the matching services, in the same order, with
+            None for the ones which were not found when not raising
+        """
+        pairs = [tuple(pair) for pair in pairs]
+        if not pairs:
+            return []
+        index = self._index.get_for(pairs)
+
+        services = []
+        for (host, topic) in pairs:
+            matches = index.get((host, topic), [])
+            if not matches:
+                if raise_on_not_found:
+                    raise ValueError(
+                        "No Service with the host/topic %s/%s was found." % (
+                            host, topic))
+                services.append(None)
+                continue
+            if len(matches) > 1:
+                raise ValueError(
+                    "Multiple services with the host/topic %s/%s were "
+                    "found: %s" % (host, topic, matches))
+            services.append(matches[0])
+        return services
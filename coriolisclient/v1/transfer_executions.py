@@ -15,18 +15,31 @@
 
 from coriolisclient import base
 from coriolisclient.v1 import common
+from coriolisclient.v1 import execution_watcher
+from coriolisclient.v1 import logging as coriolis_logging
 
 
 class TransferExecution(base.Resource):
     _tasks = None
+    # NOTE: executions can only be fetched along with their transfer ID:
+    BATCH_LOADABLE = False
 
     @property
     def tasks(self):
         if self._info.get('tasks') is None:
-            self.manager.get(self._info.get("action_id"), self.id)
+            self._lazy_load('tasks')
         return [common.Task(None, d, loaded=True) for d in
                 self._info.get('tasks', [])]
 
+    def get(self):
+        self.set_loaded(True)
+        if not hasattr(self.manager, 'get'):
+            return
+
+        new = self.manager.get(self._info.get("action_id"), self.id)
+        if new:
+            self._add_details(new._info)
+
 
 class TransferExecutionManager(base.BaseManager):
     resource_class = TransferExecution
@@ -35,7 +48,7 @@ class TransferExecutionManager(base.BaseManager):
         super(TransferExecutionManager, self).__init__(api)
 
     def list(self, transfer, marker=None, limit=None,
-             sort_keys=None, sort_dirs=None, filters=None):
+             sort_keys=None, sort_dirs=None, filters=None, fields=None):
         # List of key-value tuples.
         query = []
         if marker is not None:
@@ -53,14 +66,14 @@ class TransferExecutionManager(base.BaseManager):
 
         return self._list(
             '/transfers/%s/executions' % base.getid(transfer), 'executions',
-            query=query)
+            query=query, fields=fields)
 
-    def get(self, transfer, execution):
+    def get(self, transfer, execution, fields=None):
         return self._get(
             '/transfers/%(transfer_id)s/executions/%(execution_id)s' %
             {"transfer_id": base.getid(transfer),
              "execution_id": base.getid(execution)},
-            'execution')
+            'execution', fields=fields)
 
     def create(self, transfer, shutdown_instances=False, auto_deploy=False):
         data = {"execution": {
@@ -82,3 +95,16 @@ class TransferExecutionManager(base.BaseManager):
             {"transfer_id": base.getid(transfer),
              "execution_id": base.getid(execution)},
             json={'cancel': {'force': force}})
+
+    def watch(self, transfer, execution, logs=True, **kwargs):
+        """Returns an async generator of the changes of the execution until
+        it finishes, see `execution_watcher.ExecutionWatcher`.
+
+        :param logs: whether to follow the execution's log records from the
+            logging endpoint, or to only poll the API
+        """
+        logging_client = None
+        if logs:
+            logging_client = coriolis_logging.LoggingClient(self.client)
+        return execution_watcher.ExecutionWatcher(
+            self, logging_client, transfer, execution, **kwargs).watch()
@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
+
 from coriolisclient import base
 from coriolisclient.v1 import common
 from coriolisclient.v1 import transfer_executions
+from coriolisclient.v1 import validation
 
 
 class Transfer(base.Resource):
@@ -36,19 +39,25 @@ class Transfer(base.Resource):
     @property
     def executions(self):
         if self._info.get('executions') is None:
-            self.get()
+            self._lazy_load('executions')
         return [common.TasksExecution(None, d, loaded=True) for d in
                 self._info.get('executions', [])]
 
 
 class TransferManager(base.BaseManager):
     resource_class = Transfer
+    # NOTE: `validation.SchemaValidator` used by `create(validate=True)`:
+    schema_validator = None
+    # NOTE: `TransferExecutionManager` used by `get_with_executions`, so that
+    # the executions it lists share the settings of the client:
+    executions_manager = None
 
     def __init__(self, api):
         super(TransferManager, self).__init__(api)
 
     def list(self, detail=False, marker=None, limit=None,
-             sort_keys=None, sort_dirs=None, filters=None):
+             sort_keys=None, sort_dirs=None, filters=None, stream=False,
+             fields=None):
         # List of key-value tuples.
         query = []
         if marker is not None:
@@ -67,13 +76,48 @@ class TransferManager(base.BaseManager):
         path = "/transfers"
         if detail:
             path = "%s/detail" % path
-        return self._list(path, 'transfers', query=query)
-
-    def get(self, transfer, include_task_info=False):
+        if stream:
+            return self._list(
+                path, 'transfers', query=query, stream=True, fields=fields)
+        return self._list(path, 'transfers', query=query, fields=fields)
+
+    def iter_all(self, detail=False, page_size=base.DEFAULT_PAGE_SIZE,
+                 sort_keys=None, sort_dirs=None, filters=None, fields=None):
+        """Lazily iterates over all transfers, one page at a time."""
+        return self._paginate(
+            self.list, page_size=page_size, detail=detail,
+            sort_keys=sort_keys, sort_dirs=sort_dirs, filters=filters,
+            fields=fields)
+
+    def get(self, transfer, include_task_info=False, fields=None):
         url = '/transfers/%s' % base.getid(transfer)
         if include_task_info:
             url += '?include_task_info=true'
-        return self._get(url, 'transfer')
+        return self._get(url, 'transfer', fields=fields)
+
+    def get_with_executions(self, transfer, include_task_info=False,
+                            executions_limit=None):
+        """Gets the transfer along with its latest executions, fetching both
+        concurrently.
+
+        The executions are listed newest first and replace the ones embedded
+        in the transfer, so that accessing `Transfer.executions` does not
+        require any further requests.
+        """
+        executions_manager = self.executions_manager
+        if executions_manager is None:
+            executions_manager = (
+                transfer_executions.TransferExecutionManager(self.client))
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executions = executor.submit(
+                executions_manager.list, transfer, limit=executions_limit,
+                sort_keys=["number"], sort_dirs=["desc"])
+            result = self.get(transfer, include_task_info=include_task_info)
+            executions = executions.result()
+        # NOTE: set on the info directly, as `executions` is a read-only
+        # property of the resource:
+        result._info["executions"] = [e.to_dict() for e in executions]
+        return result
 
     def create(self, origin_endpoint_id, destination_endpoint_id,
                source_environment, destination_environment, instances,
@@ -81,7 +125,17 @@ class TransferManager(base.BaseManager):
                network_map=None, notes=None, storage_mappings=None,
                origin_minion_pool_id=None, destination_minion_pool_id=None,
                instance_osmorphing_minion_pool_mappings=None,
-               user_scripts=None, clone_disks=True, skip_os_morphing=False):
+               user_scripts=None, clone_disks=True, skip_os_morphing=False,
+               validate=False):
+        """Creates a transfer.
+
+        :param validate: validate the source and destination environments
+            against the schemas of their providers before creating it
+        """
+        if validate:
+            validation.get_validator_for_manager(self).validate_transfer(
+                origin_endpoint_id, destination_endpoint_id,
+                source_environment, destination_environment)
         if not network_map:
             network_map = destination_environment.get('network_map', {})
         if not storage_mappings:
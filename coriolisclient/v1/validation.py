@@ -0,0 +1,187 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side validation of payloads against provider schemas.
+
+Requires the optional 'jsonschema' package.
+"""
+
+import logging
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+from coriolisclient import base
+from coriolisclient import cache
+from coriolisclient import exceptions
+from coriolisclient.v1 import endpoints
+from coriolisclient.v1 import providers
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_VALIDATORS = 64
+DEFAULT_ENDPOINT_TYPES_TTL = 300
+
+SCHEMA_TYPE_SOURCE_ENVIRONMENT = "source_environment"
+SCHEMA_TYPE_DESTINATION_ENVIRONMENT = "destination_environment"
+SCHEMA_TYPE_SOURCE_MINION_POOL = "source_minion_pool_environment"
+SCHEMA_TYPE_DESTINATION_MINION_POOL = "destination_minion_pool_environment"
+
+# NOTE: maps the schema types to the provider types they are listed under
+# and the key they are returned as:
+_SCHEMA_TYPES = {
+    SCHEMA_TYPE_SOURCE_ENVIRONMENT: (8, "source_environment_schema"),
+    SCHEMA_TYPE_DESTINATION_ENVIRONMENT: (
+        4, "destination_environment_schema"),
+    SCHEMA_TYPE_SOURCE_MINION_POOL: (
+        524288, "minion_pool_environment_schema"),
+    SCHEMA_TYPE_DESTINATION_MINION_POOL: (
+        1048576, "minion_pool_environment_schema"),
+}
+
+_MINION_POOL_SCHEMA_TYPES = {
+    "source": SCHEMA_TYPE_SOURCE_MINION_POOL,
+    "destination": SCHEMA_TYPE_DESTINATION_MINION_POOL,
+}
+
+
+def _format_error(error):
+    path = "/".join(str(item) for item in error.absolute_path)
+    return "%s: %s" % (path or "<root>", error.message)
+
+
+def get_validator_for_manager(manager):
+    """Returns the schema validator of the given manager, creating one
+    sharing its HTTP client if it has none yet.
+    """
+    if manager.schema_validator is None:
+        manager.schema_validator = SchemaValidator(
+            providers.ProvidersManager(manager.client),
+            endpoints.EndpointManager(manager.client))
+    return manager.schema_validator
+
+
+class SchemaValidator(object):
+    """Validates payloads against the schemas of their providers.
+
+    Schemas are fetched through the given `ProvidersManager` (and thus its
+    cache) and compiled only once per provider and schema type, after which
+    validating a payload requires no API calls.
+    """
+
+    def __init__(self, providers_manager, endpoints_manager=None,
+                 max_validators=DEFAULT_MAX_VALIDATORS):
+        self._providers = providers_manager
+        self._endpoints = endpoints_manager
+        self._validators = cache.TTLCache(ttl=None, maxsize=max_validators)
+        self._endpoint_types = cache.TTLCache(
+            ttl=DEFAULT_ENDPOINT_TYPES_TTL)
+
+    def get_validator(self, platform, schema_type):
+        """Returns the compiled validator for the given provider platform
+        (e.g. 'openstack') and schema type.
+        """
+        if jsonschema is None:
+            raise exceptions.CoriolisException(
+                "The 'jsonschema' package is required for validating "
+                "payloads against provider schemas")
+        if schema_type not in _SCHEMA_TYPES:
+            raise exceptions.CoriolisException(
+                "Invalid schema type '%s'. Supported types are: %s" % (
+                    schema_type, ", ".join(sorted(_SCHEMA_TYPES))))
+
+        key = (platform, schema_type)
+        validator = self._validators.get(key)
+        if validator is None:
+            (provider_type, schema_key) = _SCHEMA_TYPES[schema_type]
+            schemas = self._providers.schemas_list(
+                platform, provider_type).to_dict()
+            if schema_key in schemas:
+                schema = schemas[schema_key]
+            elif len(schemas) == 1:
+                schema = list(schemas.values())[0]
+            else:
+                raise exceptions.CoriolisException(
+                    "Could not find the %s schema of provider '%s'" % (
+                        schema_type, platform))
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+            self._validators.set(key, validator)
+        return validator
+
+    def get_errors(self, platform, schema_type, payload):
+        """Returns the list of validation errors of the given payload."""
+        validator = self.get_validator(platform, schema_type)
+        return sorted(
+            _format_error(error) for error in validator.iter_errors(payload))
+
+    def validate(self, platform, schema_type, payload):
+        """Raises `SchemaValidationFailed` if the payload is invalid."""
+        errors = self.get_errors(platform, schema_type, payload)
+        if errors:
+            raise exceptions.SchemaValidationFailed(schema_type, errors)
+
+    def validate_many(self, platform, schema_type, payloads):
+        """Validates many payloads against the same schema.
+
+        :returns: dict mapping the indexes of the invalid payloads to their
+            list of validation errors
+        """
+        validator = self.get_validator(platform, schema_type)
+        invalid = {}
+        for (i, payload) in enumerate(payloads):
+            errors = sorted(
+                _format_error(error)
+                for error in validator.iter_errors(payload))
+            if errors:
+                invalid[i] = errors
+        return invalid
+
+    def get_endpoint_type(self, endpoint):
+        """Returns the provider platform of the given endpoint."""
+        endpoint_id = base.getid(endpoint)
+        endpoint_type = self._endpoint_types.get(endpoint_id)
+        if endpoint_type is None:
+            if self._endpoints is None:
+                raise exceptions.CoriolisException(
+                    "Cannot determine the type of endpoint '%s'" % (
+                        endpoint_id))
+            endpoint_type = self._endpoints.get(endpoint_id).type
+            self._endpoint_types.set(endpoint_id, endpoint_type)
+        return endpoint_type
+
+    def validate_transfer(self, origin_endpoint, destination_endpoint,
+                          source_environment, destination_environment):
+        if source_environment:
+            self.validate(
+                self.get_endpoint_type(origin_endpoint),
+                SCHEMA_TYPE_SOURCE_ENVIRONMENT, source_environment)
+        self.validate(
+            self.get_endpoint_type(destination_endpoint),
+            SCHEMA_TYPE_DESTINATION_ENVIRONMENT, destination_environment)
+
+    def validate_minion_pool(self, endpoint, pool_platform,
+                             environment_options):
+        schema_type = _MINION_POOL_SCHEMA_TYPES.get(pool_platform)
+        if schema_type is None:
+            raise exceptions.CoriolisException(
+                "Invalid minion pool platform '%s'" % pool_platform)
+        self.validate(
+            self.get_endpoint_type(endpoint), schema_type,
+            environment_options)
@@ -0,0 +1,224 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for waiting on transfer executions and deployments."""
+
+import collections
+import logging
+import random
+import time
+
+from keystoneauth1 import exceptions as keystoneauth_exceptions
+
+from coriolisclient import base
+from coriolisclient import constants
+from coriolisclient import exceptions
+from coriolisclient.v1 import deployments
+from coriolisclient.v1 import transfer_executions
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MIN_POLL_INTERVAL = 2
+DEFAULT_MAX_POLL_INTERVAL = 30
+DEFAULT_POLL_BACKOFF = 1.5
+DEFAULT_POLL_JITTER = 0.2
+# NOTE: minimum number of deployments waited on for them to be polled
+# with a single listing instead of individually:
+DEFAULT_LIST_THRESHOLD = 2
+
+StatusTransition = collections.namedtuple(
+    "StatusTransition", ["resource", "previous_status", "status"])
+
+
+def get_status(resource):
+    """Returns the status of the given execution or deployment."""
+    if isinstance(resource, deployments.Deployment):
+        return resource._info.get("last_execution_status")
+    return resource._info.get("status")
+
+
+def _get_transfer_id(resource):
+    if isinstance(resource, transfer_executions.TransferExecution):
+        transfer_id = resource._info.get("action_id")
+        if not transfer_id:
+            raise exceptions.CoriolisException(
+                "Cannot wait on execution '%s' with no transfer ID" % (
+                    base.getid(resource)))
+        return transfer_id
+    if isinstance(resource, deployments.Deployment):
+        return None
+    raise exceptions.CoriolisException(
+        "Cannot wait on %s, only on transfer executions and "
+        "deployments" % type(resource).__name__)
+
+
+def _get_poll_manager(resource, managers):
+    """Returns the manager to poll the given resource through.
+
+    Executions bound to another manager (e.g. the ones returned by
+    `TransferManager.update`) are polled through a transfer executions
+    manager, as theirs cannot list or get them.
+    """
+    manager = resource.manager
+    if (not isinstance(resource, transfer_executions.TransferExecution) or
+            not isinstance(manager, base.BaseManager) or
+            isinstance(manager, transfer_executions.TransferExecutionManager)):
+        return manager
+    if manager not in managers:
+        executions_manager = getattr(manager, "executions_manager", None)
+        if executions_manager is None:
+            executions_manager = (
+                transfer_executions.TransferExecutionManager(manager.client))
+            executions_manager.compact_resources = manager.compact_resources
+            executions_manager.cache_dir = manager.cache_dir
+            executions_manager.lazy_load_policy = manager.lazy_load_policy
+            executions_manager.lazy_loads = manager.lazy_loads
+        managers[manager] = executions_manager
+    return managers[manager]
+
+
+def _get_one(manager, transfer_id, resource):
+    try:
+        if transfer_id is not None:
+            return manager.get(transfer_id, resource)
+        return manager.get(resource)
+    except keystoneauth_exceptions.http.NotFound:
+        LOG.debug("'%s' was deleted while being waited on",
+                  base.getid(resource))
+        return None
+
+
+def _poll(pending, list_threshold):
+    """Returns the latest version of the given resources (None for the
+    deleted ones), using as few requests as possible.
+
+    Executions are polled with a single listing per transfer, and
+    deployments with a single listing if there are at least
+    `list_threshold` of them. Resources missing from the listings (e.g.
+    as they are past its first page) are then fetched individually.
+    """
+    groups = collections.OrderedDict()
+    managers = {}
+    for (resource_id, resource) in pending.items():
+        key = (
+            _get_poll_manager(resource, managers),
+            _get_transfer_id(resource))
+        groups.setdefault(key, []).append((resource_id, resource))
+
+    latest = {}
+    for ((manager, transfer_id), group) in groups.items():
+        listed = {}
+        if transfer_id is not None:
+            listed = {base.getid(res): res for res in manager.list(
+                transfer_id)}
+        elif len(group) >= list_threshold:
+            listed = {base.getid(res): res for res in manager.list()}
+
+        for (resource_id, resource) in group:
+            current = listed.get(resource_id)
+            if current is None:
+                current = _get_one(manager, transfer_id, resource)
+            latest[resource_id] = current
+    return latest
+
+
+def wait_for(resources, terminal_states=None, timeout=None,
+             min_interval=DEFAULT_MIN_POLL_INTERVAL,
+             max_interval=DEFAULT_MAX_POLL_INTERVAL,
+             backoff=DEFAULT_POLL_BACKOFF, jitter=DEFAULT_POLL_JITTER,
+             list_threshold=DEFAULT_LIST_THRESHOLD):
+    """Waits for transfer executions and/or deployments to reach a terminal
+    state, yielding their status transitions as they are observed.
+
+    All resources are polled from a single loop, see `_poll`. The poll
+    interval starts at `min_interval` and grows by `backoff` up to
+    `max_interval` while no transitions are observed, going back to
+    `min_interval` after each one. Every interval is randomized by up to
+    `jitter` of its length so that concurrent waiters do not poll at once.
+
+    :param resources: the executions and/or deployments to wait on
+    :param terminal_states: statuses at which to stop waiting on a
+        resource, defaults to `constants.FINALIZED_EXECUTION_STATUSES`
+    :param timeout: seconds after which `exceptions.WaitTimeout` is raised
+        if resources are still pending, never if None
+    :returns: generator of `StatusTransition` tuples holding the latest
+        version of the resource. Deleted resources transition to None.
+    """
+    if terminal_states is None:
+        terminal_states = constants.FINALIZED_EXECUTION_STATUSES
+    terminal_states = set(terminal_states)
+
+    pending = collections.OrderedDict()
+    for resource in resources:
+        _get_transfer_id(resource)
+        pending[base.getid(resource)] = resource
+    statuses = {
+        resource_id: get_status(resource)
+        for (resource_id, resource) in pending.items()}
+
+    deadline = None
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+    interval = min_interval
+    while pending:
+        changed = False
+        for (resource_id, resource) in _poll(
+                pending, list_threshold).items():
+            previous_status = statuses[resource_id]
+            status = get_status(resource) if resource is not None else None
+            if resource is None or status != previous_status:
+                changed = True
+                statuses[resource_id] = status
+                yield StatusTransition(
+                    resource or pending[resource_id], previous_status,
+                    status)
+
+            if resource is None or status in terminal_states:
+                del pending[resource_id]
+            else:
+                pending[resource_id] = resource
+
+        if not pending:
+            break
+
+        if changed:
+            interval = min_interval
+        else:
+            interval = min(interval * backoff, max_interval)
+        delay = interval * random.uniform(1 - jitter, 1 + jitter)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise exceptions.WaitTimeout(
+                    [(resource_id, statuses[resource_id])
+                     for resource_id in pending])
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+
+def wait(resources, **kwargs):
+    """Waits for the given resources to reach a terminal state.
+
+    Accepts the same arguments as `wait_for`.
+
+    :returns: the latest version of each resource, in the given order
+    """
+    resources = list(resources)
+    latest = collections.OrderedDict(
+        (base.getid(resource), resource) for resource in resources)
+    for transition in wait_for(resources, **kwargs):
+        latest[base.getid(transition.resource)] = transition.resource
+    return list(latest.values())
@@ -7,6 +7,7 @@ from keystoneauth1.identity import v3
 from keystoneauth1 import session as ksession
 
 from coriolisclient import client as coriolis_client
+from coriolisclient.v1 import waiters
 
 
 CORIOLIS_CONNECTION_INFO = {
@@ -153,27 +154,18 @@ def get_errord_replicas(coriolis):
 
 
 def wait_for_replica_execution(coriolis, replica, execution,
-                               max_tries=600, retry_period=5):
+                               timeout=3000):
     """ Waits for a maximum amount of time for a given execution to finish.
 
     :param execution: Replica Execution object
-    :param max_tries: maximum number of state queries before giving up
-    :param retry_period: time to wait between retries
+    :param timeout: maximum number of seconds to wait for before giving up
     """
-    tries = 0
-
     execution = coriolis.transfer_executions.get(
         replica, execution)
-    while tries < max_tries and execution.status == "RUNNING":
-        print("Waiting on execution %s (currently %s)" % (
-            execution.id, execution.status))
-        time.sleep(retry_period)
-        execution = coriolis.transfer_executions.get(
-            replica, execution)
-
-        if execution.status == "ERROR":
-            break
-        tries = tries + 1
+    for transition in waiters.wait_for([execution], timeout=timeout):
+        print("Execution %s went from %s to %s" % (
+            execution.id, transition.previous_status, transition.status))
+        execution = transition.resource
 
     if execution.status != "COMPLETED":
         raise Exception(
@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Micro-benchmark comparing regular and compact Transfer resources.
+
+Usage: python tools/benchmark_resources.py [--count COUNT]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+
+from coriolisclient.v1 import transfers
+
+
+def _fake_transfer_info(index):
+    return {
+        "id": str(uuid.uuid4()),
+        "scenario": "replica",
+        "instances": ["instance-%d" % index],
+        "notes": "",
+        "origin_endpoint_id": str(uuid.uuid4()),
+        "destination_endpoint_id": str(uuid.uuid4()),
+        "origin_minion_pool_id": None,
+        "destination_minion_pool_id": None,
+        "instance_osmorphing_minion_pool_mappings": {},
+        "source_environment": {"location": "westus"},
+        "destination_environment": {
+            "network_map": {"net%d" % index: "dest-net"},
+            "storage_mappings": {"default": "standard"}},
+        "network_map": {"net%d" % index: "dest-net"},
+        "storage_mappings": {"default": "standard"},
+        "user_scripts": {"global": {}, "instances": {}},
+        "last_execution_status": "COMPLETED",
+        "reservation_id": str(uuid.uuid4()),
+        "clone_disks": True,
+        "skip_os_morphing": False,
+        "created_at": "2026-01-01T00:00:00.000000",
+        "updated_at": None,
+    }
+
+
+def _measure(infos, compact):
+    tracemalloc.start()
+    start = time.perf_counter()
+    objs = [transfers.Transfer(None, info, loaded=True, compact=compact)
+            for info in infos]
+    construct_time = time.perf_counter() - start
+
+    # NOTE: read attributes within the traced section, as doing so may
+    # allocate further per-instance storage:
+    start = time.perf_counter()
+    for obj in objs:
+        obj.id
+        obj.last_execution_status
+    getattr_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for obj in objs:
+        obj.to_dict()
+    to_dict_time = time.perf_counter() - start
+
+    return construct_time, getattr_time, peak, to_dict_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--mode', choices=['regular', 'compact'])
+    args = parser.parse_args()
+
+    if args.mode:
+        infos = [_fake_transfer_info(i) for i in range(args.count)]
+        construct_time, getattr_time, peak, to_dict_time = _measure(
+            infos, args.mode == 'compact')
+        print("%-10s %15.1f %15.1f %15.1f %15.1f" % (
+            args.mode, construct_time * 1000, getattr_time * 1000,
+            peak / 1024., to_dict_time * 1000))
+        return
+
+    # NOTE: each mode is measured in a fresh interpreter, as CPython
+    # pre-sizes the attribute storage of new instances based on the
+    # attributes previously set on instances of the same class:
+    print("%-10s %15s %15s %15s %15s" % (
+        "mode", "construct (ms)", "getattr (ms)", "memory (KiB)",
+        "to_dict (ms)"))
+    sys.stdout.flush()
+    for mode in ('regular', 'compact'):
+        subprocess.check_call([
+            sys.executable, __file__, '--count', str(args.count),
+            '--mode', mode])
+
+
+if __name__ == '__main__':
+    main()